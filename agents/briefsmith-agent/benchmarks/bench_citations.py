@@ -0,0 +1,77 @@
+"""Measure per-brief KTA citation latency for each citation engine.
+
+Run from the agent folder:
+
+    python benchmarks/bench_citations.py --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, Sequence
+
+from briefsmith_agent.citations import Bm25Engine, CitationIndex, np
+
+_VOCABULARY = [
+    "margin", "churn", "pricing", "retention", "cohort", "pipeline", "ebitda", "capex", "backlog", "renewal",
+    "supplier", "headcount", "integration", "diligence", "customer", "segment", "contract", "forecast",
+    "management", "interview", "board", "covenant", "inventory", "logistics", "platform", "migration",
+]
+
+
+def build_source_lines(size: int, seed: int = 3) -> list[str]:
+    """Build seeded transcript-like source lines, including long boilerplate."""
+    rng = random.Random(seed)
+    lines = []
+    for idx in range(size):
+        if idx % 50 == 0:
+            lines.append("Confidential draft prepared for the deal team " + " ".join(rng.sample(_VOCABULARY, 15)))
+            continue
+        words = rng.choices(_VOCABULARY, k=rng.randint(4, 12))
+        lines.append(f"Point {idx}: " + " ".join(words) + f" up {rng.randint(1, 40)}%")
+    return lines
+
+
+def time_brief(engine_factory: Callable[[CitationIndex], object], lines: list[str], ktas: list[str]) -> tuple[float, float]:
+    """Return index build seconds and lookup seconds for one brief."""
+    started = time.perf_counter()
+    index = CitationIndex(lines)
+    engine = engine_factory(index)
+    built = time.perf_counter()
+    for kta in ktas:
+        engine.best_line(kta)
+    return built - started, time.perf_counter() - built
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--ktas", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    engines: dict[str, Callable[[CitationIndex], object]] = {
+        "overlap": lambda index: index,
+        "bm25-python": lambda index: Bm25Engine(index, use_numpy=False),
+    }
+    if np is not None:
+        engines["bm25-numpy"] = lambda index: Bm25Engine(index, use_numpy=True)
+
+    print(f"{'lines':>10} {'engine':>12} {'index s':>9} {'lookup ms':>10} {'per KTA ms':>11}")
+    for size in args.sizes:
+        lines = build_source_lines(size)
+        rng = random.Random(size)
+        ktas = [" ".join(rng.sample(_VOCABULARY, 6)) for _ in range(args.ktas)]
+        for name, factory in engines.items():
+            build_s, lookup_s = time_brief(factory, lines, ktas)
+            print(
+                f"{size:>10} {name:>12} {build_s:>9.2f} {lookup_s * 1000:>10.1f} "
+                f"{lookup_s * 1000 / len(ktas):>11.2f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,59 @@
+"""Measure transcript line-cleaning throughput in lines per second.
+
+Run from the agent folder:
+
+    python benchmarks/bench_clean.py --lines 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Sequence
+
+from briefsmith_agent.parser import _clean_transcript_line
+
+_WORDS = ["margin", "churn", "pricing", "owner", "timeline", "EBITDA", "SMB", "cohort", "12%", "vs", "risk", "plan"]
+_FILLERS = ["um", "uh", "you know", "kind of", "like"]
+
+
+def build_transcript(lines: int, seed: int = 9) -> list[str]:
+    """Build a seeded mix of timestamped speaker turns, bullets, notes and metadata."""
+    rng = random.Random(seed)
+    output = []
+    for idx in range(lines):
+        body = " ".join(rng.choices(_WORDS, k=rng.randint(5, 16)))
+        roll = rng.random()
+        if roll < 0.35:
+            filler = f" {rng.choice(_FILLERS)} " if rng.random() < 0.4 else " "
+            output.append(f"[{idx % 12 + 1}:{idx % 60:02d} PM] Speaker {idx % 4 + 1}:{filler}{body}")
+        elif roll < 0.6:
+            output.append(f"- {body}")
+        elif roll < 0.65:
+            output.append("Recording started")
+        else:
+            output.append(body.capitalize())
+    return output
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print throughput."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    corpus = build_transcript(args.lines)
+    best = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        for line in corpus:
+            _clean_transcript_line(line)
+        best = min(best, time.perf_counter() - started)
+    print(f"{args.lines} lines in {best:.3f}s: {args.lines / best:,.0f} lines/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
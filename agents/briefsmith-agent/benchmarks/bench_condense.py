@@ -0,0 +1,57 @@
+"""Compare full-sort and heap top-K selection for section ranking.
+
+Run from the agent folder:
+
+    python benchmarks/bench_condense.py --sizes 100 1000 10000 100000 --limit 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+from typing import Sequence
+
+from briefsmith_agent.parser import _SECTION_INDEX, _LineFeatures, _select_top_heap, _select_top_sorted
+
+_WORDS = ["margin", "churn", "revenue", "data", "analysis", "results", "pricing", "segment", "cohort", "vs"]
+
+
+def build_bucket(size: int, seed: int = 7) -> list[_LineFeatures]:
+    """Build a seeded key findings bucket with realistic score ties."""
+    rng = random.Random(seed)
+    lines = []
+    for idx in range(size):
+        words = rng.choices(_WORDS, k=rng.randint(4, 14))
+        if rng.random() < 0.3:
+            words.append(f"{rng.randint(1, 99)}%")
+        lines.append(f"Line {idx}: " + " ".join(words))
+    return [_LineFeatures(line) for line in lines]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the benchmark and print a timing table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--limit", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    section_idx = _SECTION_INDEX["key_findings"]
+    print(f"{'size':>10} {'sorted ms':>12} {'heap ms':>12} {'speedup':>9}")
+    for size in args.sizes:
+        bucket = build_bucket(size)
+        assert _select_top_heap(bucket, section_idx, args.limit) == _select_top_sorted(bucket, section_idx, args.limit)
+        number = max(1, 100_000 // size)
+        sorted_s = min(
+            timeit.repeat(lambda: _select_top_sorted(bucket, section_idx, args.limit), number=number, repeat=args.repeat)
+        ) / number
+        heap_s = min(
+            timeit.repeat(lambda: _select_top_heap(bucket, section_idx, args.limit), number=number, repeat=args.repeat)
+        ) / number
+        print(f"{size:>10} {sorted_s * 1000:>12.3f} {heap_s * 1000:>12.3f} {sorted_s / heap_s:>8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,143 @@
+"""Generate a seeded synthetic corpus of transcripts, bullet notes and .docx files.
+
+Run from the agent folder:
+
+    python benchmarks/corpus.py corpus --sizes 1000 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import zipfile
+from pathlib import Path
+from typing import Sequence
+from xml.sax.saxutils import escape
+
+CORPUS_KINDS = ("transcript", "bullets", "docx")
+
+_TOPICS = [
+    "margin", "churn", "pricing", "retention", "cohort", "pipeline", "EBITDA", "capex", "backlog", "renewal",
+    "supplier", "headcount", "integration", "diligence", "customer", "segment", "contract", "forecast",
+    "covenant", "inventory", "logistics", "platform", "migration", "SMB", "enterprise", "board",
+]
+_VERBS = ["improved", "declined", "held", "slipped", "accelerated", "stalled", "recovered", "doubled"]
+_PREFIXES = [
+    ("Background: ", 0.08),
+    ("Finding: ", 0.14),
+    ("Risk: ", 0.1),
+    ("Open question: ", 0.06),
+    ("Next step: ", 0.08),
+    ("", 0.54),
+]
+_FILLERS = ["um", "uh", "you know", "kind of", "like", "basically"]
+_METADATA = ["Recording started", "Meeting ended", "Transcript generated by Teams", "Attendees: deal team"]
+_SPEAKERS = ["Alex Chen", "Priya Patel", "Jordan Lee", "Sam Ortiz"]
+
+
+def note_sentence(rng: random.Random) -> str:
+    """Return one consulting-style sentence with optional section keyword prefix and metrics."""
+    prefix = rng.choices([prefix for prefix, _ in _PREFIXES], weights=[weight for _, weight in _PREFIXES])[0]
+    words = rng.sample(_TOPICS, rng.randint(2, 5))
+    body = f"{' '.join(words)} {rng.choice(_VERBS)}"
+    roll = rng.random()
+    if roll < 0.35:
+        body += f" {rng.randint(1, 40)}% vs plan"
+    elif roll < 0.45:
+        body += f" by ${rng.randint(1, 90)}m"
+    if rng.random() < 0.12:
+        body = f"what is driving {body}?"
+    if rng.random() < 0.08:
+        body += " due to owner timeline risk and delay"
+    return prefix + body
+
+
+def transcript_lines(count: int, seed: int = 11) -> list[str]:
+    """Build a meeting transcript with timestamps, speaker turns, fillers, metadata and repeats."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for idx in range(count):
+        roll = rng.random()
+        if roll < 0.04:
+            lines.append(rng.choice(_METADATA))
+        elif roll < 0.09 and lines:
+            lines.append(rng.choice(lines))
+        elif roll < 0.12:
+            lines.append("")
+        else:
+            filler = f"{rng.choice(_FILLERS)}, " if rng.random() < 0.3 else ""
+            stamp = f"[{idx // 3600 % 12 + 1}:{idx // 60 % 60:02d}:{idx % 60:02d} PM]"
+            lines.append(f"{stamp} {rng.choice(_SPEAKERS)}: {filler}{note_sentence(rng)}")
+    return lines
+
+
+def bullet_lines(count: int, seed: int = 13) -> list[str]:
+    """Build structured bullet notes with headings, numbered items and nested bullets."""
+    rng = random.Random(seed)
+    lines: list[str] = []
+    for idx in range(count):
+        roll = rng.random()
+        if roll < 0.05:
+            lines.append(f"{rng.choice(['Notes', 'Agenda', 'Summary', 'Follow-ups'])}:")
+        elif roll < 0.2:
+            lines.append(f"{idx % 9 + 1}. {note_sentence(rng)}")
+        elif roll < 0.3:
+            lines.append(f"  * {note_sentence(rng)}")
+        else:
+            lines.append(f"- {note_sentence(rng)}")
+    return lines
+
+
+def write_docx(path: Path, paragraphs: Sequence[str]) -> Path:
+    """Write a minimal Word document with one paragraph per line."""
+    body = "".join(f"<w:p><w:r><w:t>{escape(text)}</w:t></w:r></w:p>" for text in paragraphs)
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    content_types = (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", content_types)
+        archive.writestr("_rels/.rels", '<?xml version="1.0" encoding="UTF-8"?><Relationships/>')
+        archive.writestr("word/document.xml", document_xml)
+    return path
+
+
+def build_corpus(directory: Path, sizes: Sequence[int], seed: int = 11) -> dict[tuple[str, int], Path]:
+    """Write every corpus kind at every size and return paths keyed by ``(kind, size)``."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths: dict[tuple[str, int], Path] = {}
+    for size in sizes:
+        transcript = transcript_lines(size, seed)
+        paths["transcript", size] = directory / f"transcript_{size}.txt"
+        paths["transcript", size].write_text("\n".join(transcript) + "\n", encoding="utf-8")
+        paths["bullets", size] = directory / f"bullets_{size}.txt"
+        paths["bullets", size].write_text("\n".join(bullet_lines(size, seed + 2)) + "\n", encoding="utf-8")
+        paths["docx", size] = write_docx(directory / f"transcript_{size}.docx", transcript)
+    return paths
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Write a corpus to a directory."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", type=Path)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 20_000])
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args(argv)
+
+    for (kind, size), path in build_corpus(args.directory, args.sizes, args.seed).items():
+        print(f"{kind:<10} {size:>8} lines  {path.stat().st_size:>10} bytes  {path.as_posix()}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,114 @@
+"""Load-test the briefsmith server and compare it with one CLI process per brief.
+
+Run from the agent folder (starts an in-process server unless --url is given):
+
+    python benchmarks/load_test.py --requests 500 --concurrency 8 --jobs 4
+    python benchmarks/load_test.py --url http://127.0.0.1:8765 --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Sequence
+from urllib.parse import urlsplit
+
+from briefsmith_agent.server import BriefServer
+
+_NOTES = "\n".join(
+    [
+        "[10:02 AM] Speaker 1: Finding: margin improved 4% vs plan",
+        "- Risk: integration timeline slip if the owner is unclear",
+        "- Churn is concentrated in the SMB cohort",
+        "Open question: what is the pricing plan for renewals?",
+        "Next step: confirm the owner by Friday",
+    ]
+    * 40
+)
+
+
+def run_load(host: str, port: int, requests: int, concurrency: int) -> tuple[list[float], int, int]:
+    """Send text brief requests and return latencies, 503 count and error count."""
+    body = json.dumps({"mode": "internal", "text": _NOTES}).encode("utf-8")
+    local = threading.local()
+
+    def send(_: int) -> tuple[float, int]:
+        connection = getattr(local, "connection", None)
+        if connection is None:
+            connection = local.connection = HTTPConnection(host, port, timeout=60)
+        started = time.perf_counter()
+        connection.request("POST", "/brief", body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        return time.perf_counter() - started, response.status
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(send, range(requests)))
+    latencies = [latency for latency, status in results if status == 200]
+    rejected = sum(1 for _, status in results if status == 503)
+    errors = len(results) - len(latencies) - rejected
+    return latencies, rejected, errors
+
+
+def run_cli(count: int) -> float:
+    """Return seconds per brief when each brief starts a fresh CLI process."""
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "notes.txt"
+        input_path.write_text(_NOTES, encoding="utf-8")
+        command = [sys.executable, "-m", "briefsmith_agent.cli", str(input_path), "--mode", "internal"]
+        started = time.perf_counter()
+        for _ in range(count):
+            subprocess.run([*command, "--output-dir", tmp], check=True, capture_output=True)
+        return (time.perf_counter() - started) / count
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the load test and print throughput and latency percentiles."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Existing server, e.g. http://127.0.0.1:8765")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--jobs", type=int, default=4, help="Workers for the in-process server")
+    parser.add_argument("--queue-size", type=int, default=32, help="Queue for the in-process server")
+    parser.add_argument("--cli-runs", type=int, default=10, help="Fresh CLI runs for comparison (0 to skip)")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.url:
+        target = urlsplit(args.url)
+        host, port = target.hostname or "127.0.0.1", target.port or 80
+    else:
+        server = BriefServer(("127.0.0.1", 0), jobs=args.jobs, queue_size=args.queue_size)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address[:2]
+
+    try:
+        started = time.perf_counter()
+        latencies, rejected, errors = run_load(host, port, args.requests, args.concurrency)
+        elapsed = time.perf_counter() - started
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}: {len(latencies) / elapsed:,.1f} briefs/sec")
+    print(f"rejected (503): {rejected}  errors: {errors}")
+    if latencies:
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        print(f"latency ms  p50 {cuts[49] * 1000:.1f}  p95 {cuts[94] * 1000:.1f}  p99 {cuts[98] * 1000:.1f}")
+    if args.cli_runs:
+        print(f"fresh CLI process: {run_cli(args.cli_runs) * 1000:.1f} ms per brief")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
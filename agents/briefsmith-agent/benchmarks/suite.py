@@ -0,0 +1,246 @@
+"""Time briefsmith-agent's public functions on a synthetic corpus and compare against a baseline.
+
+Run from the agent folder:
+
+    python benchmarks/suite.py                        # compare with benchmarks/baseline.json
+    python benchmarks/suite.py --save-baseline        # record a new baseline
+    python benchmarks/suite.py --sizes 1000 --repeat 3 --tolerance 0.5
+
+Fast cases are looped until each sample lasts at least 50 ms. Each case is
+normalized by a fixed pure-Python calibration workload timed around it, so a
+baseline recorded on one machine remains a usable gate on another and CPU
+frequency drift during a run cancels out. A case over the tolerance is
+re-measured (``--retries``) before it counts. Exit code 1 means at least one
+gated case regressed beyond the tolerance; cases faster than 1 ms are reported
+but not gated.
+"""
+
+from __future__ import annotations
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import json
+import platform
+import random
+import re
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+from corpus import build_corpus
+
+from briefsmith_agent import __version__
+from briefsmith_agent.citations import Bm25Engine, CitationIndex
+from briefsmith_agent.cli import main as cli_main
+from briefsmith_agent.formatter import format_markdown
+from briefsmith_agent.models import Mode
+from briefsmith_agent.parser import parse_note_lines, parse_notes
+from briefsmith_agent.reader import iter_input_lines, read_input_text
+from briefsmith_agent.writer import save_markdown
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+BASELINE_VERSION = 1
+
+_CALIBRATION_WORDS = ["margin", "churn", "pricing", "owner", "timeline", "risk", "plan", "12%", "cohort"]
+_CALIBRATION_RE = re.compile(r"[a-z]+")
+_MIN_SAMPLE_SECONDS = 0.05
+# Below this, file-system and timer noise outweigh real regressions; such cases are reported only.
+_MIN_GATED_SECONDS = 0.001
+
+
+def calibrate(repeat: int = 3, size: int = 4_000) -> float:
+    """Time a fixed string/regex/dict workload representative of the parser's inner loops."""
+    rng = random.Random(0)
+    lines = [" ".join(rng.choices(_CALIBRATION_WORDS, k=12)) for _ in range(size)]
+
+    def workload() -> None:
+        counts: dict[str, int] = {}
+        for line in lines:
+            for token in _CALIBRATION_RE.findall(line.lower()):
+                counts[token] = counts.get(token, 0) + 1
+        sorted(lines, key=len)
+
+    return min(_timings(workload, repeat))
+
+
+def build_cases(
+    corpus: dict[tuple[str, int], Path],
+    sizes: Sequence[int],
+    scratch: Path,
+) -> dict[str, Callable[[], object]]:
+    """Return named zero-argument callables covering each public entry point."""
+    cases: dict[str, Callable[[], object]] = {}
+    for size in sizes:
+        transcript = corpus["transcript", size]
+        bullets = corpus["bullets", size]
+        docx = corpus["docx", size]
+        transcript_text = read_input_text(transcript)
+        bullets_text = read_input_text(bullets)
+        brief = parse_notes(transcript_text, Mode.INTERNAL)
+        markdown = format_markdown(brief, Mode.INTERNAL, transcript)
+        index = CitationIndex(brief.source_lines)
+        output_dir = scratch / f"out_{size}"
+
+        cases[f"read_input_text[txt-{size}]"] = lambda path=transcript: read_input_text(path)
+        cases[f"read_input_text[docx-{size}]"] = lambda path=docx: read_input_text(path)
+        cases[f"iter_input_lines[txt-{size}]"] = lambda path=transcript: sum(1 for _ in iter_input_lines(path))
+        cases[f"parse_notes[transcript-{size}]"] = lambda text=transcript_text: parse_notes(text, Mode.INTERNAL)
+        cases[f"parse_notes[bullets-{size}]"] = lambda text=bullets_text: parse_notes(text, Mode.CLIENT)
+        cases[f"parse_note_lines[transcript-{size}]"] = lambda text=transcript_text: parse_note_lines(
+            text.splitlines(), Mode.INTERNAL
+        )
+        cases[f"format_markdown[{size}]"] = lambda brief=brief, path=transcript: format_markdown(
+            brief, Mode.INTERNAL, path, email_ready=True
+        )
+        cases[f"citation_bm25[{size}]"] = lambda index=index: Bm25Engine(index).best_line("margin churn pricing risk")
+        cases[f"save_markdown[{size}]"] = lambda text=markdown, out=output_dir: save_markdown(text, Mode.INTERNAL, out)
+        cases[f"main[txt-{size}]"] = lambda path=transcript, out=output_dir: _run_cli(
+            [str(path), "--mode", "internal", "--output-dir", str(out)]
+        )
+        cases[f"main[docx-{size}]"] = lambda path=docx, out=output_dir: _run_cli(
+            [str(path), "--mode", "client", "--output-dir", str(out)]
+        )
+        cases[f"main[all-modes-{size}]"] = lambda path=transcript, out=output_dir: _run_cli(
+            [str(path), "--mode", "all", "--output-dir", str(out)]
+        )
+    batch_dir = next(iter(corpus.values())).parent
+    batch_args = ["--batch-dir", str(batch_dir), "--mode", "investment", "--output-dir", str(scratch / "batch_out")]
+    cases["main[batch]"] = lambda: _run_cli([*batch_args, "--jobs", "1", "--force-rebuild"])
+    return cases
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict, tolerance: float) -> list[str]:
+    """Return names of cases slower than the calibrated baseline by more than ``tolerance``."""
+    regressions = []
+    print(f"{'case':<40} {'min ms':>9} {'base ms':>9} {'ratio':>7}")
+    for name, timing in results.items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            print(f"{name:<40} {timing['min_s'] * 1000:>9.2f} {'-':>9} {'new':>7}")
+            continue
+        expected = _expected(timing, reference)
+        ratio = timing["min_s"] / expected if expected > 0 else 1.0
+        flag = ""
+        if reference["min_s"] < _MIN_GATED_SECONDS:
+            flag = "  (not gated)"
+        elif ratio > 1.0 + tolerance:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40} {timing['min_s'] * 1000:>9.2f} {expected * 1000:>9.2f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite, then save or compare against a baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 20_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="Write results to --baseline, not compare")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="Allowed slowdown vs baseline (default: 0.3)")
+    parser.add_argument("--retries", type=int, default=2, help="Re-measure a slow case this many times (default: 2)")
+    parser.add_argument("--only", help="Only run cases whose name contains this text")
+    parser.add_argument("--output", type=Path, help="Also write this run's results as JSON")
+    args = parser.parse_args(argv)
+
+    results: dict[str, dict[str, float]] = {}
+    baseline = None
+    if not args.save_baseline:
+        if not args.baseline.exists():
+            print(f"No baseline at {args.baseline.as_posix()}; run with --save-baseline first.")
+            return 1
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("version") != BASELINE_VERSION:
+            print(f"Unsupported baseline version in {args.baseline.as_posix()}.")
+            return 1
+    with tempfile.TemporaryDirectory() as tmp:
+        scratch = Path(tmp)
+        corpus = build_corpus(scratch / "corpus", args.sizes)
+        for name, case in build_cases(corpus, args.sizes, scratch).items():
+            if args.only and args.only not in name:
+                continue
+            results[name] = _measure(case, args.repeat)
+            reference = baseline["results"].get(name) if baseline else None
+            # A single slow measurement on a shared host is not a regression; confirm it before flagging.
+            for _ in range(args.retries):
+                if reference is None or results[name]["min_s"] <= _expected(results[name], reference) * (
+                    1.0 + args.tolerance
+                ):
+                    break
+                retry = _measure(case, args.repeat)
+                if retry["min_s"] / retry["calibration_s"] < results[name]["min_s"] / results[name]["calibration_s"]:
+                    results[name] = retry
+
+    payload = {
+        "version": BASELINE_VERSION,
+        "package_version": __version__,
+        "python": platform.python_version(),
+        "sizes": args.sizes,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        for name, timing in results.items():
+            print(f"{name:<40} {timing['min_s'] * 1000:>9.2f} ms")
+        print(f"Baseline written: {args.baseline.as_posix()}")
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} case(s) regressed by more than {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"No regressions beyond {args.tolerance:.0%}.")
+    return 0
+
+
+def _measure(case: Callable[[], object], repeat: int) -> dict[str, float]:
+    """Time ``case`` bracketed by calibration runs and return its result record."""
+    number = _autorange(case)
+    before = calibrate()
+    timings = [elapsed / number for elapsed in _timings(case, repeat, number)]
+    return {
+        "min_s": min(timings),
+        "median_s": statistics.median(timings),
+        "calibration_s": min(before, calibrate()),
+    }
+
+
+def _expected(timing: dict[str, float], reference: dict[str, float]) -> float:
+    """Scale the baseline time by how fast this run's calibration workload was."""
+    return reference["min_s"] / reference["calibration_s"] * timing["calibration_s"]
+
+
+def _timings(func: Callable[[], object], repeat: int, number: int = 1) -> list[float]:
+    """Return wall-clock seconds for ``repeat`` samples of ``number`` calls each."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _autorange(func: Callable[[], object]) -> int:
+    """Return how many calls make one sample last at least ``_MIN_SAMPLE_SECONDS`` (also warms up)."""
+    number = 1
+    while True:
+        if _timings(func, 1, number)[0] >= _MIN_SAMPLE_SECONDS:
+            return number
+        number *= 4
+
+
+def _run_cli(argv: list[str]) -> None:
+    """Run the CLI end to end, discarding its console output."""
+    with redirect_stdout(io.StringIO()):
+        exit_code = cli_main(argv)
+    if exit_code != 0:
+        raise RuntimeError(f"briefsmith-agent {' '.join(argv)} exited with {exit_code}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+"""Source-line citation lookup for key takeaways."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Protocol
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path gives identical results.
+    np = None
+
+CITATION_ENGINES = ("overlap", "bm25")
+
+_CITATION_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+def tokenize(text: str) -> frozenset[str]:
+    """Tokenize text into lowercase meaningful words."""
+    return frozenset(token.lower() for token in _CITATION_TOKEN_RE.findall(text) if len(token) >= 3)
+
+
+class CitationIndex:
+    """Inverted token index over source lines, built once per brief."""
+
+    __slots__ = ("lines", "line_tokens", "postings", "_first_tokenized")
+
+    def __init__(self, lines: list[str]) -> None:
+        self.lines = lines
+        self.line_tokens: list[frozenset[str]] = []
+        self.postings: dict[str, list[int]] = {}
+        self._first_tokenized: int | None = None
+        for line_id, line in enumerate(lines):
+            tokens = tokenize(line)
+            self.line_tokens.append(tokens)
+            if tokens and self._first_tokenized is None:
+                self._first_tokenized = line_id
+            for token in tokens:
+                self.postings.setdefault(token, []).append(line_id)
+
+    def best_line(self, text: str) -> str:
+        """Return the line with the highest token overlap; ties go to the earliest line.
+
+        Only lines sharing at least one token are scored. Without any overlap the first
+        line that has tokens wins, matching a linear scan over every line.
+        """
+        line_id = self.best_line_id(text)
+        return self.lines[line_id] if line_id is not None else ""
+
+    def best_line_id(self, text: str) -> int | None:
+        """Return the index of ``best_line``'s line, or None when no line has tokens."""
+        overlaps: dict[int, int] = {}
+        for token in tokenize(text):
+            for line_id in self.postings.get(token, ()):
+                overlaps[line_id] = overlaps.get(line_id, 0) + 1
+        if overlaps:
+            return min(overlaps, key=lambda line_id: (-overlaps[line_id], line_id))
+        return self._first_tokenized
+
+
+class CitationEngine(Protocol):
+    """Selects the best supporting source line for a takeaway."""
+
+    def best_line(self, text: str) -> str:
+        """Return the best matching source line, or an empty string."""
+
+    def best_line_id(self, text: str) -> int | None:
+        """Return the index of the best matching source line, or None."""
+
+
+class Bm25Engine:
+    """BM25 ranking over a citation index, vectorized with NumPy when available.
+
+    Lines are scored with binary term frequency, so long boilerplate lines are damped
+    by length normalization and rare tokens outweigh common ones. Ties go to the
+    earliest line, and lines with no shared token fall back like ``CitationIndex``.
+    """
+
+    __slots__ = ("index", "idf", "_line_weights", "_use_numpy", "_posting_arrays")
+
+    def __init__(
+        self,
+        index: CitationIndex,
+        k1: float = 1.2,
+        b: float = 0.75,
+        use_numpy: bool | None = None,
+    ) -> None:
+        self.index = index
+        line_count = len(index.lines)
+        lengths = [len(tokens) for tokens in index.line_tokens]
+        average = (sum(lengths) / line_count) if line_count else 0.0
+        average = average or 1.0
+        self.idf = {
+            token: math.log(1.0 + (line_count - len(ids) + 0.5) / (len(ids) + 0.5))
+            for token, ids in index.postings.items()
+        }
+        # With tf fixed at 1, BM25 factors into idf(token) * weight(line).
+        weights = [(k1 + 1.0) / (1.0 + k1 * (1.0 - b + b * length / average)) for length in lengths]
+        self._use_numpy = np is not None if use_numpy is None else use_numpy and np is not None
+        self._line_weights = np.asarray(weights, dtype=np.float64) if self._use_numpy else weights
+        self._posting_arrays: dict[str, object] = {}
+
+    def best_line(self, text: str) -> str:
+        """Return the highest BM25-scoring line for the text."""
+        line_id = self.best_line_id(text)
+        return self.index.lines[line_id] if line_id is not None else ""
+
+    def best_line_id(self, text: str) -> int | None:
+        """Return the index of the highest BM25-scoring line, or None when no line has tokens."""
+        tokens = sorted(token for token in tokenize(text) if token in self.idf)
+        if not tokens:
+            return self.index.best_line_id("")
+        return self._best_id_numpy(tokens) if self._use_numpy else self._best_id_python(tokens)
+
+    def _best_id_numpy(self, tokens: list[str]) -> int:
+        """Score every line at once with sparse scatter-adds."""
+        sums = np.zeros(len(self.index.lines), dtype=np.float64)
+        for token in tokens:
+            ids = self._posting_arrays.get(token)
+            if ids is None:
+                ids = np.asarray(self.index.postings[token], dtype=np.intp)
+                self._posting_arrays[token] = ids
+            sums[ids] += self.idf[token]
+        return int(np.argmax(sums * self._line_weights))
+
+    def _best_id_python(self, tokens: list[str]) -> int:
+        """Score candidate lines with dictionaries."""
+        sums: dict[int, float] = {}
+        for token in tokens:
+            idf = self.idf[token]
+            for line_id in self.index.postings[token]:
+                sums[line_id] = sums.get(line_id, 0.0) + idf
+        weights = self._line_weights
+        return min(sums, key=lambda line_id: (-(sums[line_id] * weights[line_id]), line_id))
+
+
+def build_citation_engine(index: CitationIndex, name: str = "overlap") -> CitationEngine:
+    """Return the named citation engine over an index."""
+    if name == "overlap":
+        return index
+    if name == "bm25":
+        return Bm25Engine(index)
+    raise ValueError(f"Unknown citation engine: {name}")
@@ -3,17 +3,42 @@
 from __future__ import annotations
 
 import argparse
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, fields
+from itertools import chain, islice
+import os
 import sys
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Iterable, Iterator, Sequence, TypeVar
 
+from .citations import CITATION_ENGINES
+from .discovery import iter_batch_files
 from .errors import BriefsmithAgentError, InputValidationError
-from .formatter import format_markdown
-from .models import Mode
-from .parser import parse_notes
-from .reader import read_input_text
-from .writer import save_markdown
+from .formatter import OUTPUT_FORMATS, OUTPUT_SUFFIXES, format_brief
+from .keywords import KeywordProfile, load_keyword_profile
+from .manifest import (
+    BatchManifest,
+    ManifestEntry,
+    SourceFingerprint,
+    fingerprint_file,
+    options_fingerprint,
+    stat_matches,
+)
+from .models import Brief, Mode
+from .noise import NoiseDictionary, load_noise_dictionary
+from .parser import parse_note_lines_modes, parse_notes_modes
+from .profiling import (
+    PROFILE_JSONL_NAME,
+    FileProfile,
+    dump_slowest,
+    format_profile_table,
+    recording,
+    write_profile_jsonl,
+)
+from .reader import iter_input_lines, read_input_text
+from .writer import BATCH_SINKS, BatchSink, naming_template, naming_uses_digest, open_batch_sink, save_output
 
 
 @dataclass(slots=True)
@@ -25,6 +50,46 @@ class RunConfig:
     max_bullets: int | None
     max_ktas: int
     email_ready: bool
+    stream: bool = False
+    citation_engine: str = "overlap"
+    dedupe_threshold: float = 1.0
+    keyword_profile: KeywordProfile | None = None
+    noise_phrases: NoiseDictionary | None = None
+    extra_modes: tuple[Mode, ...] = ()
+    output_format: str = "md"
+    batch_sink: str = "files"
+    naming: str = "timestamp"
+
+    @property
+    def modes(self) -> tuple[Mode, ...]:
+        """Every mode to render: ``mode`` first, then ``extra_modes`` from the same parse."""
+        return (self.mode, *self.extra_modes)
+
+
+@dataclass(slots=True)
+class BatchOutcome:
+    """Result of processing one batch input file."""
+
+    input_path: Path
+    output_path: Path | None = None
+    error: str | None = None
+    skipped: bool = False
+    fingerprint: SourceFingerprint | None = None
+    profile: FileProfile | None = None
+    extra_output_paths: list[Path] = field(default_factory=list)
+    # Rendered briefs on their way to the batch's shared sink.
+    rendered: dict[Mode, str] | None = None
+
+    @property
+    def output_paths(self) -> list[Path]:
+        """Every generated brief, primary mode first."""
+        return [self.output_path, *self.extra_output_paths] if self.output_path is not None else []
+
+
+# In-flight files per worker; keeps the pool busy without queueing the whole batch.
+_BATCH_WINDOW_PER_JOB = 2
+
+_T = TypeVar("_T")
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -38,7 +103,9 @@ def build_parser() -> argparse.ArgumentParser:
             "  briefsmith-agent meeting_transcript.docx --mode client\n"
             "  briefsmith-agent .\\data\\deal_notes.txt --mode investment\n"
             "  briefsmith-agent client_call.txt --mode client --output-dir outputs --email-ready\n"
-            "  briefsmith-agent --batch-dir .\\meeting_notes --mode investment --max-bullets 3"
+            "  briefsmith-agent --batch-dir .\\meeting_notes --mode investment --max-bullets 3\n"
+            "  briefsmith-agent --batch-dir .\\meeting_notes --mode client --jobs 4\n"
+            "  briefsmith-agent serve --port 8765 --jobs 4"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -51,8 +118,8 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--mode",
         required=True,
-        choices=[m.value for m in Mode],
-        help="Output mode: internal, client, investment",
+        type=_parse_modes,
+        help="Output mode: internal, client, investment, a comma list, or all (one parse, one brief per mode)",
     )
     parser.add_argument(
         "--output-dir",
@@ -65,6 +132,48 @@ def build_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Directory to batch process all .txt and .docx files",
     )
+    parser.add_argument(
+        "--recursive",
+        action="store_true",
+        help="Discover .txt and .docx files in --batch-dir subfolders as well",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Only process batch files matching this glob (repeatable; patterns with / match relative paths)",
+    )
+    parser.add_argument(
+        "--exclude",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help="Skip batch files or folders matching this glob (repeatable)",
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="Maximum subfolder depth for --recursive (default: unlimited)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --batch-dir (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--pipeline-depth",
+        type=int,
+        default=None,
+        help="Run --batch-dir as an asyncio read/render/write pipeline with this many files queued per stage",
+    )
+    parser.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        help="Reprocess every --batch-dir file even if the output manifest marks it unchanged",
+    )
     parser.add_argument(
         "--max-bullets",
         type=int,
@@ -77,6 +186,78 @@ def build_parser() -> argparse.ArgumentParser:
         default=4,
         help="Maximum number of key takeaways (default: 4)",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read and parse input line by line with bounded memory (for very large notes)",
+    )
+    parser.add_argument(
+        "--dedupe-threshold",
+        type=float,
+        default=1.0,
+        help="Word-bigram Jaccard similarity in (0, 1] at which lines count as duplicates (default: 1.0, exact only)",
+    )
+    parser.add_argument(
+        "--keyword-profile",
+        type=Path,
+        default=None,
+        help="TOML or JSON file with custom section keywords and limits, optionally per mode",
+    )
+    parser.add_argument(
+        "--noise-phrases",
+        type=Path,
+        default=None,
+        help="Text file of boilerplate phrases to drop (phrase, ^phrase at line start) or strip (~phrase)",
+    )
+    parser.add_argument(
+        "--citation-engine",
+        choices=CITATION_ENGINES,
+        default="overlap",
+        help="KTA source snippet ranking: overlap (default) or bm25",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="md",
+        help="Output format: md (default), json, or ndjson (one record per brief; a batch writes a single file)",
+    )
+    parser.add_argument(
+        "--batch-sink",
+        choices=BATCH_SINKS,
+        default=None,
+        help=(
+            "Batch output layout: files (one file per brief), concat (one file with an offset index), "
+            "zip or tar; defaults to concat for ndjson and files otherwise"
+        ),
+    )
+    parser.add_argument(
+        "--naming",
+        type=_parse_naming,
+        default="timestamp",
+        help=(
+            "Output file naming: timestamp (default), stem (input file name), content (hash of the input and "
+            "options; reruns reuse the existing brief) or a template over {mode}, {stem}, {timestamp}, {digest}"
+        ),
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each stage per file, print a summary table and write JSON lines",
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=Path,
+        default=None,
+        help=f"JSON lines file for --profile (default: <output-dir>/{PROFILE_JSONL_NAME})",
+    )
+    parser.add_argument(
+        "--profile-slowest",
+        type=int,
+        default=0,
+        metavar="N",
+        help="With --profile, re-run the N slowest files under cProfile and tracemalloc and save the dumps",
+    )
     parser.add_argument(
         "--email-ready",
         action="store_true",
@@ -105,42 +286,366 @@ def validate_batch_dir(path: Path) -> None:
 
 def collect_batch_files(batch_dir: Path) -> list[Path]:
     """Collect supported note files from a batch directory."""
-    files = sorted([*batch_dir.glob("*.txt"), *batch_dir.glob("*.docx")])
-    if not files:
-        raise InputValidationError(f"No .txt or .docx files found in batch directory: {batch_dir}")
-    return files
+    return list(iter_batch_files(batch_dir, max_depth=0))
 
 
 def process_single_file(input_path: Path, config: RunConfig) -> Path:
-    """Process one notes file and return output path."""
+    """Process one notes file and return the primary mode's output path."""
+    return process_file(input_path, config)[0]
+
+
+def process_file(input_path: Path, config: RunConfig, content_hash: str | None = None) -> list[Path]:
+    """Process one notes file and return one output path per configured mode."""
     validate_input_file(input_path)
-    raw_text = read_input_text(input_path)
-    brief = parse_notes(raw_text, config.mode, max_bullets=config.max_bullets)
-    markdown = format_markdown(
-        brief,
-        config.mode,
+    return write_briefs(render_briefs(input_path, config), config, input_path, content_hash)
+
+
+def write_briefs(
+    rendered: dict[Mode, str],
+    config: RunConfig,
+    source: Path,
+    content_hash: str | None = None,
+) -> list[Path]:
+    """Save rendered briefs in mode order and return their paths.
+
+    Content-addressed names hash the source; pass ``content_hash`` when it is already known.
+    """
+    suffix = OUTPUT_SUFFIXES[config.output_format]
+    source_key = ""
+    if naming_uses_digest(config.naming):
+        if content_hash is None:
+            content_hash = fingerprint_file(source).content_hash
+        source_key = f"{content_hash}:{manifest_options(config)}"
+    return [
+        save_output(content, mode, config.output_dir, suffix, config.naming, source, source_key)
+        for mode, content in rendered.items()
+    ]
+
+
+def render_brief(input_path: Path, config: RunConfig) -> str:
+    """Read and parse one validated notes file and return its primary mode's rendered brief."""
+    return render_briefs(input_path, config)[config.mode]
+
+
+def render_text(raw_text: str, source_path: Path, config: RunConfig) -> str:
+    """Parse already-read notes text and return its primary mode's rendered brief."""
+    return render_texts(raw_text, source_path, config)[config.mode]
+
+
+def render_briefs(input_path: Path, config: RunConfig) -> dict[Mode, str]:
+    """Read and parse one validated notes file once and return a rendered brief per mode."""
+    # Citations in .docx briefs name document paragraphs, not lines of the extracted text.
+    paragraph_numbers: list[int] | None = [] if input_path.suffix.lower() == ".docx" else None
+    if not config.stream:
+        return render_texts(read_input_text(input_path, paragraph_numbers), input_path, config, paragraph_numbers)
+    briefs = parse_note_lines_modes(
+        iter_input_lines(input_path, paragraph_numbers),
+        config.modes,
+        max_bullets=config.max_bullets,
+        dedupe_threshold=config.dedupe_threshold,
+        keyword_profile=config.keyword_profile,
+        noise_phrases=config.noise_phrases,
+    )
+    return _format_briefs(briefs, input_path, config, paragraph_numbers)
+
+
+def render_texts(
+    raw_text: str,
+    source_path: Path,
+    config: RunConfig,
+    paragraph_numbers: list[int] | None = None,
+) -> dict[Mode, str]:
+    """Parse already-read notes text once and return a rendered brief per mode.
+
+    ``paragraph_numbers`` maps each text line to its .docx paragraph for citations.
+    """
+    briefs = parse_notes_modes(
+        raw_text,
+        config.modes,
+        max_bullets=config.max_bullets,
+        dedupe_threshold=config.dedupe_threshold,
+        keyword_profile=config.keyword_profile,
+        noise_phrases=config.noise_phrases,
+    )
+    return _format_briefs(briefs, source_path, config, paragraph_numbers)
+
+
+def _format_briefs(
+    briefs: dict[Mode, Brief],
+    source_path: Path,
+    config: RunConfig,
+    paragraph_numbers: list[int] | None = None,
+) -> dict[Mode, str]:
+    """Format each mode's brief with the shared output options."""
+    if paragraph_numbers:
+        for brief in briefs.values():
+            if brief.source_line_numbers is not None:
+                brief.source_line_numbers = [paragraph_numbers[number - 1] for number in brief.source_line_numbers]
+    return {
+        mode: format_brief(
+            brief,
+            mode,
+            source_path,
+            output_format=config.output_format,
+            max_ktas=config.max_ktas,
+            email_ready=config.email_ready,
+            citation_engine=config.citation_engine,
+        )
+        for mode, brief in briefs.items()
+    }
+
+
+def run_batch(
+    files: Iterable[Path],
+    config: RunConfig,
+    jobs: int = 1,
+    manifest: BatchManifest | None = None,
+    force_rebuild: bool = False,
+    profile: bool = False,
+) -> Iterator[BatchOutcome]:
+    """Process batch files on up to ``jobs`` processes, yielding outcomes in input order.
+
+    With a manifest, inputs whose size, mtime or content hash and run options are
+    unchanged are skipped, and generated briefs are recorded as outcomes arrive.
+    With ``profile``, each processed outcome carries a ``FileProfile``. A batch sink
+    collects every brief into one file in input order and publishes it only when the
+    whole batch finishes; since that file must hold every brief, nothing is skipped
+    then. Any failure in one file, including a crashed worker, becomes
+    that file's error outcome and the batch continues.
+    """
+    options = manifest_options(config)
+    sink = open_batch_sink(config.batch_sink, config.output_dir, OUTPUT_SUFFIXES[config.output_format])
+    force_rebuild = force_rebuild or sink is not None
+    # Discovery is lazy, so look ahead far enough to never start more workers than files.
+    files = iter(files)
+    head = list(islice(files, jobs)) if jobs > 1 else []
+    workers = min(jobs, len(head))
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    window = workers * _BATCH_WINDOW_PER_JOB if executor is not None else 1
+    try:
+        pending: deque[tuple[Path, Future[BatchOutcome], tuple[object, ...] | None]] = deque()
+        for file_path in chain(head, files):
+            known = None if manifest is None or force_rebuild else manifest.lookup(file_path, options)
+            args = None
+            if manifest is not None and known is not None and stat_matches(known, file_path):
+                future = _completed(skipped_outcome(file_path, known, manifest.output_dir))
+            else:
+                args = (file_path, config, known, manifest is not None, profile)
+                if executor is None:
+                    future = _completed(_process_batch_file(*args))
+                else:
+                    try:
+                        future = executor.submit(_process_batch_file, *args)
+                    except BrokenProcessPool:
+                        # A crashed worker breaks the whole pool; later files get a fresh one.
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = ProcessPoolExecutor(max_workers=workers)
+                        future = executor.submit(_process_batch_file, *args)
+            pending.append((file_path, future, args if executor is not None else None))
+            while len(pending) >= window:
+                yield _record_outcome(_outcome_of(*pending.popleft()), manifest, config, options, sink)
+        while pending:
+            yield _record_outcome(_outcome_of(*pending.popleft()), manifest, config, options, sink)
+    except BaseException:
+        if sink is not None:
+            sink.abort()
+        raise
+    else:
+        if sink is not None:
+            sink.close()
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def manifest_options(config: RunConfig) -> str:
+    """Fingerprint every RunConfig field that affects generated output."""
+    options = {field.name: getattr(config, field.name) for field in fields(config) if field.name != "output_dir"}
+    if config.keyword_profile is not None:
+        options["keyword_profile"] = config.keyword_profile.digest
+    if config.noise_phrases is not None:
+        options["noise_phrases"] = config.noise_phrases.digest
+    return options_fingerprint(options)
+
+
+def _process_batch_file(
+    input_path: Path,
+    config: RunConfig,
+    known: ManifestEntry | None = None,
+    track: bool = False,
+    profile: bool = False,
+) -> BatchOutcome:
+    """Process one batch file, capturing user-facing failures instead of raising."""
+    file_profile = FileProfile(str(input_path)) if profile else None
+    try:
+        with recording(file_profile):
+            validate_input_file(input_path)
+            fingerprint = fingerprint_file(input_path) if track else None
+            if fingerprint is not None and known is not None and fingerprint.content_hash == known.content_hash:
+                return skipped_outcome(input_path, known, config.output_dir, fingerprint)
+            if config.batch_sink != "files":
+                rendered = render_briefs(input_path, config)
+                return BatchOutcome(input_path, fingerprint=fingerprint, profile=file_profile, rendered=rendered)
+            output_paths = process_file(input_path, config, fingerprint.content_hash if fingerprint else None)
+    except BriefsmithAgentError as exc:
+        return BatchOutcome(input_path, error=str(exc), profile=file_profile)
+    except Exception as exc:
+        return BatchOutcome(input_path, error=describe_unexpected_error(exc), profile=file_profile)
+    return BatchOutcome(
+        input_path,
+        output_path=output_paths[0],
+        fingerprint=fingerprint,
+        profile=file_profile,
+        extra_output_paths=output_paths[1:],
+    )
+
+
+def describe_unexpected_error(exc: Exception) -> str:
+    """Describe a failure that is not a user-facing error, for a per-file batch outcome."""
+    return f"Unexpected error ({type(exc).__name__}): {exc}"
+
+
+def _outcome_of(
+    input_path: Path, future: Future[BatchOutcome], retry: tuple[object, ...] | None = None
+) -> BatchOutcome:
+    """Return a file's outcome, recording a crashed worker or lost result as that file's failure.
+
+    A crashed worker breaks the whole pool and fails every file in flight, so each of
+    them is retried alone in a fresh worker (``retry`` holds its arguments) and only a
+    file that crashes on its own is reported.
+    """
+    try:
+        return future.result()
+    except BrokenProcessPool as exc:
+        error: Exception = exc
+        if retry is not None:
+            try:
+                return run_in_fresh_worker(_process_batch_file, *retry)
+            except Exception as retry_exc:
+                error = retry_exc
+    except Exception as exc:
+        error = exc
+    return BatchOutcome(input_path, error=describe_unexpected_error(error))
+
+
+def run_in_fresh_worker(function: Callable[..., _T], *args: object) -> _T:
+    """Run one call alone in a new worker process, so a crash can only fail that call."""
+    with ProcessPoolExecutor(max_workers=1) as solo:
+        return solo.submit(function, *args).result()
+
+
+def emit_to_sink(outcome: BatchOutcome, sink: BatchSink) -> None:
+    """Add an outcome's rendered briefs to the batch sink, turning write failures into outcome errors."""
+    try:
+        with recording(outcome.profile):
+            outcome.output_path = sink.write(outcome.input_path, outcome.rendered or {})
+    except BriefsmithAgentError as exc:
+        outcome.error = str(exc)
+    except Exception as exc:
+        outcome.error = describe_unexpected_error(exc)
+    outcome.rendered = None
+
+
+def skipped_outcome(
+    input_path: Path,
+    known: ManifestEntry,
+    output_dir: Path,
+    fingerprint: SourceFingerprint | None = None,
+) -> BatchOutcome:
+    """Build the outcome for an input whose recorded briefs are still current."""
+    return BatchOutcome(
         input_path,
-        max_ktas=config.max_ktas,
-        email_ready=config.email_ready,
+        output_path=output_dir / known.output_name,
+        skipped=True,
+        fingerprint=fingerprint,
+        extra_output_paths=[output_dir / name for name in known.extra_output_names],
     )
-    return save_markdown(markdown, config.mode, config.output_dir)
+
+
+def _record_outcome(
+    outcome: BatchOutcome,
+    manifest: BatchManifest | None,
+    config: RunConfig,
+    options: str,
+    sink: BatchSink | None = None,
+) -> BatchOutcome:
+    """Add pending briefs to the sink, record a finished outcome in the manifest and pass it through."""
+    if sink is not None and outcome.rendered is not None:
+        emit_to_sink(outcome, sink)
+    if manifest is not None and outcome.fingerprint is not None and outcome.output_path is not None:
+        manifest.record(
+            outcome.input_path,
+            outcome.fingerprint,
+            ",".join(mode.value for mode in config.modes),
+            options,
+            outcome.output_path,
+            outcome.extra_output_paths,
+        )
+    return outcome
+
+
+def _parse_modes(value: str) -> tuple[Mode, ...]:
+    """Parse ``--mode``: one mode, a comma-separated list, or ``all``."""
+    if value.strip().lower() == "all":
+        return tuple(Mode)
+    modes: list[Mode] = []
+    for name in value.split(","):
+        if name.strip().lower() == "all":
+            raise argparse.ArgumentTypeError("'all' already selects every mode and cannot be part of a list")
+        try:
+            mode = Mode(name.strip().lower())
+        except ValueError:
+            choices = ", ".join(repr(choice) for choice in [*(mode.value for mode in Mode), "all"])
+            raise argparse.ArgumentTypeError(f"invalid choice: {name.strip()!r} (choose from {choices})") from None
+        if mode not in modes:
+            modes.append(mode)
+    return tuple(modes)
+
+
+def _parse_naming(value: str) -> str:
+    """Validate ``--naming``: a strategy name or a file name template."""
+    try:
+        naming_template(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+    return value
+
+
+def _completed(outcome: BatchOutcome) -> Future[BatchOutcome]:
+    """Wrap an already computed outcome so it can queue behind pool futures."""
+    future: Future[BatchOutcome] = Future()
+    future.set_result(outcome)
+    return future
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     """Run application and return exit code."""
+    arguments = list(sys.argv[1:] if argv is None else argv)
+    if arguments[:1] == ["serve"]:
+        from .server import serve_main
+
+        return serve_main(arguments[1:])
+
     parser = build_parser()
     try:
-        args = parser.parse_args(argv)
+        args = parser.parse_args(arguments)
     except SystemExit as exc:
         return int(exc.code)
 
     input_path: Path | None = args.input_path
     output_dir: Path = args.output_dir
-    mode = Mode(args.mode)
+    modes: tuple[Mode, ...] = args.mode
     batch_dir: Path | None = args.batch_dir
     max_bullets: int | None = args.max_bullets
     max_ktas: int = args.max_ktas
     email_ready: bool = bool(args.email_ready)
+    jobs: int = args.jobs
+    force_rebuild: bool = bool(args.force_rebuild)
+    max_depth: int | None = args.max_depth
+    dedupe_threshold: float = args.dedupe_threshold
+    pipeline_depth: int | None = args.pipeline_depth
+    profile: bool = bool(args.profile)
+    profile_slowest: int = args.profile_slowest
 
     if input_path is None and batch_dir is None:
         print("Provide either input_path or --batch-dir.", file=sys.stderr)
@@ -154,38 +659,158 @@ def main(argv: Sequence[str] | None = None) -> int:
     if max_ktas < 1:
         print("--max-ktas must be >= 1", file=sys.stderr)
         return 2
+    if jobs < 1:
+        print("--jobs must be >= 1", file=sys.stderr)
+        return 2
+    if not 0.0 < dedupe_threshold <= 1.0:
+        print("--dedupe-threshold must be > 0 and <= 1", file=sys.stderr)
+        return 2
+    if pipeline_depth is not None and (pipeline_depth < 1 or batch_dir is None):
+        print("--pipeline-depth must be >= 1 and requires --batch-dir", file=sys.stderr)
+        return 2
+    if pipeline_depth is not None and args.stream:
+        print("--stream cannot be combined with --pipeline-depth, which reads each file whole", file=sys.stderr)
+        return 2
+    if profile_slowest < 0 or (profile_slowest and not profile):
+        print("--profile-slowest must be >= 0 and requires --profile", file=sys.stderr)
+        return 2
+    if max_depth is not None and (max_depth < 0 or not args.recursive):
+        print("--max-depth must be >= 0 and requires --recursive", file=sys.stderr)
+        return 2
+    if args.batch_sink is not None and batch_dir is None:
+        print("--batch-sink requires --batch-dir", file=sys.stderr)
+        return 2
+    batch_sink: str = args.batch_sink or ("concat" if args.output_format == "ndjson" else "files")
+
+    try:
+        keyword_profile = load_keyword_profile(args.keyword_profile) if args.keyword_profile is not None else None
+        noise_phrases = load_noise_dictionary(args.noise_phrases) if args.noise_phrases is not None else None
+    except BriefsmithAgentError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
 
     config = RunConfig(
-        mode=mode,
+        mode=modes[0],
         output_dir=output_dir,
         max_bullets=max_bullets,
         max_ktas=max_ktas,
         email_ready=email_ready,
+        stream=bool(args.stream),
+        citation_engine=args.citation_engine,
+        dedupe_threshold=dedupe_threshold,
+        keyword_profile=keyword_profile,
+        noise_phrases=noise_phrases,
+        extra_modes=modes[1:],
+        output_format=args.output_format,
+        batch_sink=batch_sink,
+        naming=args.naming,
     )
 
     try:
         if batch_dir is not None:
             validate_batch_dir(batch_dir)
-            batch_files = collect_batch_files(batch_dir)
-            outputs: list[Path] = []
-            for file_path in batch_files:
-                outputs.append(process_single_file(file_path, config))
-            print(f"Batch complete: {len(outputs)} briefs generated.")
-            for output_path in outputs:
+            batch_files = iter_batch_files(
+                batch_dir,
+                include=args.include,
+                exclude=args.exclude,
+                max_depth=max_depth if args.recursive else 0,
+            )
+            manifest = BatchManifest.load(output_dir)
+            report = None
+            try:
+                if pipeline_depth is not None:
+                    from .pipeline import run_pipeline
+
+                    report = run_pipeline(
+                        batch_files,
+                        config,
+                        jobs=jobs,
+                        depth=pipeline_depth,
+                        manifest=manifest,
+                        force_rebuild=force_rebuild,
+                        profile=profile,
+                    )
+                    outcomes = report.outcomes
+                else:
+                    outcomes = list(
+                        run_batch(
+                            batch_files,
+                            config,
+                            jobs=jobs,
+                            manifest=manifest,
+                            force_rebuild=force_rebuild,
+                            profile=profile,
+                        )
+                    )
+            finally:
+                manifest.save()
+            generated = [outcome for outcome in outcomes if outcome.output_path is not None and not outcome.skipped]
+            skipped = [outcome for outcome in outcomes if outcome.skipped]
+            failures = [outcome for outcome in outcomes if outcome.error is not None]
+            # Every generated file gets one brief per mode, even when they share a batch sink.
+            summary = f"{len(generated) * len(config.modes)} briefs generated"
+            if len(config.modes) > 1:
+                summary += f" from {len(generated)} files"
+            print(f"Batch complete: {summary}.")
+            # Briefs in a batch sink share one file, so each path is listed once.
+            for output_path in dict.fromkeys(path for outcome in generated for path in outcome.output_paths):
                 print(f"- {output_path.as_posix()}")
+            if skipped:
+                print(f"Skipped {len(skipped)} unchanged files (use --force-rebuild to regenerate).")
+                for output_path in dict.fromkeys(path for outcome in skipped for path in outcome.output_paths):
+                    print(f"- {output_path.as_posix()} (unchanged)")
+            if report is not None:
+                from .pipeline import format_stage_report
+
+                print("Pipeline stage utilization:")
+                for line in format_stage_report(report):
+                    print(f"  {line}")
+            if profile:
+                _report_profiles(
+                    [outcome.profile for outcome in outcomes if outcome.profile is not None],
+                    config,
+                    args.profile_output,
+                    profile_slowest,
+                )
+            if failures:
+                print(f"Batch failures: {len(failures)} files could not be processed.", file=sys.stderr)
+                for outcome in failures:
+                    print(f"- {outcome.input_path.as_posix()}: {outcome.error}", file=sys.stderr)
+                return 1
             return 0
 
         if input_path is None:
             raise InputValidationError("Input path is required when --batch-dir is not set.")
-        output_path = process_single_file(input_path, config)
+        file_profile = FileProfile(str(input_path)) if profile else None
+        with recording(file_profile):
+            output_paths = process_file(input_path, config)
+        for output_path in output_paths:
+            print(f"Brief generated: {output_path.as_posix()}")
+        if file_profile is not None:
+            _report_profiles([file_profile], config, args.profile_output, profile_slowest)
     except BriefsmithAgentError as exc:
         print(str(exc), file=sys.stderr)
         return 1
-
-    print(f"Brief generated: {output_path.as_posix()}")
     return 0
 
 
+def _report_profiles(
+    profiles: list[FileProfile],
+    config: RunConfig,
+    output: Path | None,
+    slowest: int,
+) -> None:
+    """Print the profile table, write JSON lines and optional deep dumps."""
+    jsonl_path = write_profile_jsonl(profiles, output or config.output_dir / PROFILE_JSONL_NAME)
+    for line in format_profile_table(profiles):
+        print(line)
+    print(f"Profile written: {jsonl_path.as_posix()}")
+    if slowest:
+        dump_dir = jsonl_path.parent / "profiles"
+        dumps = dump_slowest(profiles, lambda path: render_briefs(path, config), dump_dir, slowest)
+        print(f"Profile dumps: {len(dumps)} files in {dump_dir.as_posix()}")
+
+
 def run() -> None:
     """Console script entrypoint."""
     raise SystemExit(main())
@@ -0,0 +1,83 @@
+"""Lazy discovery of batch input files."""
+
+from __future__ import annotations
+
+from fnmatch import fnmatchcase
+import os
+from pathlib import Path
+from typing import Iterator, Sequence
+
+from .errors import InputValidationError
+
+SUPPORTED_SUFFIXES = (".txt", ".docx")
+
+
+def iter_batch_files(
+    batch_dir: Path,
+    include: Sequence[str] = (),
+    exclude: Sequence[str] = (),
+    max_depth: int | None = None,
+) -> Iterator[Path]:
+    """Yield supported note files under ``batch_dir`` as they are discovered.
+
+    Directories are walked depth-first with ``os.scandir`` and entries are sorted per
+    directory, so output order is deterministic without listing the whole tree first.
+    Patterns containing ``/`` match the path relative to ``batch_dir``; other patterns
+    match the file or directory name. Excluded directories are not descended into.
+    Hidden entries are skipped, matching ``glob`` behavior.
+    """
+    found = False
+    for path in _walk(batch_dir, batch_dir, include, exclude, max_depth, depth=0):
+        found = True
+        yield path
+    if not found:
+        raise InputValidationError(f"No .txt or .docx files found in batch directory: {batch_dir}")
+
+
+def _walk(
+    root: Path,
+    directory: Path,
+    include: Sequence[str],
+    exclude: Sequence[str],
+    max_depth: int | None,
+    depth: int,
+) -> Iterator[Path]:
+    """Recursively yield matching files from one directory."""
+    try:
+        with os.scandir(directory) as scanner:
+            entries = sorted(scanner, key=lambda entry: entry.name)
+    except OSError:
+        if depth == 0:
+            raise InputValidationError(f"Failed to list batch directory: {directory}") from None
+        return
+
+    subdirs: list[Path] = []
+    for entry in entries:
+        if entry.name.startswith("."):
+            continue
+        path = Path(entry.path)
+        relative = path.relative_to(root).as_posix()
+        if _matches(entry.name, relative, exclude):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(path)
+                continue
+            is_file = entry.is_file()
+        except OSError:
+            continue
+        if not is_file or not entry.name.lower().endswith(SUPPORTED_SUFFIXES):
+            continue
+        if include and not _matches(entry.name, relative, include):
+            continue
+        yield path
+
+    if max_depth is not None and depth >= max_depth:
+        return
+    for subdir in subdirs:
+        yield from _walk(root, subdir, include, exclude, max_depth, depth + 1)
+
+
+def _matches(name: str, relative: str, patterns: Sequence[str]) -> bool:
+    """Return True when a name or relative path matches any glob pattern."""
+    return any(fnmatchcase(relative if "/" in pattern else name, pattern) for pattern in patterns)
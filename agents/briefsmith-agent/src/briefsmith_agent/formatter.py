@@ -1,13 +1,21 @@
-"""Markdown formatter for generated briefs."""
+"""Markdown and JSON formatters for generated briefs."""
 
 from __future__ import annotations
 
 from datetime import datetime
+import json
 from pathlib import Path
-import re
+from typing import Any
 
+from .citations import CitationIndex, build_citation_engine
 from .models import Brief, Mode
+from .profiling import stage
 
+OUTPUT_FORMATS = ("md", "json", "ndjson")
+OUTPUT_SUFFIXES = {"md": ".md", "json": ".json", "ndjson": ".ndjson"}
+BRIEF_DOCUMENT_VERSION = 1
+
+_SECTION_FIELDS = ("situation", "key_findings", "risks", "open_questions", "next_steps")
 _MODE_DESCRIPTIONS = {
     Mode.INTERNAL: "Internal operational brief with candid execution focus.",
     Mode.CLIENT: "Client-ready brief emphasizing outcomes and clarity.",
@@ -15,12 +23,77 @@ _MODE_DESCRIPTIONS = {
 }
 
 
+def format_brief(
+    brief: Brief,
+    mode: Mode,
+    source_path: Path,
+    output_format: str = "md",
+    max_ktas: int = 4,
+    email_ready: bool = False,
+    citation_engine: str = "overlap",
+) -> str:
+    """Render a brief as markdown, an indented JSON document or one NDJSON record."""
+    if output_format == "md":
+        return format_markdown(brief, mode, source_path, max_ktas, email_ready, citation_engine)
+    document = build_brief_document(brief, mode, source_path, max_ktas, email_ready, citation_engine)
+    if output_format == "json":
+        return json.dumps(document, indent=2, ensure_ascii=False) + "\n"
+    if output_format == "ndjson":
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n"
+    raise ValueError(f"Unknown output format: {output_format}")
+
+
+def build_brief_document(
+    brief: Brief,
+    mode: Mode,
+    source_path: Path,
+    max_ktas: int = 4,
+    email_ready: bool = False,
+    citation_engine: str = "overlap",
+) -> dict[str, Any]:
+    """Build the JSON-serializable brief: sections, KTAs and their cited source lines.
+
+    Citation ``line`` is the 1-based line of the input text (for ``.docx``, the paragraph
+    in document order, empty paragraphs included), or None when the brief does not track
+    line numbers.
+    """
+    with stage("format"):
+        ktas = _build_ktas(brief, max_ktas=max_ktas)
+        with stage("citation"):
+            source_ids = _kta_source_ids(ktas, brief, citation_engine)
+        numbers = brief.source_line_numbers
+        document: dict[str, Any] = {
+            "version": BRIEF_DOCUMENT_VERSION,
+            "mode": mode.value,
+            "source": str(source_path),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "framing": _MODE_DESCRIPTIONS[mode],
+            "ktas": [
+                {
+                    "text": kta,
+                    "citation": None
+                    if line_id is None
+                    else {
+                        "text": brief.source_lines[line_id],
+                        "line": numbers[line_id] if numbers is not None else None,
+                    },
+                }
+                for kta, line_id in zip(ktas, source_ids)
+            ],
+            "sections": {name: list(getattr(brief, name)) for name in _SECTION_FIELDS},
+        }
+        if email_ready:
+            document["email_draft"] = _build_email_draft(brief, mode)
+        return document
+
+
 def format_markdown(
     brief: Brief,
     mode: Mode,
     source_path: Path,
     max_ktas: int = 4,
     email_ready: bool = False,
+    citation_engine: str = "overlap",
 ) -> str:
     """Format brief sections into markdown output."""
     generated_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -35,18 +108,21 @@ def format_markdown(
         "",
     ]
 
-    ktas = _build_ktas(brief, max_ktas=max_ktas)
-    _append_section(lines, "Key Takeaways (KTAs)", ktas)
-    _append_section(lines, "KTA Source Snippets", _build_kta_citations(ktas, brief.source_lines))
-    _append_section(lines, "Situation", brief.situation)
-    _append_section(lines, "Key Findings", brief.key_findings)
-    _append_section(lines, "Risks", brief.risks)
-    _append_section(lines, "Open Questions", brief.open_questions)
-    _append_section(lines, "Next Steps", brief.next_steps)
-    if email_ready:
-        _append_section(lines, "Team Update Email Draft", _build_email_draft(brief, mode))
+    with stage("format"):
+        ktas = _build_ktas(brief, max_ktas=max_ktas)
+        _append_section(lines, "Key Takeaways (KTAs)", ktas)
+        with stage("citation"):
+            citations = _build_kta_citations(ktas, brief, citation_engine)
+        _append_section(lines, "KTA Source Snippets", citations)
+        _append_section(lines, "Situation", brief.situation)
+        _append_section(lines, "Key Findings", brief.key_findings)
+        _append_section(lines, "Risks", brief.risks)
+        _append_section(lines, "Open Questions", brief.open_questions)
+        _append_section(lines, "Next Steps", brief.next_steps)
+        if email_ready:
+            _append_section(lines, "Team Update Email Draft", _build_email_draft(brief, mode))
 
-    return "\n".join(lines).strip() + "\n"
+        return "\n".join(lines).strip() + "\n"
 
 
 def _append_section(lines: list[str], title: str, items: list[str]) -> None:
@@ -71,38 +147,25 @@ def _build_ktas(brief: Brief, max_ktas: int) -> list[str]:
     return unique[:max_ktas] if unique else ["No clear input provided."]
 
 
-def _build_kta_citations(ktas: list[str], source_lines: list[str]) -> list[str]:
-    """Create short source snippets for each KTA using lexical overlap."""
-    if not source_lines:
+def _build_kta_citations(ktas: list[str], brief: Brief, engine_name: str = "overlap") -> list[str]:
+    """Create short source snippets for each KTA using the selected citation engine."""
+    if not brief.source_lines:
         return ["No source snippets available."]
     citations: list[str] = []
-    for idx, kta in enumerate(ktas, start=1):
-        best = _best_source_line(kta, source_lines)
+    for idx, line_id in enumerate(_kta_source_ids(ktas, brief, engine_name), start=1):
+        best = brief.source_lines[line_id] if line_id is not None else ""
         snippet = _truncate(best, 170) if best else "No matching source line found."
         citations.append(f"KTA {idx}: {snippet}")
     return citations
 
 
-def _best_source_line(kta: str, source_lines: list[str]) -> str:
-    """Select source line with highest token overlap for the KTA."""
-    kta_tokens = _tokenize(kta)
-    best_line = ""
-    best_score = -1.0
-    for line in source_lines:
-        line_tokens = _tokenize(line)
-        if not line_tokens:
-            continue
-        overlap = len(kta_tokens & line_tokens)
-        score = overlap / max(1, len(kta_tokens))
-        if score > best_score:
-            best_score = score
-            best_line = line
-    return best_line
-
-
-def _tokenize(text: str) -> set[str]:
-    """Tokenize text into lowercase meaningful words."""
-    return {token.lower() for token in re.findall(r"[A-Za-z0-9]+", text) if len(token) >= 3}
+def _kta_source_ids(ktas: list[str], brief: Brief, engine_name: str = "overlap") -> list[int | None]:
+    """Return the index into ``brief.source_lines`` that best supports each KTA."""
+    if not brief.source_lines:
+        return [None] * len(ktas)
+    index = brief.citation_index if brief.citation_index is not None else CitationIndex(brief.source_lines)
+    engine = build_citation_engine(index, engine_name)
+    return [engine.best_line_id(kta) for kta in ktas]
 
 
 def _truncate(text: str, max_len: int) -> str:
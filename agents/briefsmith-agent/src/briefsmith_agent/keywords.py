@@ -0,0 +1,266 @@
+"""Section keyword matching and loadable keyword profiles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Sequence
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10: TOML profiles need the tomli backport; JSON always works.
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+from .errors import FileReadError, InputValidationError
+from .models import Mode
+
+SECTIONS = ("situation", "key_findings", "risks", "open_questions", "next_steps")
+PROFILE_SUFFIXES = (".toml", ".json")
+
+_WORD_RE = re.compile(r"\w+")
+_KEYWORD_RE = re.compile(r"\w(?:.*\w)?", re.DOTALL)
+_PROFILE_KEYS = {"name", "extends_defaults", "keywords", "limits", "modes"}
+_MODE_KEYS = {"keywords", "limits"}
+# Trie key for the keyword that ends at a node; child keys are (separator, word) tuples.
+_TERMINAL = None
+
+
+class KeywordMatcher:
+    """Whole-word keyword matcher compiled once per vocabulary.
+
+    Single-word keywords are a token dictionary lookup. Multi-word keywords such as
+    ``follow-up`` or ``working capital`` live in a token trie keyed by head word and
+    the exact separator between words, so matching cost depends on the words in a
+    line rather than on how many keywords the vocabulary holds.
+    """
+
+    __slots__ = ("sections", "_single", "_phrases", "_heads", "_priority")
+
+    def __init__(self, section_keywords: Mapping[str, Iterable[str]], priority: Sequence[str]) -> None:
+        self.sections = tuple(section_keywords)
+        single: dict[str, list[int]] = {}
+        phrases: dict[str, dict[object, Any]] = {}
+        for idx, keywords in enumerate(section_keywords.values()):
+            for keyword in sorted(keywords):
+                words, separators = _split_keyword(keyword)
+                if not separators:
+                    single.setdefault(words[0], []).append(idx)
+                    continue
+                node = phrases.setdefault(words[0], {})
+                for separator, word in zip(separators, words[1:]):
+                    node = node.setdefault((separator, word), {})
+                terminal = node.setdefault(_TERMINAL, (keyword, []))
+                terminal[1].append(idx)
+        self._single = {keyword: tuple(indexes) for keyword, indexes in single.items()}
+        self._phrases = phrases
+        # Set-vs-set isdisjoint iterates the smaller side; against the dict it would walk every head.
+        self._heads = frozenset(phrases)
+        self._priority = tuple((self.sections.index(section), section) for section in priority)
+
+    def scan(self, lower: str) -> tuple[int, ...]:
+        """Return the distinct keyword hit counts per section."""
+        counts = [0] * len(self.sections)
+        tokens = frozenset(_WORD_RE.findall(lower))
+        single = self._single
+        for token in tokens:
+            for idx in single.get(token, ()):
+                counts[idx] += 1
+        if not tokens.isdisjoint(self._heads):
+            for indexes in self._match_phrases(lower):
+                for idx in indexes:
+                    counts[idx] += 1
+        return tuple(counts)
+
+    def section_for(self, hits: tuple[int, ...], has_question_mark: bool) -> str | None:
+        """Return the highest-priority section for precomputed keyword hits."""
+        if has_question_mark:
+            return "open_questions"
+        for idx, section in self._priority:
+            if hits[idx]:
+                return section
+        return None
+
+    def _match_phrases(self, lower: str) -> list[list[int]]:
+        """Walk the phrase trie from every head word and return section indexes per distinct match."""
+        words = list(_WORD_RE.finditer(lower))
+        found: dict[str, tuple[str, list[int]]] = {}
+        for position, match in enumerate(words):
+            node = self._phrases.get(match.group())
+            if node is None:
+                continue
+            end = match.end()
+            for following in words[position + 1 :]:
+                node = node.get((_normalize_separator(lower[end : following.start()]), following.group()))
+                if node is None:
+                    break
+                terminal = node.get(_TERMINAL)
+                if terminal is not None:
+                    found[terminal[0]] = terminal
+                end = following.end()
+        return [indexes for _, indexes in found.values()]
+
+
+@dataclass(slots=True)
+class KeywordProfile:
+    """Custom section vocabulary and limits, optionally per mode, loaded from TOML or JSON."""
+
+    name: str
+    digest: str
+    extends_defaults: bool = True
+    keywords: dict[str, frozenset[str]] = field(default_factory=dict)
+    limits: dict[str, int] = field(default_factory=dict)
+    mode_keywords: dict[str, dict[str, frozenset[str]]] = field(default_factory=dict)
+    mode_limits: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def section_keywords(self, mode: Mode, defaults: Mapping[str, Iterable[str]]) -> dict[str, frozenset[str]]:
+        """Return the effective keywords per section for a mode."""
+        resolved = {}
+        mode_keywords = self.mode_keywords.get(mode.value, {})
+        for section in SECTIONS:
+            base = frozenset(defaults[section]) if self.extends_defaults else frozenset()
+            resolved[section] = base | self.keywords.get(section, frozenset()) | mode_keywords.get(section, frozenset())
+        return resolved
+
+    def section_limits(self, mode: Mode, defaults: Mapping[str, int]) -> dict[str, int]:
+        """Return the effective bullet limits per section for a mode."""
+        return {**defaults, **self.limits, **self.mode_limits.get(mode.value, {})}
+
+
+_LOADED_PROFILES: dict[tuple[str, int, int], KeywordProfile] = {}
+
+
+def load_keyword_profile(path: Path) -> KeywordProfile:
+    """Load and validate a keyword profile, reusing the parsed profile while the file is unchanged."""
+    if path.suffix.lower() not in PROFILE_SUFFIXES:
+        raise InputValidationError(f"Expected a .toml or .json keyword profile, got: {path}")
+    try:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = _LOADED_PROFILES.get(key)
+        if cached is not None:
+            return cached
+        data = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise InputValidationError(f"Keyword profile not found: {path}") from exc
+    except OSError as exc:
+        raise FileReadError(f"Failed to read keyword profile: {path}") from exc
+
+    profile = parse_keyword_profile(_decode_profile(data, path), default_name=path.stem)
+    _LOADED_PROFILES[key] = profile
+    return profile
+
+
+def parse_keyword_profile(raw: object, default_name: str = "custom") -> KeywordProfile:
+    """Validate a decoded profile document and build a profile whose digest covers its content."""
+    if not isinstance(raw, dict):
+        raise InputValidationError("Keyword profile must be a table/object.")
+    _reject_unknown(raw, _PROFILE_KEYS, "keyword profile")
+    name = raw.get("name", default_name)
+    extends_defaults = raw.get("extends_defaults", True)
+    if not isinstance(name, str) or not isinstance(extends_defaults, bool):
+        raise InputValidationError("Keyword profile 'name' must be a string and 'extends_defaults' a boolean.")
+
+    keywords = _parse_keywords(raw.get("keywords", {}), "keywords")
+    limits = _parse_limits(raw.get("limits", {}), "limits")
+    mode_keywords: dict[str, dict[str, frozenset[str]]] = {}
+    mode_limits: dict[str, dict[str, int]] = {}
+    modes = raw.get("modes", {})
+    if not isinstance(modes, dict):
+        raise InputValidationError("Keyword profile 'modes' must be a table/object.")
+    for mode_name, overrides in modes.items():
+        if mode_name not in {mode.value for mode in Mode}:
+            raise InputValidationError(f"Unknown mode in keyword profile: {mode_name}")
+        if not isinstance(overrides, dict):
+            raise InputValidationError(f"Keyword profile 'modes.{mode_name}' must be a table/object.")
+        _reject_unknown(overrides, _MODE_KEYS, f"modes.{mode_name}")
+        mode_keywords[mode_name] = _parse_keywords(overrides.get("keywords", {}), f"modes.{mode_name}.keywords")
+        mode_limits[mode_name] = _parse_limits(overrides.get("limits", {}), f"modes.{mode_name}.limits")
+
+    canonical = {
+        "extends_defaults": extends_defaults,
+        "keywords": {section: sorted(words) for section, words in keywords.items()},
+        "limits": limits,
+        "modes": {
+            mode_name: {
+                "keywords": {section: sorted(words) for section, words in mode_keywords[mode_name].items()},
+                "limits": mode_limits[mode_name],
+            }
+            for mode_name in mode_keywords
+        },
+    }
+    digest = hashlib.sha256(json.dumps(canonical, sort_keys=True).encode("utf-8")).hexdigest()
+    return KeywordProfile(name, digest, extends_defaults, keywords, limits, mode_keywords, mode_limits)
+
+
+def _decode_profile(data: bytes, path: Path) -> object:
+    """Decode TOML or JSON profile bytes."""
+    try:
+        if path.suffix.lower() == ".json":
+            return json.loads(data.decode("utf-8-sig"))
+        if tomllib is None:
+            raise InputValidationError("TOML keyword profiles need Python 3.11+ or the tomli package; use JSON.")
+        return tomllib.loads(data.decode("utf-8-sig"))
+    except InputValidationError:
+        raise
+    except (UnicodeDecodeError, ValueError) as exc:
+        raise InputValidationError(f"Invalid keyword profile {path}: {exc}") from exc
+
+
+def _parse_keywords(raw: object, where: str) -> dict[str, frozenset[str]]:
+    """Validate a section -> keyword list table."""
+    if not isinstance(raw, dict):
+        raise InputValidationError(f"Keyword profile '{where}' must be a table/object.")
+    _reject_unknown(raw, set(SECTIONS), where)
+    parsed = {}
+    for section, words in raw.items():
+        if not isinstance(words, list) or not all(isinstance(word, str) for word in words):
+            raise InputValidationError(f"Keyword profile '{where}.{section}' must be a list of strings.")
+        normalized = set()
+        for word in words:
+            keyword = word.strip().lower()
+            if not _KEYWORD_RE.fullmatch(keyword):
+                raise InputValidationError(
+                    f"Keyword {word!r} in '{where}.{section}' must start and end with a letter or digit."
+                )
+            normalized.add(keyword)
+        parsed[section] = frozenset(normalized)
+    return parsed
+
+
+def _parse_limits(raw: object, where: str) -> dict[str, int]:
+    """Validate a section -> bullet limit table."""
+    if not isinstance(raw, dict):
+        raise InputValidationError(f"Keyword profile '{where}' must be a table/object.")
+    _reject_unknown(raw, set(SECTIONS), where)
+    for section, limit in raw.items():
+        if not isinstance(limit, int) or isinstance(limit, bool) or limit < 1:
+            raise InputValidationError(f"Keyword profile '{where}.{section}' must be an integer >= 1.")
+    return dict(raw)
+
+
+def _reject_unknown(raw: dict[str, object], allowed: set[str], where: str) -> None:
+    """Fail on misspelled keys instead of silently ignoring them."""
+    unknown = sorted(set(raw) - allowed)
+    if unknown:
+        raise InputValidationError(f"Unknown key(s) in {where}: {', '.join(unknown)}")
+
+
+def _split_keyword(keyword: str) -> tuple[list[str], list[str]]:
+    """Split a keyword into its words and the normalized separators between them."""
+    matches = list(_WORD_RE.finditer(keyword))
+    words = [match.group() for match in matches]
+    separators = [
+        _normalize_separator(keyword[left.end() : right.start()]) for left, right in zip(matches, matches[1:])
+    ]
+    return words, separators
+
+
+def _normalize_separator(separator: str) -> str:
+    """Treat any run of whitespace between words as a single space."""
+    return " " if separator.isspace() else separator
@@ -0,0 +1,142 @@
+"""On-disk manifest that lets batch runs skip unchanged inputs."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Mapping, Sequence
+
+from . import __version__
+from .errors import FileReadError, OutputWriteError
+from .profiling import count, stage
+
+MANIFEST_NAME = ".briefsmith-manifest.json"
+_MANIFEST_VERSION = 1
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(slots=True)
+class SourceFingerprint:
+    """Size, modification time and content hash of one input file."""
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """Manifest record mapping one source file to its generated brief."""
+
+    size: int
+    mtime_ns: int
+    content_hash: str
+    mode: str
+    options: str
+    output_name: str
+    extra_output_names: list[str] = field(default_factory=list)
+
+
+class BatchManifest:
+    """Manifest of generated briefs, keyed by resolved source path."""
+
+    def __init__(self, output_dir: Path, entries: dict[str, ManifestEntry] | None = None) -> None:
+        self.output_dir = output_dir
+        self.entries = entries if entries is not None else {}
+
+    @property
+    def path(self) -> Path:
+        """Location of the manifest file."""
+        return self.output_dir / MANIFEST_NAME
+
+    @classmethod
+    def load(cls, output_dir: Path) -> BatchManifest:
+        """Load the manifest from an output directory; unreadable manifests start empty."""
+        try:
+            payload = json.loads((output_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+            if payload.get("version") != _MANIFEST_VERSION:
+                return cls(output_dir)
+            entries = {source: ManifestEntry(**entry) for source, entry in payload["entries"].items()}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            return cls(output_dir)
+        return cls(output_dir, entries)
+
+    def lookup(self, source: Path, options: str) -> ManifestEntry | None:
+        """Return the entry for a source when its options match and its brief still exists."""
+        entry = self.entries.get(_source_key(source))
+        if entry is None or entry.options != options:
+            return None
+        if not all((self.output_dir / name).is_file() for name in (entry.output_name, *entry.extra_output_names)):
+            return None
+        return entry
+
+    def record(
+        self,
+        source: Path,
+        fingerprint: SourceFingerprint,
+        mode: str,
+        options: str,
+        output_path: Path,
+        extra_output_paths: Sequence[Path] = (),
+    ) -> None:
+        """Record the brief (or, for multi-mode runs, briefs) generated for a source file."""
+        self.entries[_source_key(source)] = ManifestEntry(
+            size=fingerprint.size,
+            mtime_ns=fingerprint.mtime_ns,
+            content_hash=fingerprint.content_hash,
+            mode=mode,
+            options=options,
+            output_name=output_path.name,
+            extra_output_names=[path.name for path in extra_output_paths],
+        )
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        payload = {
+            "version": _MANIFEST_VERSION,
+            "entries": {source: asdict(entry) for source, entry in sorted(self.entries.items())},
+        }
+        temp_path = self.path.with_name(f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError as exc:
+            raise OutputWriteError(f"Failed to write batch manifest in: {self.output_dir}") from exc
+
+
+def options_fingerprint(options: Mapping[str, Any]) -> str:
+    """Hash run options together with the package version."""
+    canonical = json.dumps({"version": __version__, **options}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def stat_matches(entry: ManifestEntry, path: Path) -> bool:
+    """Return True when size and mtime match the manifest entry."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    return stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns
+
+
+def fingerprint_file(path: Path) -> SourceFingerprint:
+    """Stat and hash a source file without loading it fully into memory."""
+    digest = hashlib.sha256()
+    try:
+        with stage("fingerprint"), path.open("rb") as handle:
+            stat = os.fstat(handle.fileno())
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError as exc:
+        raise FileReadError(f"Failed to read input file: {path}") from exc
+    count(bytes_read=stat.st_size)
+    return SourceFingerprint(size=stat.st_size, mtime_ns=stat.st_mtime_ns, content_hash=digest.hexdigest())
+
+
+def _source_key(source: Path) -> str:
+    """Normalize a source path into a manifest key."""
+    return source.resolve().as_posix()
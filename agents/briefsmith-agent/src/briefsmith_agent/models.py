@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 
+from .citations import CitationIndex
+
 
 class Mode(str, Enum):
     """Supported brief generation modes."""
@@ -24,3 +26,6 @@ class Brief:
     open_questions: list[str]
     next_steps: list[str]
     source_lines: list[str]
+    citation_index: CitationIndex | None = None
+    # 1-based input line number of each ``source_lines`` entry, when known.
+    source_line_numbers: list[int] | None = None
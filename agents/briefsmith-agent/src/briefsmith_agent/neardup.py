@@ -0,0 +1,103 @@
+"""MinHash/LSH near-duplicate detection over word-shingle sets of lines."""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_NUM_PERM = 32
+_SEED = 1729
+_SHINGLE_SIZE = 2
+_WORD_RE = re.compile(r"\w+")
+
+
+class NearDuplicateFilter:
+    """Flag token sets whose Jaccard similarity to an earlier kept set meets a threshold.
+
+    Each set gets a MinHash signature; signatures are split into LSH bands so that only
+    sets sharing a band bucket are compared exactly. Work per line is independent of the
+    number of lines kept, which keeps large buckets sub-quadratic.
+    """
+
+    __slots__ = ("threshold", "_rows", "_buckets", "_kept", "_token_vectors", "_perms")
+
+    def __init__(self, threshold: float) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("Near-duplicate threshold must be in (0, 1].")
+        self.threshold = threshold
+        self._rows = _rows_per_band(threshold)
+        self._buckets: list[dict[tuple[int, ...], list[int]]] = [{} for _ in range(_NUM_PERM // self._rows)]
+        self._kept: list[frozenset[str]] = []
+        self._token_vectors: dict[str, tuple[int, ...]] = {}
+        rng = random.Random(_SEED)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(_NUM_PERM)]
+
+    def check_and_add(self, tokens: frozenset[str]) -> bool:
+        """Return True if ``tokens`` near-duplicates a kept set; otherwise keep it."""
+        if not tokens:
+            return False
+        signature = self._signature(tokens)
+        rows = self._rows
+        band_keys = [signature[start : start + rows] for start in range(0, _NUM_PERM, rows)]
+        checked: set[int] = set()
+        for band, key in zip(self._buckets, band_keys):
+            for kept_id in band.get(key, ()):
+                if kept_id in checked:
+                    continue
+                checked.add(kept_id)
+                if jaccard_similarity(tokens, self._kept[kept_id]) >= self.threshold:
+                    return True
+
+        kept_id = len(self._kept)
+        self._kept.append(tokens)
+        for band, key in zip(self._buckets, band_keys):
+            band.setdefault(key, []).append(kept_id)
+        return False
+
+    def _signature(self, tokens: frozenset[str]) -> tuple[int, ...]:
+        """MinHash signature: element-wise minimum of cached per-token hash vectors."""
+        vectors = self._token_vectors
+        token_vectors = []
+        for token in tokens:
+            vector = vectors.get(token)
+            if vector is None:
+                value = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big")
+                vector = tuple((a * value + b) % _MERSENNE_PRIME for a, b in self._perms)
+                vectors[token] = vector
+            token_vectors.append(vector)
+        return tuple(map(min, zip(*token_vectors)))
+
+
+def word_shingles(lower: str) -> frozenset[str]:
+    """Return the line's word bigrams, or its words when it has fewer than two.
+
+    Shingles keep word order, so lines that reuse the same words in a different
+    arrangement ("margin up, churn down" / "churn up, margin down") do not match.
+    """
+    words = _WORD_RE.findall(lower)
+    if len(words) < _SHINGLE_SIZE:
+        return frozenset(words)
+    return frozenset(" ".join(words[start : start + _SHINGLE_SIZE]) for start in range(len(words) - _SHINGLE_SIZE + 1))
+
+
+def _rows_per_band(threshold: float) -> int:
+    """Pick rows per band so the LSH S-curve midpoint sits just below the threshold."""
+    best_rows = 1
+    best_gap = float("inf")
+    for rows in (1, 2, 4, 8, 16, 32):
+        bands = _NUM_PERM // rows
+        midpoint = (1.0 / bands) ** (1.0 / rows)
+        # Prefer midpoints below the threshold to limit false negatives.
+        gap = abs(threshold - 0.1 - midpoint)
+        if gap < best_gap:
+            best_rows, best_gap = rows, gap
+    return best_rows
+
+
+def jaccard_similarity(left: frozenset[str], right: frozenset[str]) -> float:
+    """Exact Jaccard similarity of two token sets."""
+    shared = len(left & right)
+    union = len(left) + len(right) - shared
+    return shared / union if union else 0.0
@@ -0,0 +1,171 @@
+"""Loadable noise and filler phrase dictionaries matched with a word-level Aho-Corasick automaton."""
+
+from __future__ import annotations
+
+from collections import deque
+import hashlib
+import re
+from pathlib import Path
+from typing import Iterable
+
+from .errors import FileReadError, InputValidationError
+
+_WORD_RE = re.compile(r"\w+")
+# Phrase kinds, chosen by an optional one-character marker in front of the phrase.
+_SKIP = 0
+_SKIP_AT_START = 1
+_FILLER = 2
+_MARKERS = {"^": _SKIP_AT_START, "~": _FILLER}
+_KIND_MARKERS = {_SKIP: "", _SKIP_AT_START: "^", _FILLER: "~"}
+
+
+class NoiseDictionary:
+    """Noise and filler phrases compiled into one automaton that scans each line once.
+
+    Phrases are matched as whole-word sequences, case-insensitively, ignoring the
+    punctuation and spacing between words. Each entry is one of:
+
+    - ``phrase``: drop any line containing the phrase
+    - ``^phrase``: drop lines whose content starts with the phrase
+    - ``~phrase``: remove the phrase from the line as filler
+    """
+
+    __slots__ = ("digest", "entries", "_goto", "_fail", "_output")
+
+    def __init__(self, entries: Iterable[str]) -> None:
+        phrases: dict[tuple[str, ...], set[int]] = {}
+        for entry in entries:
+            kind, words = _parse_entry(entry)
+            phrases.setdefault(words, set()).add(kind)
+        self.entries = tuple(
+            sorted(f"{_KIND_MARKERS[kind]}{' '.join(words)}" for words, kinds in phrases.items() for kind in kinds)
+        )
+        self.digest = hashlib.sha256("\n".join(self.entries).encode("utf-8")).hexdigest()
+
+        goto: list[dict[str, int]] = [{}]
+        output: list[list[tuple[int, int]]] = [[]]
+        for words, kinds in phrases.items():
+            state = 0
+            for word in words:
+                following = goto[state].get(word)
+                if following is None:
+                    following = goto[state][word] = len(goto)
+                    goto.append({})
+                    output.append([])
+                state = following
+            output[state].extend((len(words), kind) for kind in sorted(kinds))
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, following in goto[state].items():
+                queue.append(following)
+                fallback = fail[state]
+                while fallback and word not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[following] = goto[fallback].get(word, 0)
+                output[following].extend(output[fail[following]])
+
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(matches) for matches in output]
+
+    def clean(self, line: str) -> str | None:
+        """Return ``line`` without filler phrases, or None when a noise phrase marks it for dropping."""
+        goto, fail, output = self._goto, self._fail, self._output
+        if line.isascii():
+            words = _WORD_RE.findall(line.lower())
+        else:
+            words = [word.casefold() for word in _WORD_RE.findall(line)]
+        fillers: list[tuple[int, int]] = []
+        state = 0
+        for position, word in enumerate(words):
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for length, kind in output[state]:
+                start = position - length + 1
+                if kind == _SKIP or (kind == _SKIP_AT_START and start == 0):
+                    return None
+                if kind == _FILLER:
+                    fillers.append((start, position))
+        if not fillers:
+            return line
+        # Token boundaries do not depend on case, so spans map back onto the original line.
+        matches = list(_WORD_RE.finditer(line))
+        return _remove_spans(line, [(matches[start].start(), matches[end].end()) for start, end in fillers])
+
+    def __reduce__(self) -> tuple[object, ...]:
+        """Pickle as the phrase list so batch workers rebuild the automaton once per process."""
+        return _restore, (self.digest, self.entries)
+
+
+# Compiled dictionaries by digest, shared by loads and unpickles within a process.
+_COMPILED: dict[str, NoiseDictionary] = {}
+
+
+def _restore(digest: str, entries: tuple[str, ...]) -> NoiseDictionary:
+    """Return the compiled dictionary for ``digest``, building it on first use."""
+    dictionary = _COMPILED.get(digest)
+    if dictionary is None:
+        dictionary = _COMPILED[digest] = NoiseDictionary(entries)
+    return dictionary
+
+
+_LOADED: dict[tuple[str, int, int], NoiseDictionary] = {}
+
+
+def load_noise_dictionary(path: Path) -> NoiseDictionary:
+    """Load a phrase file (one entry per line, ``#`` comments), reusing it while the file is unchanged."""
+    try:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        cached = _LOADED.get(key)
+        if cached is not None:
+            return cached
+        text = path.read_text(encoding="utf-8-sig")
+    except FileNotFoundError as exc:
+        raise InputValidationError(f"Noise phrase file not found: {path}") from exc
+    except (OSError, UnicodeDecodeError) as exc:
+        raise FileReadError(f"Failed to read noise phrase file: {path}") from exc
+
+    entries = []
+    for number, raw_line in enumerate(text.splitlines(), start=1):
+        entry = raw_line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        try:
+            _parse_entry(entry)
+        except InputValidationError as exc:
+            raise InputValidationError(f"{path}:{number}: {exc}") from exc
+        entries.append(entry)
+    dictionary = NoiseDictionary(entries)
+    dictionary = _LOADED[key] = _COMPILED.setdefault(dictionary.digest, dictionary)
+    return dictionary
+
+
+def _parse_entry(entry: str) -> tuple[int, tuple[str, ...]]:
+    """Split an entry into its kind and casefolded words."""
+    entry = entry.strip()
+    kind = _MARKERS.get(entry[:1], _SKIP)
+    if kind != _SKIP:
+        entry = entry[1:]
+    words = tuple(word.casefold() for word in _WORD_RE.findall(entry))
+    if not words:
+        raise InputValidationError(f"Noise phrase needs at least one word: {entry!r}")
+    return kind, words
+
+
+def _remove_spans(line: str, spans: list[tuple[int, int]]) -> str:
+    """Replace possibly overlapping character spans with single spaces."""
+    pieces = []
+    cursor = 0
+    for start, end in sorted(spans):
+        if end <= cursor:
+            continue
+        pieces.append(line[cursor : max(start, cursor)])
+        pieces.append(" ")
+        cursor = end
+    pieces.append(line[cursor:])
+    return "".join(pieces)
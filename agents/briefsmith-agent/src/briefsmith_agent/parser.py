@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import heapq
+from itertools import repeat
 import re
+from typing import Iterable, Iterator, Sequence
 
+from .citations import CitationIndex
+from .keywords import KeywordMatcher, KeywordProfile
 from .models import Brief, Mode
+from .neardup import NearDuplicateFilter, jaccard_similarity, word_shingles
+from .noise import NoiseDictionary
+from .profiling import count, stage
 
 PLACEHOLDER = "No clear input provided."
-_BULLET_PREFIX_RE = re.compile(r"^\s*(?:[-*]\s+|\d+[.)]\s+)")
-_TIMESTAMP_TOKEN_RE = re.compile(
-    r"^\s*\[?\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM|am|pm)?\]?\s*(?:-\s*)?"
-)
 _METADATA_LINE_RE = re.compile(
     r"^\s*(?:meeting (?:started|ended)|recording (?:started|stopped)|"
     r"joined the meeting|left the meeting|transcript(?:ion)?|attendees?:)",
@@ -22,6 +26,16 @@ _DOCUMENT_NOISE_RE = re.compile(
     re.IGNORECASE,
 )
 _FILLER_WORD_RE = re.compile(r"\b(?:um+|uh+|like|you know|sort of|kind of)\b", re.IGNORECASE)
+# Fused cleaning stage: one anchored match for metadata and document noise, and one for
+# a bullet marker followed by any run of timestamps.
+_SKIP_LINE_RE = re.compile(f"{_METADATA_LINE_RE.pattern}|{_DOCUMENT_NOISE_RE.pattern}", re.IGNORECASE)
+_LINE_PREFIX_RE = re.compile(
+    r"(?:[-*]\s+|\d+[.)]\s+)?"
+    r"(?:\s*\[?\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM|am|pm)?\]?\s*(?:-\s*)?)*"
+)
+# Characters that IGNORECASE matches to "i" but casefold() does not map to it.
+_DOTTED_I_VARIANTS = ("\u0130", "\u0131")
+_ASCII_LETTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
 _SPEAKER_LABEL_RE = re.compile(r"^(?:speaker \d+|host|moderator|me)$", re.IGNORECASE)
 _SPEAKER_NAME_RE = re.compile(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){0,2}$")
 _SECTION_PREFIX_WORDS = {"background", "context", "risk", "finding", "open", "next", "situation"}
@@ -96,73 +110,326 @@ _SECTION_LIMITS = {
 }
 
 
-def parse_notes(raw_text: str, mode: Mode, max_bullets: int | None = None) -> Brief:
-    """Parse unstructured notes into a concise structured brief object."""
-    lines = _normalize_lines(raw_text)
-
-    buckets: dict[str, list[str]] = {
-        "situation": [],
-        "key_findings": [],
-        "risks": [],
-        "open_questions": [],
-        "next_steps": [],
-    }
-    unclassified: list[str] = []
+_SECTION_KEYWORDS = {
+    "situation": _SITUATION_KEYWORDS,
+    "key_findings": _FINDINGS_KEYWORDS,
+    "risks": _RISK_KEYWORDS,
+    "open_questions": _QUESTION_KEYWORDS,
+    "next_steps": _NEXT_STEPS_KEYWORDS,
+}
 
+# Classification priority when a line hits keywords from several sections.
+_CLASSIFY_PRIORITY = ("open_questions", "risks", "next_steps", "situation", "key_findings")
+
+_SECTION_INDEX = {section: idx for idx, section in enumerate(_SECTION_KEYWORDS)}
+_KEYWORD_WEIGHT = 0.4
+# Heap selection only pays off once buckets are large relative to the section limit.
+_HEAP_SELECT_MIN_ITEMS = 512
+_HEAP_SELECT_RATIO = 4
+
+_DEDUPE_STRIP_RE = re.compile(r"[^a-z0-9]+")
+
+
+_MATCHER = KeywordMatcher(_SECTION_KEYWORDS, _CLASSIFY_PRIORITY)
+# Compiled (matcher, limits) per keyword profile digest and mode.
+_PROFILE_TABLES: dict[tuple[str, Mode], tuple[KeywordMatcher, dict[str, int]]] = {}
+_PROFILE_MATCHERS: dict[tuple[str, Mode | None], KeywordMatcher] = {}
+
+
+class _LineFeatures:
+    """Per-line features computed once and shared by classification, ranking and dedupe."""
+
+    __slots__ = ("text", "hits", "has_digit", "length", "has_ratio", "has_question", "dedupe_key", "_shingles")
+
+    def __init__(self, line: str, matcher: KeywordMatcher = _MATCHER) -> None:
+        lower = line.lower()
+        self.text = line
+        self.hits = matcher.scan(lower)
+        self.has_digit = any(char.isdigit() for char in line)
+        self.length = len(line)
+        self.has_ratio = " vs " in lower or "%" in line
+        self.has_question = "?" in line
+        self.dedupe_key = _DEDUPE_STRIP_RE.sub("", lower)
+        self._shingles: frozenset[str] | None = None
+
+    @property
+    def shingles(self) -> frozenset[str]:
+        """Word bigrams for near-duplicate checks, built on first use."""
+        if self._shingles is None:
+            self._shingles = word_shingles(self.text.lower())
+        return self._shingles
+
+
+def parse_notes(
+    raw_text: str,
+    mode: Mode,
+    max_bullets: int | None = None,
+    dedupe_threshold: float = 1.0,
+    keyword_profile: KeywordProfile | None = None,
+    noise_phrases: NoiseDictionary | None = None,
+) -> Brief:
+    """Parse unstructured notes into a concise structured brief object.
+
+    ``dedupe_threshold`` below 1.0 also drops lines whose word-bigram Jaccard similarity
+    to an earlier line in the same section reaches the threshold. ``keyword_profile``
+    swaps in custom section vocabulary and limits for ``mode``; ``noise_phrases`` drops
+    or strips extra boilerplate phrases during cleaning.
+    """
+    return parse_notes_modes(raw_text, (mode,), max_bullets, dedupe_threshold, keyword_profile, noise_phrases)[mode]
+
+
+def parse_notes_modes(
+    raw_text: str,
+    modes: Sequence[Mode],
+    max_bullets: int | None = None,
+    dedupe_threshold: float = 1.0,
+    keyword_profile: KeywordProfile | None = None,
+    noise_phrases: NoiseDictionary | None = None,
+) -> dict[Mode, Brief]:
+    """Parse notes once and build one brief per mode.
+
+    Cleaning, classification and the citation index are shared; only ranking and
+    limits run per mode. Modes with their own profile keywords are classified separately.
+    """
+    with stage("clean"):
+        lines, line_numbers = _normalize_lines(raw_text, noise_phrases)
+    count(lines=len(lines))
+
+    with stage("citation"):
+        citation_index = CitationIndex(lines)
+
+    classified: dict[KeywordMatcher, dict[str, list[_LineFeatures]]] = {}
+    briefs: dict[Mode, Brief] = {}
+    for mode in modes:
+        matcher, limits = _profile_tables(keyword_profile, mode)
+        buckets = classified.get(matcher)
+        if buckets is None:
+            with stage("classify"):
+                buckets = classified[matcher] = _classify_lines(lines, matcher)
+        with stage("rank"):
+            sections = _condense_buckets(buckets, mode, max_bullets, dedupe_threshold, limits)
+        _ensure_placeholders(sections)
+        briefs[mode] = _build_brief(sections, lines, citation_index, line_numbers)
+    return briefs
+
+
+def parse_note_lines(
+    lines: Iterable[str],
+    mode: Mode,
+    max_bullets: int | None = None,
+    dedupe_threshold: float = 1.0,
+    keyword_profile: KeywordProfile | None = None,
+    noise_phrases: NoiseDictionary | None = None,
+) -> Brief:
+    """Parse notes streamed line by line while keeping only bounded per-section state.
+
+    Each section keeps a top-K heap sized by its limit, so peak memory does not grow
+    with input size. ``source_lines`` holds only the retained candidates, which bounds
+    the citation index. Dedupe applies against retained candidates only.
+    """
+    return parse_note_lines_modes(lines, (mode,), max_bullets, dedupe_threshold, keyword_profile, noise_phrases)[mode]
+
+
+def parse_note_lines_modes(
+    lines: Iterable[str],
+    modes: Sequence[Mode],
+    max_bullets: int | None = None,
+    dedupe_threshold: float = 1.0,
+    keyword_profile: KeywordProfile | None = None,
+    noise_phrases: NoiseDictionary | None = None,
+) -> dict[Mode, Brief]:
+    """Stream notes once into bounded per-mode top-K state and build one brief per mode."""
+    groups: dict[KeywordMatcher, list[dict[str, _TopKSection]]] = {}
+    selectors: dict[Mode, dict[str, _TopKSection]] = {}
+    for mode in modes:
+        matcher, limits = _profile_tables(keyword_profile, mode)
+        selectors[mode] = {
+            section: _TopKSection(
+                _SECTION_INDEX[section],
+                max_bullets if max_bullets is not None else limits[section],
+                dedupe_threshold,
+            )
+            for section in _SECTION_KEYWORDS
+        }
+        groups.setdefault(matcher, []).append(selectors[mode])
+
+    # Reading, cleaning, classification and ranking interleave per line, so they share one stage.
+    # The input line number doubles as the sequence number: it orders lines the same way.
+    cleaned = 0
+    with stage("stream"):
+        for seq, line in _iter_clean_lines(_split_stream(lines), noise_phrases):
+            cleaned += 1
+            for matcher, group in groups.items():
+                features = _LineFeatures(line, matcher)
+                section = _classify_features(features, matcher)
+                for mode_selectors in group:
+                    if section is None:
+                        mode_selectors["key_findings"].offer(features, seq, unclassified=True)
+                    else:
+                        mode_selectors[section].offer(features, seq)
+    count(lines=cleaned)
+
+    briefs: dict[Mode, Brief] = {}
+    for mode, mode_selectors in selectors.items():
+        with stage("rank"):
+            sections = {
+                section: [_to_sendable_bullet(features.text) for features in selector.ranked()]
+                for section, selector in mode_selectors.items()
+            }
+        retained = sorted(
+            (seq, features.text) for selector in mode_selectors.values() for seq, features in selector.entries()
+        )
+        source_lines = [text for _, text in retained]
+        _ensure_placeholders(sections)
+        with stage("citation"):
+            citation_index = CitationIndex(source_lines)
+        briefs[mode] = _build_brief(sections, source_lines, citation_index, [seq for seq, _ in retained])
+    return briefs
+
+
+class _TopKSection:
+    """Bounded, dedupe-aware top-K selection for one streamed section."""
+
+    __slots__ = ("section_idx", "limit", "dedupe_threshold", "_heap", "_by_key")
+
+    def __init__(self, section_idx: int, limit: int, dedupe_threshold: float = 1.0) -> None:
+        self.section_idx = section_idx
+        self.limit = limit
+        self.dedupe_threshold = dedupe_threshold
+        # Min-heap entries: (score, -unclassified, -seq, features); the root is the weakest.
+        self._heap: list[tuple[float, int, int, _LineFeatures]] = []
+        self._by_key: dict[str, tuple[float, int, int, _LineFeatures]] = {}
+
+    def offer(self, features: _LineFeatures, seq: int, unclassified: bool = False) -> None:
+        """Consider one line for the section, mirroring batch dedupe and rank order."""
+        key = features.dedupe_key
+        if not key:
+            return
+        entry = (_salience_score(features, self.section_idx), -int(unclassified), -seq, features)
+        existing = self._by_key.get(key)
+        if existing is not None:
+            # Batch mode keeps the first line in bucket order, where classified lines
+            # precede unclassified ones.
+            if entry[1:3] <= existing[1:3]:
+                return
+            self._heap.remove(existing)
+            heapq.heapify(self._heap)
+            del self._by_key[key]
+        elif self.dedupe_threshold < 1.0 and any(
+            jaccard_similarity(features.shingles, retained[3].shingles) >= self.dedupe_threshold
+            for retained in self._heap
+        ):
+            return
+
+        if len(self._heap) < self.limit:
+            heapq.heappush(self._heap, entry)
+        elif entry[:3] > self._heap[0][:3]:
+            evicted = heapq.heapreplace(self._heap, entry)
+            del self._by_key[evicted[3].dedupe_key]
+        else:
+            return
+        self._by_key[key] = entry
+
+    def ranked(self) -> list[_LineFeatures]:
+        """Return retained lines from most to least salient."""
+        return [entry[3] for entry in sorted(self._heap, key=lambda entry: entry[:3], reverse=True)]
+
+    def entries(self) -> Iterator[tuple[int, _LineFeatures]]:
+        """Yield retained lines with their input sequence numbers."""
+        for entry in self._heap:
+            yield -entry[2], entry[3]
+
+
+def _profile_tables(profile: KeywordProfile | None, mode: Mode) -> tuple[KeywordMatcher, dict[str, int]]:
+    """Return the compiled matcher and section limits for a profile, compiling once per digest."""
+    if profile is None:
+        return _MATCHER, _SECTION_LIMITS[mode]
+    key = (profile.digest, mode)
+    tables = _PROFILE_TABLES.get(key)
+    if tables is None:
+        # Modes without their own keywords share one matcher, so multi-mode parses classify once.
+        matcher_key = (profile.digest, mode if profile.mode_keywords.get(mode.value) else None)
+        matcher = _PROFILE_MATCHERS.get(matcher_key)
+        if matcher is None:
+            matcher = KeywordMatcher(profile.section_keywords(mode, _SECTION_KEYWORDS), _CLASSIFY_PRIORITY)
+            _PROFILE_MATCHERS[matcher_key] = matcher
+        tables = _PROFILE_TABLES[key] = (matcher, profile.section_limits(mode, _SECTION_LIMITS[mode]))
+    return tables
+
+
+def _classify_lines(lines: list[str], matcher: KeywordMatcher) -> dict[str, list[_LineFeatures]]:
+    """Bucket lines by section; unclassified lines go to key findings after classified ones."""
+    buckets: dict[str, list[_LineFeatures]] = {section: [] for section in _SECTION_KEYWORDS}
+    unclassified: list[_LineFeatures] = []
     for line in lines:
-        section = _classify_line(line)
+        features = _LineFeatures(line, matcher)
+        section = _classify_features(features, matcher)
         if section is None:
-            unclassified.append(line)
+            unclassified.append(features)
             continue
-        buckets[section].append(line)
-
+        buckets[section].append(features)
     if unclassified:
         buckets["key_findings"].extend(unclassified)
+    return buckets
 
-    _condense_buckets(buckets, mode, max_bullets)
-
-    _ensure_placeholders(buckets)
 
+def _build_brief(
+    sections: dict[str, list[str]],
+    source_lines: list[str],
+    citation_index: CitationIndex,
+    line_numbers: list[int],
+) -> Brief:
+    """Assemble a brief from condensed sections."""
     return Brief(
-        situation=buckets["situation"],
-        key_findings=buckets["key_findings"],
-        risks=buckets["risks"],
-        open_questions=buckets["open_questions"],
-        next_steps=buckets["next_steps"],
-        source_lines=lines,
+        situation=sections["situation"],
+        key_findings=sections["key_findings"],
+        risks=sections["risks"],
+        open_questions=sections["open_questions"],
+        next_steps=sections["next_steps"],
+        source_lines=source_lines,
+        citation_index=citation_index,
+        source_line_numbers=line_numbers,
     )
 
 
-def _normalize_lines(raw_text: str) -> list[str]:
-    """Normalize text to meaningful non-empty lines."""
-    normalized: list[str] = []
-    for raw_line in raw_text.splitlines():
-        cleaned = _clean_transcript_line(raw_line)
-        if not cleaned:
-            continue
-        normalized.append(cleaned)
-    return normalized
+def _split_stream(lines: Iterable[str]) -> Iterator[str]:
+    """Split streamed chunks with the same line boundaries as ``str.splitlines``.
 
+    An empty chunk is an empty input line, so it still advances line numbering.
+    """
+    for chunk in lines:
+        yield from chunk.splitlines() or ("",)
 
-def _contains_any_keyword(line: str, keywords: set[str]) -> bool:
-    """Return True when line contains at least one keyword as a whole word."""
-    lower = line.lower()
-    return any(re.search(rf"\b{re.escape(keyword)}\b", lower) for keyword in keywords)
+
+def _normalize_lines(raw_text: str, noise: NoiseDictionary | None = None) -> tuple[list[str], list[int]]:
+    """Normalize text to meaningful non-empty lines and their 1-based input line numbers."""
+    lines: list[str] = []
+    numbers: list[int] = []
+    for number, raw_line in enumerate(raw_text.splitlines(), start=1):
+        cleaned = _clean_transcript_line(raw_line, noise)
+        if cleaned:
+            lines.append(cleaned)
+            numbers.append(number)
+    return lines, numbers
+
+
+def _iter_clean_lines(raw_lines: Iterable[str], noise: NoiseDictionary | None = None) -> Iterator[tuple[int, str]]:
+    """Yield cleaned, meaningful non-empty lines with their 1-based input line numbers."""
+    for number, raw_line in enumerate(raw_lines, start=1):
+        cleaned = _clean_transcript_line(raw_line, noise)
+        if not cleaned:
+            continue
+        yield number, cleaned
 
 
 def _classify_line(line: str) -> str | None:
     """Classify line to a section key."""
-    if "?" in line or _contains_any_keyword(line, _QUESTION_KEYWORDS):
-        return "open_questions"
-    if _contains_any_keyword(line, _RISK_KEYWORDS):
-        return "risks"
-    if _contains_any_keyword(line, _NEXT_STEPS_KEYWORDS):
-        return "next_steps"
-    if _contains_any_keyword(line, _SITUATION_KEYWORDS):
-        return "situation"
-    if _contains_any_keyword(line, _FINDINGS_KEYWORDS):
-        return "key_findings"
-    return None
+    return _classify_features(_LineFeatures(line))
+
+
+def _classify_features(features: _LineFeatures, matcher: KeywordMatcher = _MATCHER) -> str | None:
+    """Classify precomputed line features to a section key with the matcher that produced their hits."""
+    return matcher.section_for(features.hits, features.has_question)
 
 
 def _ensure_placeholders(buckets: dict[str, list[str]]) -> None:
@@ -172,53 +439,76 @@ def _ensure_placeholders(buckets: dict[str, list[str]]) -> None:
             items.append(PLACEHOLDER)
 
 
-def _condense_buckets(buckets: dict[str, list[str]], mode: Mode, max_bullets: int | None) -> None:
+def _condense_buckets(
+    buckets: dict[str, list[_LineFeatures]],
+    mode: Mode,
+    max_bullets: int | None,
+    dedupe_threshold: float = 1.0,
+    limits: dict[str, int] | None = None,
+) -> dict[str, list[str]]:
     """Deduplicate and keep only the most salient bullets per section."""
-    limits = _SECTION_LIMITS[mode]
+    limits = limits if limits is not None else _SECTION_LIMITS[mode]
+    sections: dict[str, list[str]] = {}
     for section, items in buckets.items():
         if not items:
+            sections[section] = []
             continue
-        deduped = _dedupe_lines(items)
-        ranked = sorted(deduped, key=lambda line: _salience_score(line, section), reverse=True)
+        deduped = _dedupe_lines(items, dedupe_threshold)
         section_limit = max_bullets if max_bullets is not None else limits[section]
-        concise = [_to_sendable_bullet(line) for line in ranked[:section_limit]]
-        buckets[section] = concise
+        ranked = _select_top(deduped, _SECTION_INDEX[section], section_limit)
+        sections[section] = [_to_sendable_bullet(features.text) for features in ranked]
+    return sections
+
 
+def _select_top(items: list[_LineFeatures], section_idx: int, limit: int) -> list[_LineFeatures]:
+    """Return the ``limit`` most salient lines in stable descending score order."""
+    if len(items) > max(_HEAP_SELECT_MIN_ITEMS, limit * _HEAP_SELECT_RATIO):
+        return _select_top_heap(items, section_idx, limit)
+    return _select_top_sorted(items, section_idx, limit)
 
-def _dedupe_lines(lines: list[str]) -> list[str]:
-    """Deduplicate near-identical lines using alphanumeric normalization."""
+
+def _select_top_sorted(items: list[_LineFeatures], section_idx: int, limit: int) -> list[_LineFeatures]:
+    """Select top lines with a full stable sort."""
+    return sorted(items, key=lambda features: _salience_score(features, section_idx), reverse=True)[:limit]
+
+
+def _select_top_heap(items: list[_LineFeatures], section_idx: int, limit: int) -> list[_LineFeatures]:
+    """Select top lines with a bounded heap; ties keep input order like the full sort."""
+    return heapq.nlargest(limit, items, key=lambda features: _salience_score(features, section_idx))
+
+
+def _dedupe_lines(lines: list[_LineFeatures], threshold: float = 1.0) -> list[_LineFeatures]:
+    """Deduplicate near-identical lines using alphanumeric normalization.
+
+    Below a threshold of 1.0, lines whose word bigrams are at least ``threshold``
+    Jaccard-similar to an earlier kept line are dropped too, via MinHash/LSH.
+    """
     seen: set[str] = set()
-    deduped: list[str] = []
-    for line in lines:
-        key = re.sub(r"[^a-z0-9]+", "", line.lower())
+    near = NearDuplicateFilter(threshold) if threshold < 1.0 else None
+    deduped: list[_LineFeatures] = []
+    for features in lines:
+        key = features.dedupe_key
         if not key or key in seen:
             continue
         seen.add(key)
-        deduped.append(line)
+        if near is not None and near.check_and_add(features.shingles):
+            continue
+        deduped.append(features)
     return deduped
 
 
-def _salience_score(line: str, section: str) -> float:
+def _salience_score(features: _LineFeatures, section_idx: int) -> float:
     """Compute a heuristic relevance score for ranking candidate bullets."""
-    lower = line.lower()
     score = 1.0
 
-    if any(char.isdigit() for char in line):
+    if features.has_digit:
         score += 1.0
-    if len(line) < 140:
+    if features.length < 140:
         score += 0.5
-    if " vs " in lower or "%" in line:
+    if features.has_ratio:
         score += 0.5
 
-    keyword_map = {
-        "situation": _SITUATION_KEYWORDS,
-        "key_findings": _FINDINGS_KEYWORDS,
-        "risks": _RISK_KEYWORDS,
-        "open_questions": _QUESTION_KEYWORDS,
-        "next_steps": _NEXT_STEPS_KEYWORDS,
-    }
-    section_keywords = keyword_map[section]
-    score += sum(0.4 for kw in section_keywords if re.search(rf"\b{re.escape(kw)}\b", lower))
+    score += sum(repeat(_KEYWORD_WEIGHT, features.hits[section_idx]))
     return score
 
 
@@ -234,26 +524,42 @@ def _to_sendable_bullet(line: str) -> str:
     return cleaned[0].upper() + cleaned[1:] if cleaned else line
 
 
-def _clean_transcript_line(raw_line: str) -> str:
-    """Clean common transcript noise while preserving meaningful note content."""
+def _clean_transcript_line(raw_line: str, noise: NoiseDictionary | None = None) -> str:
+    """Clean common transcript noise while preserving meaningful note content.
+
+    ``noise`` phrases apply to the line content after bullets, timestamps and speaker labels.
+    """
     stripped = raw_line.strip()
-    if not stripped or _METADATA_LINE_RE.search(stripped) or _DOCUMENT_NOISE_RE.search(stripped):
+    if not stripped or _SKIP_LINE_RE.match(stripped):
         return ""
 
-    cleaned = _BULLET_PREFIX_RE.sub("", stripped).strip()
-    while True:
-        updated = _TIMESTAMP_TOKEN_RE.sub("", cleaned).strip()
-        if updated == cleaned:
-            break
-        cleaned = updated
+    cleaned = stripped
+    first = stripped[0]
+    if first in "-*[" or first.isdecimal():
+        cleaned = stripped[_LINE_PREFIX_RE.match(stripped).end() :]
     cleaned = _strip_speaker_prefix(cleaned)
-    cleaned = _FILLER_WORD_RE.sub(" ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -|:")
+    if _may_contain_filler(cleaned):
+        cleaned = _FILLER_WORD_RE.sub(" ", cleaned)
+    if noise is not None:
+        cleaned = noise.clean(cleaned)
+        if cleaned is None:
+            return ""
+    cleaned = " ".join(cleaned.split()).strip(" -|:")
     if _is_low_signal_heading(cleaned):
         return ""
     return cleaned
 
 
+def _may_contain_filler(line: str) -> bool:
+    """Cheap substring pre-check so most lines skip the filler regex."""
+    folded = line.casefold()
+    if "um" in folded or "uh" in folded or "like" in folded or "you know" in folded:
+        return True
+    if "sort of" in folded or "kind of" in folded:
+        return True
+    return not line.isascii() and any(variant in line for variant in _DOTTED_I_VARIANTS)
+
+
 def _strip_speaker_prefix(line: str) -> str:
     """Strip transcript speaker prefixes while preserving real note headings."""
     if ":" not in line:
@@ -288,7 +594,13 @@ def _is_low_signal_heading(line: str) -> bool:
     """Detect heading-like lines that should not become bullets."""
     if not line:
         return True
-    alpha_words = [w for w in re.split(r"\s+", line) if re.search(r"[A-Za-z]", w)]
-    if 0 < len(alpha_words) <= 5 and all(w[:1].isupper() for w in alpha_words):
-        return True
-    return False
+    alpha_count = 0
+    for word in line.split():
+        if _ASCII_LETTERS.isdisjoint(word):
+            continue
+        if not word[0].isupper():
+            return False
+        alpha_count += 1
+        if alpha_count > 5:
+            return False
+    return alpha_count > 0
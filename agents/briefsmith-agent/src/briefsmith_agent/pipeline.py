@@ -0,0 +1,349 @@
+"""Asyncio batch pipeline that overlaps file I/O with parsing."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Iterable
+
+from .cli import (
+    BatchOutcome,
+    RunConfig,
+    describe_unexpected_error,
+    emit_to_sink,
+    manifest_options,
+    render_texts,
+    run_in_fresh_worker,
+    skipped_outcome,
+    validate_input_file,
+    write_briefs,
+)
+from .errors import BriefsmithAgentError
+from .formatter import OUTPUT_SUFFIXES
+from .manifest import BatchManifest, ManifestEntry, SourceFingerprint, fingerprint_file, stat_matches
+from .models import Mode
+from .profiling import FileProfile, recording
+from .reader import read_input_text
+from .writer import open_batch_sink
+
+DEFAULT_IO_WORKERS = 4
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Busy time and item count for one pipeline stage."""
+
+    name: str
+    workers: int
+    items: int = 0
+    busy_seconds: float = 0.0
+
+    def utilization(self, elapsed: float) -> float:
+        """Fraction of the stage's worker capacity spent busy over ``elapsed`` seconds."""
+        capacity = elapsed * self.workers
+        return self.busy_seconds / capacity if capacity > 0 else 0.0
+
+
+@dataclass(slots=True)
+class PipelineReport:
+    """Outcomes in input order plus per-stage statistics for one pipeline run."""
+
+    outcomes: list[BatchOutcome]
+    stages: list[StageStats]
+    elapsed: float
+
+
+@dataclass(slots=True)
+class _Item:
+    """One input file as it moves through the pipeline."""
+
+    seq: int
+    input_path: Path
+    known: ManifestEntry | None = None
+    fingerprint: SourceFingerprint | None = None
+    text: str | None = None
+    paragraph_numbers: list[int] | None = None
+    rendered: dict[Mode, str] | None = None
+    outcome: BatchOutcome | None = None
+    profile: FileProfile | None = None
+
+
+def run_pipeline(
+    files: Iterable[Path],
+    config: RunConfig,
+    jobs: int = 1,
+    depth: int = 4,
+    io_workers: int = DEFAULT_IO_WORKERS,
+    manifest: BatchManifest | None = None,
+    force_rebuild: bool = False,
+    profile: bool = False,
+) -> PipelineReport:
+    """Process batch files as read -> render -> write stages joined by bounded queues.
+
+    Reads and writes run on ``io_workers`` threads each, rendering runs on ``jobs``
+    processes, and each queue between stages holds at most ``depth`` files, so at
+    most about ``3 * depth + jobs + 2 * io_workers`` documents are in memory at once.
+    A batch sink receives briefs in input order, so briefs that finish ahead of a
+    slower earlier file wait for it. Manifest skipping and ``profile`` match ``run_batch``.
+    """
+    return asyncio.run(_run_pipeline(files, config, jobs, depth, io_workers, manifest, force_rebuild, profile))
+
+
+def format_stage_report(report: PipelineReport) -> list[str]:
+    """Render per-stage utilization as aligned text lines."""
+    lines = [f"{'stage':<8} {'workers':>7} {'files':>6} {'busy s':>8} {'util':>6}"]
+    for stage in report.stages:
+        lines.append(
+            f"{stage.name:<8} {stage.workers:>7} {stage.items:>6} {stage.busy_seconds:>8.2f} "
+            f"{stage.utilization(report.elapsed):>6.0%}"
+        )
+    lines.append(f"elapsed {report.elapsed:.2f}s")
+    return lines
+
+
+async def _run_pipeline(
+    files: Iterable[Path],
+    config: RunConfig,
+    jobs: int,
+    depth: int,
+    io_workers: int,
+    manifest: BatchManifest | None,
+    force_rebuild: bool,
+    profile: bool,
+) -> PipelineReport:
+    """Drive the three stages until every file has an outcome."""
+    options = manifest_options(config)
+    sink = open_batch_sink(config.batch_sink, config.output_dir, OUTPUT_SUFFIXES[config.output_format])
+    # A sink publishes a new file that must hold every brief, so nothing is skipped.
+    force_rebuild = force_rebuild or sink is not None
+    track = manifest is not None
+    read_queue: asyncio.Queue[_Item | None] = asyncio.Queue(depth)
+    render_queue: asyncio.Queue[_Item | None] = asyncio.Queue(depth)
+    write_queue: asyncio.Queue[_Item | None] = asyncio.Queue(depth)
+    stages = [StageStats("read", io_workers), StageStats("render", jobs), StageStats("write", io_workers)]
+    outcomes: dict[int, BatchOutcome] = {}
+    # Finished items waiting for their turn in the batch sink, keyed by input position.
+    ready: dict[int, _Item] = {}
+    arrived = asyncio.Event()
+    total: int | None = None
+    loop = asyncio.get_running_loop()
+
+    def finish(item: _Item) -> None:
+        if sink is not None:
+            ready[item.seq] = item
+            arrived.set()
+        else:
+            record(item)
+
+    def record(item: _Item) -> None:
+        outcome = item.outcome
+        outcome.profile = item.profile
+        if manifest is not None and outcome.fingerprint is not None and outcome.output_path is not None:
+            manifest.record(
+                outcome.input_path,
+                outcome.fingerprint,
+                ",".join(mode.value for mode in config.modes),
+                options,
+                outcome.output_path,
+                outcome.extra_output_paths,
+            )
+        outcomes[item.seq] = outcome
+
+    def route(outbox: asyncio.Queue[_Item | None]) -> Callable[[_Item], Awaitable[None]]:
+        async def forward(item: _Item) -> None:
+            if item.outcome is not None:
+                finish(item)
+            else:
+                await outbox.put(item)
+
+        return forward
+
+    async def finish_async(item: _Item) -> None:
+        finish(item)
+
+    async def produce() -> None:
+        nonlocal total
+        seq = -1
+        for seq, file_path in enumerate(files):
+            item = _Item(seq, file_path)
+            if manifest is not None and not force_rebuild:
+                item.known = manifest.lookup(file_path, options)
+            if item.known is not None and stat_matches(item.known, file_path):
+                item.outcome = skipped_outcome(file_path, item.known, manifest.output_dir)
+                finish(item)
+                continue
+            item.profile = FileProfile(str(file_path)) if profile else None
+            await read_queue.put(item)
+        total = seq + 1
+        arrived.set()
+        for _ in range(io_workers):
+            await read_queue.put(None)
+
+    async def feed_sink() -> None:
+        """Add rendered briefs to the sink in input order, whatever order their writes finish in."""
+        next_seq = 0
+        while total is None or next_seq < total:
+            item = ready.pop(next_seq, None)
+            if item is None:
+                arrived.clear()
+                await arrived.wait()
+                continue
+            if item.outcome.rendered is not None:
+                started = time.perf_counter()
+                await loop.run_in_executor(write_pool, emit_to_sink, item.outcome, sink)
+                stages[2].busy_seconds += time.perf_counter() - started
+            record(item)
+            next_seq += 1
+
+    read_pool = ThreadPoolExecutor(io_workers, thread_name_prefix="brief-read")
+    render_pool = ProcessPoolExecutor(jobs)
+    write_pool = ThreadPoolExecutor(io_workers, thread_name_prefix="brief-write")
+    started = time.perf_counter()
+    completed = False
+    try:
+        await asyncio.gather(
+            produce(),
+            _run_stage(
+                read_queue, route(render_queue), render_queue, jobs, read_pool, stages[0], _read_item, config, track
+            ),
+            _run_stage(
+                render_queue, route(write_queue), write_queue, io_workers, render_pool, stages[1], _render_item, config
+            ),
+            _run_stage(
+                write_queue, finish_async, None, 0, write_pool, stages[2], _write_item, config, sink is not None
+            ),
+            *([feed_sink()] if sink is not None else []),
+        )
+        completed = True
+    finally:
+        for pool in (read_pool, render_pool, write_pool):
+            pool.shutdown(cancel_futures=True)
+        # The pools are drained first so no write thread can still be adding to the sink.
+        if sink is not None and completed:
+            sink.close()
+        elif sink is not None:
+            sink.abort()
+    elapsed = time.perf_counter() - started
+    return PipelineReport([outcomes[seq] for seq in sorted(outcomes)], stages, elapsed)
+
+
+async def _run_stage(
+    inbox: asyncio.Queue[_Item | None],
+    forward: Callable[[_Item], Awaitable[None]],
+    outbox: asyncio.Queue[_Item | None] | None,
+    downstream_workers: int,
+    executor: Executor,
+    stats: StageStats,
+    work: Callable[..., _Item],
+    *args: object,
+) -> None:
+    """Run ``stats.workers`` consumers that apply ``work`` on ``executor``, then close downstream.
+
+    A failure to run ``work`` at all, such as a crashed worker or an item that cannot be
+    pickled, becomes that item's error outcome. A process pool broken by a crash is
+    replaced, and the items that were in flight in it are retried alone in a fresh
+    worker, so only an item that crashes on its own fails.
+    """
+    loop = asyncio.get_running_loop()
+    replacements: list[Executor] = []
+
+    async def run(item: _Item) -> _Item:
+        nonlocal executor
+        pool = executor
+        try:
+            return await loop.run_in_executor(pool, work, item, *args)
+        except BrokenProcessPool:
+            if executor is pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+                executor = ProcessPoolExecutor(stats.workers)
+                replacements.append(executor)
+            return await loop.run_in_executor(None, run_in_fresh_worker, work, item, *args)
+
+    async def consume() -> None:
+        while True:
+            item = await inbox.get()
+            if item is None:
+                return
+            started = time.perf_counter()
+            try:
+                item = await run(item)
+            except Exception as exc:
+                item.outcome = BatchOutcome(item.input_path, error=describe_unexpected_error(exc))
+            finally:
+                stats.busy_seconds += time.perf_counter() - started
+            stats.items += 1
+            await forward(item)
+
+    try:
+        await asyncio.gather(*(consume() for _ in range(stats.workers)))
+    finally:
+        for pool in replacements:
+            pool.shutdown(cancel_futures=True)
+    if outbox is not None:
+        for _ in range(downstream_workers):
+            await outbox.put(None)
+
+
+def _read_item(item: _Item, config: RunConfig, track: bool) -> _Item:
+    """Validate, fingerprint and read one input file on an I/O thread."""
+    try:
+        with recording(item.profile):
+            validate_input_file(item.input_path)
+            item.fingerprint = fingerprint_file(item.input_path) if track else None
+            if item.fingerprint is not None and item.known is not None:
+                if item.fingerprint.content_hash == item.known.content_hash:
+                    item.outcome = skipped_outcome(item.input_path, item.known, config.output_dir, item.fingerprint)
+                    return item
+            if item.input_path.suffix.lower() == ".docx":
+                item.paragraph_numbers = []
+            item.text = read_input_text(item.input_path, item.paragraph_numbers)
+    except BriefsmithAgentError as exc:
+        item.outcome = BatchOutcome(item.input_path, error=str(exc))
+    except Exception as exc:
+        item.outcome = BatchOutcome(item.input_path, error=describe_unexpected_error(exc))
+    return item
+
+
+def _render_item(item: _Item, config: RunConfig) -> _Item:
+    """Parse and format one file's text in a worker process."""
+    try:
+        with recording(item.profile):
+            item.rendered = render_texts(item.text or "", item.input_path, config, item.paragraph_numbers)
+    except BriefsmithAgentError as exc:
+        item.outcome = BatchOutcome(item.input_path, error=str(exc))
+    except Exception as exc:
+        item.outcome = BatchOutcome(item.input_path, error=describe_unexpected_error(exc))
+    item.text = None
+    item.paragraph_numbers = None
+    return item
+
+
+def _write_item(item: _Item, config: RunConfig, to_sink: bool) -> _Item:
+    """Save one file's rendered briefs on an I/O thread, or hand them on for the batch sink."""
+    if to_sink:
+        item.outcome = BatchOutcome(
+            item.input_path, fingerprint=item.fingerprint, profile=item.profile, rendered=item.rendered
+        )
+        item.rendered = None
+        return item
+    try:
+        with recording(item.profile):
+            content_hash = item.fingerprint.content_hash if item.fingerprint is not None else None
+            output_paths = write_briefs(item.rendered or {}, config, item.input_path, content_hash)
+    except BriefsmithAgentError as exc:
+        item.outcome = BatchOutcome(item.input_path, error=str(exc))
+    except Exception as exc:
+        item.outcome = BatchOutcome(item.input_path, error=describe_unexpected_error(exc))
+    else:
+        item.outcome = BatchOutcome(
+            item.input_path,
+            output_path=output_paths[0],
+            fingerprint=item.fingerprint,
+            extra_output_paths=output_paths[1:],
+        )
+    item.rendered = None
+    return item
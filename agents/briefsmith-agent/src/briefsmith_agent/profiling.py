@@ -0,0 +1,237 @@
+"""Opt-in per-stage timing and resource counters for brief generation."""
+
+from __future__ import annotations
+
+import cProfile
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, ContextManager, Iterable, Iterator
+
+from .errors import OutputWriteError
+
+PROFILE_JSONL_NAME = "briefsmith-profile.jsonl"
+
+_TRACEMALLOC_TOP = 25
+_NULL_STAGE = nullcontext()
+
+
+@dataclass(slots=True)
+class StageTiming:
+    """Accumulated exclusive wall and CPU time for one named stage."""
+
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    calls: int = 0
+
+
+@dataclass(slots=True)
+class FileProfile:
+    """Timings and counters recorded while generating one brief."""
+
+    path: str
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    lines: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    stages: dict[str, StageTiming] = field(default_factory=dict)
+    _current: _StageTimer | None = field(default=None, repr=False, compare=False)
+
+    def to_json(self) -> dict[str, object]:
+        """Return a JSON-serializable record."""
+        return {
+            "path": self.path,
+            "wall_s": round(self.wall_seconds, 6),
+            "cpu_s": round(self.cpu_seconds, 6),
+            "lines": self.lines,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "stages": {
+                name: {
+                    "wall_s": round(timing.wall_seconds, 6),
+                    "cpu_s": round(timing.cpu_seconds, 6),
+                    "calls": timing.calls,
+                }
+                for name, timing in self.stages.items()
+            },
+        }
+
+    def __getstate__(self) -> tuple[object, ...]:
+        """Pickle without the in-flight stage pointer so profiles cross process pools."""
+        return tuple(getattr(self, name) for name in _PICKLED_FIELDS)
+
+    def __setstate__(self, state: tuple[object, ...]) -> None:
+        """Restore a pickled profile."""
+        for name, value in zip(_PICKLED_FIELDS, state):
+            setattr(self, name, value)
+        self._current = None
+
+
+_PICKLED_FIELDS = ("path", "wall_seconds", "cpu_seconds", "lines", "bytes_read", "bytes_written", "stages")
+
+_ACTIVE: ContextVar[FileProfile | None] = ContextVar("briefsmith_profile", default=None)
+
+
+class _StageTimer:
+    """Times one stage, excluding time spent in nested stages."""
+
+    __slots__ = ("profile", "name", "parent", "child_wall", "child_cpu", "wall_start", "cpu_start")
+
+    def __init__(self, profile: FileProfile, name: str) -> None:
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.parent = self.profile._current
+        self.profile._current = self
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.thread_time()
+
+    def __exit__(self, *exc_info: object) -> None:
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.thread_time() - self.cpu_start
+        timing = self.profile.stages.get(self.name)
+        if timing is None:
+            timing = self.profile.stages[self.name] = StageTiming()
+        timing.wall_seconds += wall - self.child_wall
+        timing.cpu_seconds += cpu - self.child_cpu
+        timing.calls += 1
+        self.profile._current = self.parent
+        if self.parent is not None:
+            self.parent.child_wall += wall
+            self.parent.child_cpu += cpu
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Time a block as ``name`` when profiling is active; otherwise a shared no-op."""
+    profile = _ACTIVE.get()
+    if profile is None:
+        return _NULL_STAGE
+    return _StageTimer(profile, name)
+
+
+def is_profiling() -> bool:
+    """Return True when a profile is recording in the current context."""
+    return _ACTIVE.get() is not None
+
+
+def count(lines: int = 0, bytes_read: int = 0, bytes_written: int = 0) -> None:
+    """Add to the active profile's counters, if any."""
+    profile = _ACTIVE.get()
+    if profile is not None:
+        profile.lines += lines
+        profile.bytes_read += bytes_read
+        profile.bytes_written += bytes_written
+
+
+@contextmanager
+def recording(profile: FileProfile | None) -> Iterator[FileProfile | None]:
+    """Make ``profile`` active for the block and add the block's total time to it.
+
+    Passing None records nothing, so callers can wrap work unconditionally.
+    """
+    if profile is None:
+        yield None
+        return
+    token = _ACTIVE.set(profile)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield profile
+    finally:
+        profile.wall_seconds += time.perf_counter() - wall_start
+        profile.cpu_seconds += time.thread_time() - cpu_start
+        _ACTIVE.reset(token)
+
+
+def format_profile_table(profiles: Iterable[FileProfile]) -> list[str]:
+    """Summarize profiles per stage as aligned text lines, slowest stage first."""
+    profiles = list(profiles)
+    totals: dict[str, StageTiming] = {}
+    for profile in profiles:
+        for name, timing in profile.stages.items():
+            total = totals.setdefault(name, StageTiming())
+            total.wall_seconds += timing.wall_seconds
+            total.cpu_seconds += timing.cpu_seconds
+            total.calls += timing.calls
+    wall = sum(profile.wall_seconds for profile in profiles)
+    cpu = sum(profile.cpu_seconds for profile in profiles)
+    staged = StageTiming(
+        wall_seconds=sum(timing.wall_seconds for timing in totals.values()),
+        cpu_seconds=sum(timing.cpu_seconds for timing in totals.values()),
+    )
+    totals["other"] = StageTiming(max(wall - staged.wall_seconds, 0.0), max(cpu - staged.cpu_seconds, 0.0))
+
+    lines = [
+        f"Profile: {len(profiles)} files, {sum(profile.lines for profile in profiles)} lines, "
+        f"{sum(profile.bytes_read for profile in profiles)} bytes read, "
+        f"{sum(profile.bytes_written for profile in profiles)} bytes written, "
+        f"{wall:.3f}s wall, {cpu:.3f}s CPU",
+        f"{'stage':<12} {'calls':>6} {'wall s':>9} {'cpu s':>9} {'wall %':>7}",
+    ]
+    for name, timing in sorted(totals.items(), key=lambda item: item[1].wall_seconds, reverse=True):
+        share = timing.wall_seconds / wall if wall > 0 else 0.0
+        lines.append(
+            f"{name:<12} {timing.calls:>6} {timing.wall_seconds:>9.3f} {timing.cpu_seconds:>9.3f} {share:>7.1%}"
+        )
+    return lines
+
+
+def write_profile_jsonl(profiles: Iterable[FileProfile], path: Path) -> Path:
+    """Write one JSON record per profiled file and return the path."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for profile in profiles:
+                handle.write(json.dumps(profile.to_json()) + "\n")
+    except OSError as exc:
+        raise OutputWriteError(f"Failed to write profile file: {path}") from exc
+    return path
+
+
+def dump_slowest(
+    profiles: Iterable[FileProfile],
+    rerun: Callable[[Path], object],
+    directory: Path,
+    limit: int,
+) -> list[Path]:
+    """Re-run the ``limit`` slowest files under cProfile and tracemalloc and dump the results.
+
+    Each file gets a ``.prof`` file for ``pstats``/snakeviz and a ``.tracemalloc.txt``
+    listing the top allocation sites. Re-running keeps the main pass free of tracing cost.
+    """
+    slowest = sorted(profiles, key=lambda profile: profile.wall_seconds, reverse=True)[:limit]
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        raise OutputWriteError(f"Failed to create profile directory: {directory}") from exc
+    written: list[Path] = []
+    for rank, profile in enumerate(slowest, start=1):
+        source = Path(profile.path)
+        prefix = f"{rank:02d}_{source.stem}"
+        profiler = cProfile.Profile()
+        tracemalloc.start()
+        try:
+            profiler.runcall(rerun, source)
+            snapshot = tracemalloc.take_snapshot()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        top = snapshot.statistics("lineno")[:_TRACEMALLOC_TOP]
+        report = [f"# {source} (peak {peak} bytes)", *(str(stat) for stat in top)]
+        stats_path = directory / f"{prefix}.prof"
+        memory_path = directory / f"{prefix}.tracemalloc.txt"
+        try:
+            profiler.dump_stats(stats_path)
+            memory_path.write_text("\n".join(report) + "\n", encoding="utf-8")
+        except OSError as exc:
+            raise OutputWriteError(f"Failed to write profile dump in: {directory}") from exc
+        written.extend([stats_path, memory_path])
+    return written
@@ -2,22 +2,55 @@
 
 from __future__ import annotations
 
+import codecs
+from contextlib import contextmanager
+from itertools import chain
+import mmap
+import os
 import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from .errors import FileReadError, InputValidationError
+from .profiling import count, is_profiling, stage
 
 _WORD_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+_PARAGRAPH_TAG = f"{{{_WORD_NS['w']}}}p"
+_TEXT_TAG = f"{{{_WORD_NS['w']}}}t"
 
+# UTF-32 LE must be checked before UTF-16 LE because their BOMs share a prefix.
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_FALLBACK_ENCODINGS = ("utf-8", "cp1252", "latin-1")
+_MMAP_THRESHOLD = 1024 * 1024
+_DECODE_CHUNK_SIZE = 256 * 1024
+_ENCODING_SNIFF_SIZE = 64 * 1024
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
 
-def read_input_text(path: Path) -> str:
-    """Read text from .txt or .docx and validate non-empty content."""
+
+def read_input_text(path: Path, paragraph_numbers: list[int] | None = None) -> str:
+    """Read text from .txt or .docx and validate non-empty content.
+
+    For .docx, ``paragraph_numbers`` (when given) receives the 1-based document
+    paragraph of every text line; empty paragraphs are dropped from the text but counted.
+    """
     try:
         if path.suffix.lower() == ".txt":
-            content = path.read_text(encoding="utf-8")
+            with stage("read"):
+                data = path.read_bytes()
+                content = data.decode(detect_encoding(data))
+            count(bytes_read=len(data))
         elif path.suffix.lower() == ".docx":
-            content = _read_docx_text(path)
+            with stage("docx"):
+                content = _read_docx_text(path, paragraph_numbers)
+            if is_profiling():
+                count(bytes_read=path.stat().st_size)
         else:
             raise InputValidationError(f"Expected a .txt or .docx file, got: {path}")
     except InputValidationError:
@@ -32,16 +65,212 @@ def read_input_text(path: Path) -> str:
     return content
 
 
-def _read_docx_text(path: Path) -> str:
+def iter_input_lines(path: Path, paragraph_numbers: list[int] | None = None) -> Iterator[str]:
+    """Return a lazy line iterator over a .txt or .docx file after validating it is non-empty.
+
+    ``paragraph_numbers`` is filled as lines are consumed, like ``read_input_text``.
+
+    Large .txt files are memory-mapped and decoded in chunks, so neither the raw bytes
+    nor the decoded text is held in memory at once. The encoding is detected from the
+    start of the file; if later bytes are not valid in it, decoding continues from the
+    first invalid byte with the next fallback encoding.
+    """
+    suffix = path.suffix.lower()
+    if suffix not in {".txt", ".docx"}:
+        raise InputValidationError(f"Expected a .txt or .docx file, got: {path}")
+
+    with _translate_read_errors(path):
+        if suffix == ".txt":
+            encoding = _detect_file_encoding(path)
+            chunks = _iter_decoded_chunks(path, encoding)
+            try:
+                has_text = any(chunk.strip() for chunk in chunks)
+            finally:
+                chunks.close()
+            if not has_text:
+                raise InputValidationError(f"Input file is empty: {path}")
+            lines: Iterator[str] = _split_decoded_lines(_iter_decoded_chunks(path, encoding))
+        else:
+            lines = _iter_docx_lines(path, paragraph_numbers)
+            first = next(lines, None)
+            if first is None:
+                raise InputValidationError(f"Input file is empty: {path}")
+            lines = chain([first], lines)
+        if is_profiling():
+            count(bytes_read=path.stat().st_size)
+    return _guard_lines(lines, path)
+
+
+def detect_encoding(data: bytes | mmap.mmap) -> str:
+    """Detect text encoding from a BOM, then the first valid of UTF-8, cp1252 and latin-1."""
+    return _sniff_encoding(data, complete=True)
+
+
+def _sniff_encoding(data: bytes | mmap.mmap, complete: bool) -> str:
+    """Detect an encoding from a BOM or the first fallback that decodes ``data``.
+
+    When ``complete`` is False, ``data`` is only the start of the file, so a multibyte
+    sequence cut off at its end is not counted as invalid.
+    """
+    head = bytes(data[:4])
+    for bom, encoding in _BOM_ENCODINGS:
+        if head.startswith(bom):
+            return encoding
+    for encoding in _FALLBACK_ENCODINGS:
+        if _decodes_cleanly(data, encoding, final=complete):
+            return encoding
+    return _FALLBACK_ENCODINGS[-1]
+
+
+def _decodes_cleanly(data: bytes | mmap.mmap, encoding: str, final: bool = True) -> bool:
+    """Validate an encoding chunk by chunk without keeping the decoded text."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    try:
+        for offset in range(0, len(data), _DECODE_CHUNK_SIZE):
+            decoder.decode(data[offset : offset + _DECODE_CHUNK_SIZE])
+        decoder.decode(b"", final=final)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _detect_file_encoding(path: Path) -> str:
+    """Detect the encoding of a .txt file from its BOM and a bounded prefix."""
+    with path.open("rb") as handle:
+        prefix = handle.read(_ENCODING_SNIFF_SIZE)
+        complete = not handle.read(1)
+    return _sniff_encoding(prefix, complete)
+
+
+def _iter_decoded_chunks(path: Path, encoding: str) -> Iterator[str]:
+    """Decode a .txt file in fixed-size chunks, switching to the next fallback encoding at the first invalid byte.
+
+    Text already decoded keeps its decoding; BOM encodings and the last fallback replace
+    invalid bytes instead.
+    """
+    fallbacks: list[str] = []
+    if encoding in _FALLBACK_ENCODINGS:
+        fallbacks = list(_FALLBACK_ENCODINGS[_FALLBACK_ENCODINGS.index(encoding) + 1 :])
+    decoder = _chunk_decoder(encoding, strict=bool(fallbacks))
+    with _open_text_bytes(path) as data:
+        chunks = (data[offset : offset + _DECODE_CHUNK_SIZE] for offset in range(0, len(data), _DECODE_CHUNK_SIZE))
+        for chunk, final in chain(((chunk, False) for chunk in chunks), [(b"", True)]):
+            text = ""
+            while True:
+                try:
+                    text += decoder.decode(chunk, final=final)
+                    break
+                except UnicodeDecodeError as exc:
+                    # A failed decode leaves the decoder's buffer alone, and the error offset counts
+                    # from the start of that buffer, so everything before the bad byte is still valid.
+                    pending = decoder.getstate()[0] + chunk
+                    text += pending[: exc.start].decode(encoding)
+                    chunk = pending[exc.start :]
+                    encoding = fallbacks.pop(0)
+                    decoder = _chunk_decoder(encoding, strict=bool(fallbacks))
+            yield text
+
+
+def _chunk_decoder(encoding: str, strict: bool) -> codecs.IncrementalDecoder:
+    """Return an incremental decoder that raises on invalid bytes only when ``strict``."""
+    return codecs.getincrementaldecoder(encoding)(errors="strict" if strict else "replace")
+
+
+def _split_decoded_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Split decoded chunks on the same boundaries as ``str.splitlines``."""
+    pending = ""
+    for chunk in chunks:
+        if not chunk:
+            continue
+        pending += chunk
+        parts = pending.splitlines(keepends=True)
+        tail = parts[-1]
+        # A trailing "\r" may be the first half of a "\r\n" split across chunks.
+        if tail[-1] == "\r" or tail[-1] not in _LINE_BREAKS:
+            pending = parts.pop()
+        else:
+            pending = ""
+        for part in parts:
+            yield part.splitlines()[0]
+    if pending:
+        yield from pending.splitlines()
+
+
+@contextmanager
+def _open_text_bytes(path: Path) -> Iterator[bytes | mmap.mmap]:
+    """Yield file bytes, memory-mapping files above the mmap threshold."""
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _MMAP_THRESHOLD:
+            yield handle.read()
+            return
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+@contextmanager
+def _translate_read_errors(path: Path) -> Iterator[None]:
+    """Translate low-level read and parse failures into user-facing errors."""
+    try:
+        yield
+    except OSError as exc:
+        raise FileReadError(f"Failed to read input file: {path}") from exc
+    except (zipfile.BadZipFile, ET.ParseError, KeyError) as exc:
+        raise FileReadError(f"Failed to parse .docx file: {path}") from exc
+
+
+def _guard_lines(lines: Iterator[str], path: Path) -> Iterator[str]:
+    """Apply read error translation while lines are consumed."""
+    with _translate_read_errors(path):
+        yield from lines
+
+
+def _read_docx_text(path: Path, paragraph_numbers: list[int] | None = None) -> str:
     """Extract plain text from a Word .docx by reading document XML."""
-    with zipfile.ZipFile(path) as archive:
-        xml_bytes = archive.read("word/document.xml")
-
-    root = ET.fromstring(xml_bytes)
-    lines: list[str] = []
-    for paragraph in root.findall(".//w:p", _WORD_NS):
-        texts = [node.text for node in paragraph.findall(".//w:t", _WORD_NS) if node.text]
-        line = "".join(texts).strip()
-        if line:
-            lines.append(line)
-    return "\n".join(lines)
+    return "\n".join(_iter_docx_lines(path, paragraph_numbers))
+
+
+def _iter_docx_lines(path: Path, paragraph_numbers: list[int] | None = None) -> Iterator[str]:
+    """Stream non-empty paragraph text, recording each text line's paragraph number when asked."""
+    for number, text in _iter_docx_paragraphs(path):
+        if paragraph_numbers is not None:
+            # A paragraph holding line breaks becomes several text lines.
+            paragraph_numbers.extend([number] * len(text.splitlines()))
+        yield text
+
+
+def _iter_docx_paragraphs(path: Path) -> Iterator[tuple[int, str]]:
+    """Stream non-empty paragraphs and their 1-based paragraph numbers without building the XML tree.
+
+    Text runs are buffered into every open paragraph, so nested paragraphs (text boxes,
+    tables in shapes) keep the document-order output of a ``.//w:p`` scan. Processed
+    elements are detached as soon as they close to keep memory flat.
+    """
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml_stream:
+        ancestors: list[ET.Element] = []
+        open_paragraphs: list[tuple[int, list[str]]] = []
+        finished: list[tuple[int, str]] = []
+        paragraph_count = 0
+        for event, element in ET.iterparse(xml_stream, events=("start", "end")):
+            if event == "start":
+                ancestors.append(element)
+                if element.tag == _PARAGRAPH_TAG:
+                    paragraph_count += 1
+                    open_paragraphs.append((paragraph_count, []))
+                continue
+
+            ancestors.pop()
+            if element.tag == _TEXT_TAG and element.text:
+                for _, texts in open_paragraphs:
+                    texts.append(element.text)
+            elif element.tag == _PARAGRAPH_TAG:
+                order, texts = open_paragraphs.pop()
+                line = "".join(texts).strip()
+                if line:
+                    finished.append((order, line))
+                if not open_paragraphs:
+                    finished.sort()
+                    yield from finished
+                    finished.clear()
+            if ancestors:
+                # Every earlier sibling has already closed, so the parent can drop them all.
+                del ancestors[-1][:]
@@ -0,0 +1,378 @@
+"""Local HTTP daemon that renders briefs on a warm worker pool."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Sequence
+
+from . import __version__
+from .citations import CITATION_ENGINES
+from .cli import RunConfig, describe_unexpected_error, render_brief, render_text, validate_input_file
+from .errors import BriefsmithAgentError, InputValidationError, OutputWriteError
+from .formatter import OUTPUT_SUFFIXES
+from .keywords import load_keyword_profile
+from .models import Mode
+from .noise import load_noise_dictionary
+from .writer import save_output
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+RETRY_AFTER_SECONDS = 1
+
+_MAX_BODY_BYTES = 64 * 1024 * 1024
+# NDJSON is a batch file format; a single response is one JSON document.
+_RESPONSE_FORMATS = ("md", "json")
+_WARMUP_NOTES = "Finding: margin improved 4%\nRisk: timeline slip\nNext step: confirm owner\nWhat is the plan?\n"
+
+
+@dataclass(slots=True)
+class BriefRequest:
+    """One brief to render: a notes file path or raw text plus run options."""
+
+    config: RunConfig
+    path: Path | None = None
+    text: str | None = None
+    source_name: str = "request.txt"
+    write: bool = False
+
+
+def parse_brief_request(payload: object) -> BriefRequest:
+    """Validate a decoded JSON request body and build a brief request."""
+    if not isinstance(payload, dict):
+        raise InputValidationError("Request body must be a JSON object.")
+    path = _optional(payload, "path", str)
+    text = _optional(payload, "text", str)
+    if (path is None) == (text is None):
+        raise InputValidationError("Provide exactly one of 'path' or 'text'.")
+
+    mode_name = _optional(payload, "mode", str)
+    if mode_name not in {mode.value for mode in Mode}:
+        raise InputValidationError(f"'mode' must be one of: {', '.join(mode.value for mode in Mode)}.")
+    max_bullets = _optional(payload, "max_bullets", int)
+    max_ktas = _optional(payload, "max_ktas", int, 4)
+    citation_engine = _optional(payload, "citation_engine", str, "overlap")
+    dedupe_threshold = float(_optional(payload, "dedupe_threshold", (int, float), 1.0))
+    if max_bullets is not None and max_bullets < 1:
+        raise InputValidationError("'max_bullets' must be >= 1.")
+    if max_ktas < 1:
+        raise InputValidationError("'max_ktas' must be >= 1.")
+    if citation_engine not in CITATION_ENGINES:
+        raise InputValidationError(f"'citation_engine' must be one of: {', '.join(CITATION_ENGINES)}.")
+    if not 0.0 < dedupe_threshold <= 1.0:
+        raise InputValidationError("'dedupe_threshold' must be > 0 and <= 1.")
+    output_format = _optional(payload, "format", str, "md")
+    if output_format not in _RESPONSE_FORMATS:
+        raise InputValidationError(f"'format' must be one of: {', '.join(_RESPONSE_FORMATS)}.")
+    profile_path = _optional(payload, "keyword_profile", str)
+    noise_path = _optional(payload, "noise_phrases", str)
+
+    config = RunConfig(
+        mode=Mode(mode_name),
+        output_dir=Path(_optional(payload, "output_dir", str, "outputs")),
+        max_bullets=max_bullets,
+        max_ktas=max_ktas,
+        email_ready=_optional(payload, "email_ready", bool, False),
+        stream=_optional(payload, "stream", bool, False),
+        citation_engine=citation_engine,
+        dedupe_threshold=dedupe_threshold,
+        keyword_profile=load_keyword_profile(Path(profile_path)) if profile_path is not None else None,
+        noise_phrases=load_noise_dictionary(Path(noise_path)) if noise_path is not None else None,
+        output_format=output_format,
+    )
+    return BriefRequest(
+        config=config,
+        path=Path(path) if path is not None else None,
+        text=text,
+        source_name=_optional(payload, "source_name", str, "request.txt"),
+        write=_optional(payload, "write", bool, False),
+    )
+
+
+def handle_brief_request(request: BriefRequest) -> dict[str, object]:
+    """Render one brief request and optionally save it; runs inside a pool worker.
+
+    Markdown comes back as ``markdown``; JSON requests get the brief document as ``brief``.
+    """
+    config = request.config
+    if request.path is not None:
+        validate_input_file(request.path)
+        rendered = render_brief(request.path, config)
+    else:
+        rendered = render_text(request.text or "", Path(request.source_name), config)
+    result: dict[str, object]
+    if config.output_format == "md":
+        result = {"markdown": rendered}
+    else:
+        result = {"brief": json.loads(rendered)}
+    if request.write:
+        output_path = save_output(rendered, config.mode, config.output_dir, OUTPUT_SUFFIXES[config.output_format])
+        result["output_path"] = output_path.as_posix()
+    return result
+
+
+class BriefServer(ThreadingHTTPServer):
+    """HTTP server feeding a bounded queue of brief requests to warm worker processes.
+
+    At most ``jobs`` requests run at once and ``queue_size`` more may wait; anything
+    beyond that is rejected immediately with 503 and ``Retry-After``.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        jobs: int = 1,
+        queue_size: int = 8,
+        access_log: bool = False,
+    ) -> None:
+        self.jobs = jobs
+        self.queue_size = queue_size
+        self.access_log = access_log
+        self._slots = threading.BoundedSemaphore(jobs + queue_size)
+        self._pool_lock = threading.Lock()
+        # Start every worker before handler threads exist so forking stays single-threaded.
+        self._executor = _start_pool(jobs)
+        try:
+            super().__init__(address, _BriefHandler)
+        except OSError:
+            self._executor.shutdown(cancel_futures=True)
+            raise
+
+    def submit(self, request: BriefRequest) -> Future[dict[str, str]] | None:
+        """Queue a request on the pool, or return None when the queue is full."""
+        if not self._slots.acquire(blocking=False):
+            return None
+        try:
+            try:
+                future = self._executor.submit(handle_brief_request, request)
+            except BrokenProcessPool:
+                self.recover_pool()
+                future = self._executor.submit(handle_brief_request, request)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def server_close(self) -> None:
+        """Close the socket and stop the worker pool."""
+        super().server_close()
+        self._executor.shutdown(cancel_futures=True)
+
+    def recover_pool(self) -> None:
+        """Replace the worker pool if a crashed worker has broken it."""
+        with self._pool_lock:
+            try:
+                self._executor.submit(os.getpid).cancel()
+            except BrokenProcessPool:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = _start_pool(self.jobs)
+
+
+def _start_pool(jobs: int) -> ProcessPoolExecutor:
+    """Start a worker pool and wait until every worker is warm."""
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=_warm_worker)
+    for future in [executor.submit(os.getpid) for _ in range(jobs)]:
+        future.result()
+    return executor
+
+
+class _BriefHandler(BaseHTTPRequestHandler):
+    """Routes ``GET /health`` and ``POST /brief``."""
+
+    server: BriefServer
+    server_version = f"briefsmith-agent/{__version__}"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Report liveness and pool sizing."""
+        if self.path != "/health":
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown route: {self.path}"})
+            return
+        self._send_json(
+            HTTPStatus.OK,
+            {"status": "ok", "version": __version__, "jobs": self.server.jobs, "queue_size": self.server.queue_size},
+        )
+
+    def do_POST(self) -> None:
+        """Render a brief from a JSON request body."""
+        if self.path != "/brief":
+            self._discard_body()
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": f"Unknown route: {self.path}"})
+            return
+        try:
+            request = parse_brief_request(self._read_json())
+        except _RequestTooLarge as exc:
+            self.close_connection = True
+            self._send_json(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": str(exc)})
+            return
+        except BriefsmithAgentError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+
+        future = self.server.submit(request)
+        if future is None:
+            self._send_json(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {"error": "Server busy; retry later."},
+                headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+            )
+            return
+        try:
+            result = future.result()
+        except OutputWriteError as exc:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
+        except BriefsmithAgentError as exc:
+            self._send_json(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+        except BrokenProcessPool:
+            self.server.recover_pool()
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": "Worker pool stopped unexpectedly."})
+        except Exception as exc:
+            self._send_json(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": describe_unexpected_error(exc)})
+        else:
+            self._send_json(HTTPStatus.OK, result)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Write access log lines only when enabled."""
+        if self.server.access_log:
+            super().log_message(format, *args)
+
+    def _read_json(self) -> object:
+        """Read and decode the JSON request body."""
+        length = self._content_length()
+        if length is None:
+            # The body cannot be framed, so the rest of the connection cannot be trusted.
+            self.close_connection = True
+            raise InputValidationError("Invalid Content-Length header.")
+        if length > _MAX_BODY_BYTES:
+            raise _RequestTooLarge(f"Request body exceeds {_MAX_BODY_BYTES} bytes.")
+        try:
+            return json.loads(self.rfile.read(length))
+        except (UnicodeDecodeError, ValueError) as exc:
+            raise InputValidationError("Request body must be valid UTF-8 JSON.") from exc
+
+    def _discard_body(self) -> None:
+        """Drain an unused request body so keep-alive connections stay in sync."""
+        length = self._content_length()
+        if length is not None and 0 < length <= _MAX_BODY_BYTES:
+            self.rfile.read(length)
+        elif length != 0:
+            self.close_connection = True
+
+    def _content_length(self) -> int | None:
+        """Return the request's Content-Length, or None when it is malformed or negative."""
+        try:
+            length = int(self.headers.get("Content-Length", "0") or 0)
+        except ValueError:
+            return None
+        return length if length >= 0 else None
+
+    def _send_json(self, status: HTTPStatus, body: dict[str, object], headers: dict[str, str] | None = None) -> None:
+        """Send a JSON response with an explicit length for keep-alive clients."""
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _RequestTooLarge(InputValidationError):
+    """Raised when a request body exceeds the size limit."""
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    """Build command-line parser for the serve subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="briefsmith-agent serve",
+        description="Serve briefs over local HTTP from a warm worker pool.",
+        epilog=(
+            "Endpoints:\n"
+            "  GET  /health\n"
+            '  POST /brief  {"mode": "client", "path": "notes.txt", "write": true}\n'
+            '  POST /brief  {"mode": "internal", "text": "Risk: timeline slip"}'
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to bind (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=None,
+        help="Requests allowed to wait for a worker before 503 (default: 4 per job)",
+    )
+    parser.add_argument("--access-log", action="store_true", help="Log each request to stderr")
+    return parser
+
+
+def serve_main(argv: Sequence[str] | None = None) -> int:
+    """Run the brief server until interrupted and return exit code."""
+    parser = build_serve_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as exc:
+        return int(exc.code)
+
+    jobs: int = args.jobs
+    queue_size: int = args.queue_size if args.queue_size is not None else jobs * 4
+    if jobs < 1:
+        print("--jobs must be >= 1", file=sys.stderr)
+        return 2
+    if queue_size < 0:
+        print("--queue-size must be >= 0", file=sys.stderr)
+        return 2
+    if not 0 <= args.port <= 65535:
+        print("--port must be between 0 and 65535", file=sys.stderr)
+        return 2
+
+    try:
+        server = BriefServer((args.host, args.port), jobs=jobs, queue_size=queue_size, access_log=args.access_log)
+    except OSError as exc:
+        print(f"Failed to bind {args.host}:{args.port}: {exc.strerror or exc}", file=sys.stderr)
+        return 1
+    host, port = server.server_address[:2]
+    print(f"Serving briefs on http://{host}:{port} ({jobs} workers, queue {queue_size}). Press Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def _optional(payload: dict[str, object], key: str, kind: type | tuple[type, ...], default: object = None) -> object:
+    """Return a typed optional field from a request payload."""
+    value = payload.get(key, default)
+    if value is None or value is default:
+        return value
+    # bool is an int subclass; reject it where a number is expected.
+    if not isinstance(value, kind) or (isinstance(value, bool) and kind is not bool):
+        raise InputValidationError(f"Field '{key}' has the wrong type.")
+    return value
+
+
+def _warm_worker() -> None:
+    """Exercise parsing and formatting once so each worker starts with warm caches."""
+    config = RunConfig(mode=Mode.INTERNAL, output_dir=Path("outputs"), max_bullets=None, max_ktas=4, email_ready=True)
+    render_text(_WARMUP_NOTES, Path("warmup.txt"), config)
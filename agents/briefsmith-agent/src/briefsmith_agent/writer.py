@@ -1,21 +1,329 @@
-"""File writer for markdown output."""
+"""File writers for rendered briefs."""
 
 from __future__ import annotations
 
+from abc import ABC, abstractmethod
 from datetime import datetime
+import hashlib
+import io
+import json
+import os
 from pathlib import Path
+import string
+import tarfile
+import threading
+import time
+from typing import BinaryIO
+import uuid
+import zipfile
 
 from .errors import OutputWriteError
 from .models import Mode
+from .profiling import count, is_profiling, stage
+
+BATCH_SINKS = ("files", "concat", "zip", "tar")
+NAMING_STRATEGIES = ("timestamp", "stem", "content")
+
+_NAMING_TEMPLATES = {
+    "timestamp": "brief_{mode}_{timestamp}",
+    "stem": "brief_{mode}_{stem}",
+    "content": "brief_{mode}_{digest}",
+}
+_NAME_FIELDS = {"mode": "client", "stem": "notes", "timestamp": "20240101_000000_000000", "digest": "0" * 16}
+
+_SINK_BUFFER_SIZE = 1 << 20
 
 
 def save_markdown(markdown: str, mode: Mode, output_dir: Path) -> Path:
     """Write markdown file using timestamped naming and return output path."""
+    return save_output(markdown, mode, output_dir, ".md")
+
+
+def save_output(
+    content: str,
+    mode: Mode,
+    output_dir: Path,
+    suffix: str,
+    naming: str = "timestamp",
+    source: Path | None = None,
+    source_key: str = "",
+) -> Path:
+    """Write one rendered brief named by ``naming`` without ever overwriting another file.
+
+    The brief is written to a temporary file and hard-linked to its final name, which
+    fails instead of replacing an existing file, so concurrent writers need no lock.
+    A taken name gets a ``_2``, ``_3``... suffix, except that names containing the
+    content ``{digest}`` identify their output and an existing file is reused.
+    ``{digest}`` hashes the source path with ``source_key``, which identifies the source
+    content and options, so identical notes in two files still get separate briefs.
+    """
+    template = naming_template(naming)
+    name = template.format(
+        mode=mode.value,
+        stem=source.stem if source is not None else "brief",
+        timestamp=datetime.now().strftime("%Y%m%d_%H%M%S_%f"),
+        digest=hashlib.sha256(
+            f"{source_key}\0{_source_identity(source)}\0{mode.value}\0{suffix}".encode("utf-8")
+        ).hexdigest()[:16],
+    )
+    data = content.encode("utf-8")
     try:
-        output_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-        output_path = output_dir / f"brief_{mode.value}_{timestamp}.md"
-        output_path.write_text(markdown, encoding="utf-8")
+        with stage("write"):
+            output_path = _publish_exclusive(output_dir, name, suffix, data, reuse=naming_uses_digest(template))
+        if is_profiling():
+            count(bytes_written=len(data))
     except OSError as exc:
         raise OutputWriteError(f"Failed to write output file in: {output_dir}") from exc
     return output_path
+
+
+def naming_template(naming: str) -> str:
+    """Return the file name template for a naming strategy or a custom template.
+
+    Templates are ``str.format`` strings over ``{mode}``, ``{stem}``, ``{timestamp}``
+    and ``{digest}`` (a hash of the source path, content and run options).
+    """
+    template = _NAMING_TEMPLATES.get(naming, naming)
+    try:
+        fields = {field for _, field, _, _ in string.Formatter().parse(template) if field is not None}
+        unknown = fields - set(_NAME_FIELDS)
+        if unknown:
+            raise ValueError(f"unknown field {{{sorted(unknown)[0]}}}")
+        sample = template.format(**_NAME_FIELDS)
+    except (ValueError, IndexError) as exc:
+        raise ValueError(f"Invalid output naming {naming!r}: {exc}") from exc
+    if not fields or not sample.strip() or any(separator in sample for separator in ("/", "\\")):
+        raise ValueError(
+            f"Invalid output naming {naming!r}: use one of {', '.join(NAMING_STRATEGIES)} "
+            "or a template with at least one field and no path separators"
+        )
+    return template
+
+
+def naming_uses_digest(naming: str) -> bool:
+    """Return True when names depend on the source content digest."""
+    template = _NAMING_TEMPLATES.get(naming, naming)
+    return any(field == "digest" for _, field, _, _ in string.Formatter().parse(template))
+
+
+def _source_identity(source: Path | None) -> str:
+    """Return the absolute source path, so reruns from another folder keep the same digest."""
+    return source.resolve().as_posix() if source is not None else ""
+
+
+def _publish_exclusive(output_dir: Path, name: str, suffix: str, data: bytes, reuse: bool) -> Path:
+    """Write data to a temporary file, then link it to the first free ``name`` variant."""
+    # Unlike mkstemp, os.open applies the usual umask-based permissions the final file keeps.
+    temp_path = output_dir / f".{name}.{uuid.uuid4().hex}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        descriptor = os.open(temp_path, flags, 0o666)
+    except FileNotFoundError:
+        # Create the folder only when it is missing instead of once per brief.
+        output_dir.mkdir(parents=True, exist_ok=True)
+        descriptor = os.open(temp_path, flags, 0o666)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(data)
+        copy = 1
+        while True:
+            output_path = output_dir / (f"{name}{suffix}" if copy == 1 else f"{name}_{copy}{suffix}")
+            try:
+                _link_exclusive(temp_path, output_path, data)
+                return output_path
+            except FileExistsError:
+                if reuse:
+                    return output_path
+                copy += 1
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _link_exclusive(temp_path: Path, output_path: Path, data: bytes) -> None:
+    """Give the finished temporary file its final name, failing if the name exists."""
+    try:
+        os.link(temp_path, output_path)
+    except (AttributeError, NotImplementedError, PermissionError):
+        # Filesystems without hard links still get exclusive creation, just not atomically.
+        with output_path.open("xb") as handle:
+            handle.write(data)
+
+
+class BatchSink(ABC):
+    """Collects every brief of a batch run into one output file instead of one file per brief.
+
+    Entries go through a large write buffer into a hidden temporary file that ``close``
+    fsyncs once and atomically renames into place, so readers never see a partial file.
+    Writes are serialized with a lock so pipeline I/O threads can share one sink.
+    """
+
+    suffix = ""
+
+    def __init__(self, output_dir: Path, entry_suffix: str) -> None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        self.entry_suffix = entry_suffix
+        self.path = output_dir / f"briefs_{timestamp}{self.suffix or entry_suffix}"
+        self._temp_path = output_dir / f".{self.path.name}.tmp"
+        self._handle: BinaryIO | None = None
+        self._names: set[str] = set()
+        self._lock = threading.Lock()
+
+    def write(self, input_path: Path, rendered: dict[Mode, str]) -> Path:
+        """Add one input's rendered briefs and return the path the sink publishes to."""
+        written = 0
+        try:
+            with self._lock, stage("write"):
+                if self._handle is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._handle = self._temp_path.open("wb", buffering=_SINK_BUFFER_SIZE)
+                    self._start(self._handle)
+                for mode, content in rendered.items():
+                    data = content.encode("utf-8")
+                    self._add(self._entry_name(input_path, mode), input_path, mode, data)
+                    written += len(data)
+        except OSError as exc:
+            raise OutputWriteError(f"Failed to write output file: {self.path}") from exc
+        if is_profiling():
+            count(bytes_written=written)
+        return self.path
+
+    def close(self) -> None:
+        """Finish the file, fsync it once and rename it into place; a sink without entries writes nothing."""
+        with self._lock:
+            handle, self._handle = self._handle, None
+            if handle is None:
+                return
+            try:
+                with stage("write"):
+                    self._finish()
+                    handle.flush()
+                    os.fsync(handle.fileno())
+                    handle.close()
+                    os.replace(self._temp_path, self.path)
+                    self._published()
+            except OSError as exc:
+                handle.close()
+                self._temp_path.unlink(missing_ok=True)
+                raise OutputWriteError(f"Failed to write output file: {self.path}") from exc
+
+    def abort(self) -> None:
+        """Discard everything written so far without publishing it."""
+        with self._lock:
+            handle, self._handle = self._handle, None
+            if handle is None:
+                return
+            try:
+                # Finishing lets archive writers release the handle; the file is deleted anyway.
+                self._finish()
+            except (OSError, ValueError):
+                pass
+            finally:
+                handle.close()
+                self._temp_path.unlink(missing_ok=True)
+
+    def _entry_name(self, input_path: Path, mode: Mode) -> str:
+        """Return a unique entry name for one input's brief."""
+        stem = f"brief_{mode.value}_{input_path.stem}"
+        name = f"{stem}{self.entry_suffix}"
+        copy = 1
+        while name in self._names:
+            copy += 1
+            name = f"{stem}_{copy}{self.entry_suffix}"
+        self._names.add(name)
+        return name
+
+    def _start(self, handle: BinaryIO) -> None:
+        """Prepare the format once the temporary file is open."""
+
+    @abstractmethod
+    def _add(self, name: str, input_path: Path, mode: Mode, data: bytes) -> None:
+        """Append one encoded brief."""
+
+    def _finish(self) -> None:
+        """Write any trailing structure before the file is synced."""
+
+    def _published(self) -> None:
+        """Write companion files once the main file is in place."""
+
+
+class ConcatSink(BatchSink):
+    """Concatenates briefs into one file plus a JSON index of each brief's byte offset and length."""
+
+    def __init__(self, output_dir: Path, entry_suffix: str) -> None:
+        super().__init__(output_dir, entry_suffix)
+        self.index_path = self.path.with_name(f"{self.path.name}.index.json")
+        self._index: list[dict[str, object]] = []
+        self._offset = 0
+
+    def _add(self, name: str, input_path: Path, mode: Mode, data: bytes) -> None:
+        self._handle.write(data)
+        self._index.append(
+            {"name": name, "source": str(input_path), "mode": mode.value, "offset": self._offset, "length": len(data)}
+        )
+        self._offset += len(data)
+
+    def _published(self) -> None:
+        document = {"path": self.path.name, "entries": self._index}
+        _write_atomic(self.index_path, (json.dumps(document, indent=2, ensure_ascii=False) + "\n").encode("utf-8"))
+
+
+class ZipSink(BatchSink):
+    """Stores briefs as deflated entries of one zip archive."""
+
+    suffix = ".zip"
+
+    def _start(self, handle: BinaryIO) -> None:
+        self._archive = zipfile.ZipFile(handle, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def _add(self, name: str, input_path: Path, mode: Mode, data: bytes) -> None:
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        self._archive.writestr(info, data)
+
+    def _finish(self) -> None:
+        self._archive.close()
+
+
+class TarSink(BatchSink):
+    """Stores briefs as members of one uncompressed tar archive."""
+
+    suffix = ".tar"
+
+    def _start(self, handle: BinaryIO) -> None:
+        self._archive = tarfile.open(fileobj=handle, mode="w", format=tarfile.PAX_FORMAT)
+
+    def _add(self, name: str, input_path: Path, mode: Mode, data: bytes) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        self._archive.addfile(info, io.BytesIO(data))
+
+    def _finish(self) -> None:
+        self._archive.close()
+
+
+_SINK_TYPES: dict[str, type[BatchSink]] = {"concat": ConcatSink, "zip": ZipSink, "tar": TarSink}
+
+
+def open_batch_sink(kind: str, output_dir: Path, entry_suffix: str) -> BatchSink | None:
+    """Return the batch sink for ``kind``, or None when every brief gets its own file."""
+    if kind == "files":
+        return None
+    sink_type = _SINK_TYPES.get(kind)
+    if sink_type is None:
+        raise ValueError(f"Unknown batch sink: {kind}")
+    return sink_type(output_dir, entry_suffix)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temporary sibling, fsync it and rename it over ``path``."""
+    temp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with temp_path.open("wb") as handle:
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,81 @@
+import random
+import re
+
+from briefsmith_agent.citations import Bm25Engine, CitationIndex, build_citation_engine
+
+
+def _legacy_tokenize(text: str) -> set[str]:
+    return {token.lower() for token in re.findall(r"[A-Za-z0-9]+", text) if len(token) >= 3}
+
+
+def _legacy_best_source_line(kta: str, source_lines: list[str]) -> str:
+    kta_tokens = _legacy_tokenize(kta)
+    best_line = ""
+    best_score = -1.0
+    for line in source_lines:
+        line_tokens = _legacy_tokenize(line)
+        if not line_tokens:
+            continue
+        overlap = len(kta_tokens & line_tokens)
+        score = overlap / max(1, len(kta_tokens))
+        if score > best_score:
+            best_score = score
+            best_line = line
+    return best_line
+
+
+def test_index_lookup_matches_linear_scan_including_ties() -> None:
+    rng = random.Random(11)
+    vocabulary = ["margin", "churn", "pricing", "risk", "owner", "SMB", "EBITDA", "q1", "to", "of", "12%"]
+    for _ in range(200):
+        lines = [" ".join(rng.choices(vocabulary, k=rng.randint(0, 6))) for _ in range(rng.randint(0, 25))]
+        index = CitationIndex(lines)
+        for _ in range(5):
+            kta = " ".join(rng.choices(vocabulary, k=rng.randint(0, 5)))
+            assert index.best_line(kta) == _legacy_best_source_line(kta, lines)
+
+
+def test_index_prefers_earliest_line_on_equal_overlap() -> None:
+    index = CitationIndex(["ok", "churn margin today", "margin churn again"])
+
+    assert index.best_line("Churn and margin") == "churn margin today"
+    assert index.best_line("unrelated words") == "churn margin today"
+    assert CitationIndex(["a", "to"]).best_line("anything") == ""
+
+
+def test_bm25_prefers_rare_tokens_over_long_boilerplate() -> None:
+    lines = [
+        "Confidential draft prepared for the project team covering margin churn pricing owner timeline review",
+        "Churn rose in SMB cohort",
+        "Pricing review scheduled",
+    ]
+    index = CitationIndex(lines)
+    engine = build_citation_engine(index, "bm25")
+
+    assert index.best_line("SMB churn review") == lines[0]
+    assert engine.best_line("SMB churn review") == lines[1]
+    assert engine.best_line("nothing shared") == lines[0]
+
+
+def test_bm25_python_and_numpy_paths_agree() -> None:
+    rng = random.Random(5)
+    vocabulary = ["margin", "churn", "pricing", "risk", "owner", "smb", "ebitda", "q1q", "cohort", "board"]
+    lines = [" ".join(rng.choices(vocabulary, k=rng.randint(1, 8))) for _ in range(300)]
+    index = CitationIndex(lines)
+    python_engine = Bm25Engine(index, use_numpy=False)
+    vector_engine = Bm25Engine(index)
+    for _ in range(50):
+        kta = " ".join(rng.choices(vocabulary, k=3))
+        assert python_engine.best_line(kta) == vector_engine.best_line(kta)
+
+
+def test_best_line_id_points_at_best_line_for_both_engines() -> None:
+    lines = ["ok", "churn margin today", "pricing risk owner", "margin churn again"]
+    index = CitationIndex(lines)
+    for engine in (index, build_citation_engine(index, "bm25")):
+        for text in ("Churn and margin", "pricing owner", "unrelated words"):
+            line_id = engine.best_line_id(text)
+            assert line_id is not None
+            assert lines[line_id] == engine.best_line(text)
+    assert CitationIndex(["a", "to"]).best_line_id("anything") is None
+    assert Bm25Engine(CitationIndex([])).best_line_id("anything") is None
@@ -1,9 +1,18 @@
+import json
+import multiprocessing
+import os
 from pathlib import Path
 import zipfile
 
+import pytest
+
 from briefsmith_agent.cli import main
 
 
+def _strip_generated(markdown: str) -> str:
+    return "\n".join(line for line in markdown.splitlines() if not line.startswith("- Generated:"))
+
+
 def _write_minimal_docx(path: Path, paragraphs: list[str]) -> None:
     body = "".join(
         f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs
@@ -153,3 +162,389 @@ def test_cli_invalid_mode_returns_parser_error(tmp_path: Path, capsys) -> None:
 
     assert exit_code == 2
     assert "invalid choice" in captured.err.lower()
+
+
+def test_cli_batch_mode_runs_jobs_and_collects_failures(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    (batch_dir / "a.txt").write_text("Risk: timeline slip", encoding="utf-8")
+    (batch_dir / "b.txt").write_text("   \n", encoding="utf-8")
+    (batch_dir / "c.txt").write_text("Finding: margin improved", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+
+    exit_code = main(
+        ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), "--jobs", "2"]
+    )
+    captured = capsys.readouterr()
+
+    assert exit_code == 1
+    assert "Batch complete: 2 briefs generated." in captured.out
+    assert "b.txt: Input file is empty" in captured.err
+    assert len(list(output_dir.glob("brief_client_*.md"))) == 2
+
+
+def test_cli_rejects_invalid_jobs(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+
+    exit_code = main(["--batch-dir", str(batch_dir), "--mode", "client", "--jobs", "0"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 2
+    assert "--jobs must be >= 1" in captured.err
+
+
+def test_cli_batch_mode_skips_unchanged_inputs(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    (batch_dir / "a.txt").write_text("Risk: timeline slip", encoding="utf-8")
+    (batch_dir / "b.txt").write_text("Finding: margin improved", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), "--jobs", "1"]
+
+    assert main(base_args) == 0
+    assert (output_dir / ".briefsmith-manifest.json").exists()
+    capsys.readouterr()
+
+    assert main(base_args) == 0
+    captured = capsys.readouterr()
+    assert "Batch complete: 0 briefs generated." in captured.out
+    assert "Skipped 2 unchanged files" in captured.out
+
+    (batch_dir / "b.txt").write_text("Finding: margin improved again", encoding="utf-8")
+    assert main(base_args) == 0
+    assert "Batch complete: 1 briefs generated." in capsys.readouterr().out
+
+    assert main([*base_args, "--max-bullets", "2"]) == 0
+    assert "Batch complete: 2 briefs generated." in capsys.readouterr().out
+
+    assert main([*base_args, "--max-bullets", "2", "--force-rebuild"]) == 0
+    assert "Batch complete: 2 briefs generated." in capsys.readouterr().out
+
+
+def test_cli_batch_mode_recursive_discovery(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    (batch_dir / "client-a" / "2024-01").mkdir(parents=True)
+    (batch_dir / "a.txt").write_text("Risk: timeline slip", encoding="utf-8")
+    (batch_dir / "client-a" / "2024-01" / "b.txt").write_text("Finding: margin improved", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), "--jobs", "1"]
+
+    assert main(base_args) == 0
+    assert "Batch complete: 1 briefs generated." in capsys.readouterr().out
+
+    assert main([*base_args, "--recursive", "--force-rebuild"]) == 0
+    assert "Batch complete: 2 briefs generated." in capsys.readouterr().out
+
+    assert main([*base_args, "--max-depth", "1"]) == 2
+    assert "requires --recursive" in capsys.readouterr().err
+
+
+def test_cli_stream_mode_writes_markdown(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "notes.txt"
+    input_path.write_bytes("Risk: timeline slip – owner unclear\nFinding: margin improved\n".encode("cp1252"))
+    output_dir = tmp_path / "outputs"
+
+    exit_code = main([str(input_path), "--mode", "internal", "--output-dir", str(output_dir), "--stream"])
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    content = list(output_dir.glob("brief_internal_*.md"))[0].read_text(encoding="utf-8")
+    assert "Margin improved." in content
+
+
+def test_cli_dedupe_threshold_validation(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "notes.txt"
+    input_path.write_text(
+        "Finding: churn is concentrated in the SMB segment this quarter\n"
+        "Finding: churn is concentrated in the SMB segment this year\n",
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "outputs"
+
+    assert main([str(input_path), "--mode", "internal", "--output-dir", str(output_dir), "--dedupe-threshold", "0"]) == 2
+    assert "--dedupe-threshold" in capsys.readouterr().err
+
+    assert main([str(input_path), "--mode", "internal", "--output-dir", str(output_dir), "--dedupe-threshold", "0.7"]) == 0
+    content = list(output_dir.glob("brief_internal_*.md"))[0].read_text(encoding="utf-8")
+    assert "this year" not in content
+
+
+def test_cli_keyword_profile(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "notes.txt"
+    input_path.write_text("Covenant headroom narrows to 0.4x in Q3\nFinding: margin improved\n", encoding="utf-8")
+    profile_path = tmp_path / "pe.json"
+    profile_path.write_text('{"keywords": {"risks": ["covenant headroom"]}}', encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+
+    assert main([str(input_path), "--mode", "internal", "--output-dir", str(output_dir), "--keyword-profile", str(profile_path)]) == 0
+    content = list(output_dir.glob("brief_internal_*.md"))[0].read_text(encoding="utf-8")
+    risks = content.split("## Risks", 1)[1].split("##", 1)[0]
+    assert "Covenant headroom" in risks
+
+    profile_path.write_text('{"keywords": {"risk": ["covenant"]}}', encoding="utf-8")
+    assert main([str(input_path), "--mode", "internal", "--output-dir", str(output_dir), "--keyword-profile", str(profile_path)]) == 1
+    assert "Unknown key" in capsys.readouterr().err
+
+
+def test_cli_noise_phrases_in_parallel_batch(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    for name in ("a", "b"):
+        (batch_dir / f"{name}.txt").write_text(
+            "Strictly confidential draft\nFinding: margin improved\n", encoding="utf-8"
+        )
+    noise_path = tmp_path / "noise.txt"
+    noise_path.write_text("# template boilerplate\nstrictly confidential\n", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), "--jobs", "2"]
+
+    assert main([*base_args, "--noise-phrases", str(noise_path)]) == 0
+    assert "Batch complete: 2 briefs generated." in capsys.readouterr().out
+    for brief_path in output_dir.glob("brief_client_*.md"):
+        assert "confidential" not in brief_path.read_text(encoding="utf-8").lower()
+
+    noise_path.write_text("strictly confidential\n~margin\n", encoding="utf-8")
+    assert main([*base_args, "--noise-phrases", str(noise_path)]) == 0
+    assert "Batch complete: 2 briefs generated." in capsys.readouterr().out
+
+
+def test_cli_multi_mode_writes_one_brief_per_mode(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "notes.txt"
+    input_path.write_text("Risk: timeline slip\nFinding: margin improved 3%\nWhat is the plan?\n", encoding="utf-8")
+    combined_dir = tmp_path / "combined"
+    single_dir = tmp_path / "single"
+
+    assert main([str(input_path), "--mode", "all", "--output-dir", str(combined_dir)]) == 0
+    assert capsys.readouterr().out.count("Brief generated:") == 3
+    for mode in ("internal", "client", "investment"):
+        assert main([str(input_path), "--mode", mode, "--output-dir", str(single_dir)]) == 0
+        combined = next(combined_dir.glob(f"brief_{mode}_*.md")).read_text(encoding="utf-8")
+        single = next(single_dir.glob(f"brief_{mode}_*.md")).read_text(encoding="utf-8")
+        assert _strip_generated(combined) == _strip_generated(single)
+
+    pair_dir = tmp_path / "pair"
+    assert main([str(input_path), "--mode", "client,investment", "--output-dir", str(pair_dir), "--stream"]) == 0
+    assert sorted(path.name.split("_")[1] for path in pair_dir.glob("*.md")) == ["client", "investment"]
+    capsys.readouterr()
+
+    assert main([str(input_path), "--mode", "all,client", "--output-dir", str(pair_dir)]) == 2
+    error = capsys.readouterr().err
+    assert "'all' already selects every mode and cannot be part of a list" in error
+    assert "invalid choice" not in error
+
+
+def test_cli_multi_mode_batch_skips_when_all_briefs_exist(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    (batch_dir / "a.txt").write_text("Risk: timeline slip", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = ["--batch-dir", str(batch_dir), "--mode", "internal,client", "--output-dir", str(output_dir)]
+
+    assert main([*base_args, "--jobs", "1"]) == 0
+    assert len(list(output_dir.glob("brief_*.md"))) == 2
+    capsys.readouterr()
+
+    assert main([*base_args, "--jobs", "2"]) == 0
+    output = capsys.readouterr().out
+    assert "Skipped 1 unchanged files" in output
+    assert output.count("(unchanged)") == 2
+
+    next(output_dir.glob("brief_client_*.md")).unlink()
+    assert main([*base_args, "--pipeline-depth", "2"]) == 0
+    assert "Batch complete: 2 briefs generated from 1 files." in capsys.readouterr().out
+    assert len(list(output_dir.glob("brief_*.md"))) == 3
+
+
+def test_cli_json_format_writes_document_with_line_numbers(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "notes.txt"
+    input_path.write_text("Background: kickoff\n\nRisk: timeline slip\n", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+
+    assert main([str(input_path), "--mode", "client", "--output-dir", str(output_dir), "--format", "json"]) == 0
+    document = json.loads(next(output_dir.glob("brief_client_*.json")).read_text(encoding="utf-8"))
+    assert document["mode"] == "client"
+    assert {"text": "Risk: timeline slip", "line": 3} in [kta["citation"] for kta in document["ktas"]]
+
+    # Empty .docx paragraphs count, so the citation is the paragraph's position in the document.
+    (tmp_path / "docx").mkdir()
+    docx_path = tmp_path / "docx" / "notes.docx"
+    _write_minimal_docx(docx_path, ["", "Background: kickoff", "", "", "Risk: timeline slip"])
+    batch_args = ["--batch-dir", str(docx_path.parent), "--pipeline-depth", "1"]
+    for idx, source in enumerate(([str(docx_path)], [str(docx_path), "--stream"], batch_args)):
+        docx_dir = tmp_path / f"docx_out{idx}"
+        assert main([*source, "--mode", "client", "--output-dir", str(docx_dir), "--format=json"]) == 0
+        document = json.loads(next(docx_dir.glob("brief_client_*.json")).read_text(encoding="utf-8"))
+        assert {"text": "Risk: timeline slip", "line": 5} in [kta["citation"] for kta in document["ktas"]]
+
+    assert main([str(input_path), "--mode", "client", "--output-dir", str(output_dir), "--format", "yaml"]) == 2
+    assert "--format" in capsys.readouterr().err
+
+
+def test_cli_ndjson_batch_streams_records_into_one_file(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    for name in ("a", "b", "c"):
+        (batch_dir / f"{name}.txt").write_text(f"Risk: {name} slip\n", encoding="utf-8")
+    (batch_dir / "d.txt").write_text("   \n", encoding="utf-8")
+
+    for extra in (["--jobs", "2"], ["--pipeline-depth", "2"]):
+        output_dir = tmp_path / "outputs" / extra[0].strip("-")
+        args = ["--batch-dir", str(batch_dir), "--mode", "internal,client", "--output-dir", str(output_dir)]
+        assert main([*args, "--format", "ndjson", *extra]) == 1
+        captured = capsys.readouterr()
+        assert "Batch complete: 6 briefs generated from 3 files." in captured.out
+        assert "d.txt: Input file is empty" in captured.err
+
+        (ndjson_path,) = output_dir.glob("briefs_*.ndjson")
+        records = [json.loads(line) for line in ndjson_path.read_text(encoding="utf-8").splitlines()]
+        assert sorted((Path(record["source"]).name, record["mode"]) for record in records) == [
+            (f"{name}.txt", mode) for name in ("a", "b", "c") for mode in ("client", "internal")
+        ]
+
+
+def test_cli_batch_sink_writes_one_complete_archive_per_run(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+
+    for extra in (["--jobs", "2"], ["--pipeline-depth", "2"]):
+        for name in ("a", "b"):
+            (batch_dir / f"{name}.txt").write_text(f"Risk: {name} slip\n", encoding="utf-8")
+        output_dir = tmp_path / "outputs" / extra[0].strip("-")
+        args = ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), *extra]
+        assert main([*args, "--batch-sink", "zip"]) == 0
+        (archive_path,) = output_dir.glob("briefs_*.zip")
+        assert f"- {archive_path.as_posix()}\n" in capsys.readouterr().out
+        with zipfile.ZipFile(archive_path) as archive:
+            assert sorted(archive.namelist()) == ["brief_client_a.md", "brief_client_b.md"]
+            assert "A slip." in archive.read("brief_client_a.md").decode("utf-8")
+        assert not list(output_dir.glob("*.tmp"))
+
+        # Unchanged inputs are not skipped, so the new archive holds every brief, not just the changed one.
+        (batch_dir / "b.txt").write_text("Risk: b revised\n", encoding="utf-8")
+        assert main([*args, "--batch-sink", "zip"]) == 0
+        assert "(unchanged)" not in capsys.readouterr().out
+        (latest,) = set(output_dir.glob("briefs_*.zip")) - {archive_path}
+        with zipfile.ZipFile(latest) as archive:
+            assert archive.namelist() == ["brief_client_a.md", "brief_client_b.md"]
+            assert "B revised." in archive.read("brief_client_b.md").decode("utf-8")
+
+    input_path = batch_dir / "a.txt"
+    assert main([str(input_path), "--mode", "client", "--batch-sink", "tar"]) == 2
+    assert "--batch-sink requires --batch-dir" in capsys.readouterr().err
+
+
+def test_cli_naming_strategies(tmp_path: Path, capsys) -> None:
+    input_path = tmp_path / "deal_notes.txt"
+    input_path.write_text("Risk: timeline slip\n", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = [str(input_path), "--mode", "client", "--output-dir", str(output_dir)]
+
+    assert main([*base_args, "--naming", "stem"]) == 0
+    assert main([*base_args, "--naming", "stem"]) == 0
+    assert sorted(path.name for path in output_dir.glob("*.md")) == [
+        "brief_client_deal_notes.md",
+        "brief_client_deal_notes_2.md",
+    ]
+
+    assert main([*base_args, "--naming", "content"]) == 0
+    assert main([*base_args, "--naming", "content"]) == 0
+    assert len(list(output_dir.glob("brief_client_*.md"))) == 3
+    capsys.readouterr()
+
+    assert main([*base_args, "--naming", "{stem}.{digest}"]) == 0
+    assert len(list(output_dir.glob("deal_notes.*.md"))) == 1
+
+    assert main([*base_args, "--naming", "{owner}"]) == 2
+    assert "--naming" in capsys.readouterr().err
+
+
+def test_cli_batch_records_unexpected_errors_per_file(tmp_path: Path, capsys, monkeypatch) -> None:
+    from briefsmith_agent import cli
+
+    batch_dir = tmp_path / "batch"
+    batch_dir.mkdir()
+    for name in ("a", "b", "c"):
+        (batch_dir / f"{name}.txt").write_text(f"Risk: {name} slip\n", encoding="utf-8")
+    render_briefs = cli.render_briefs
+
+    def flaky_render(input_path: Path, config: cli.RunConfig) -> dict:
+        if input_path.name == "b.txt":
+            raise RuntimeError("parser bug")
+        return render_briefs(input_path, config)
+
+    monkeypatch.setattr(cli, "render_briefs", flaky_render)
+    exit_code = main(["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(tmp_path / "out")])
+    captured = capsys.readouterr()
+
+    assert exit_code == 1
+    assert "Batch complete: 2 briefs generated." in captured.out
+    assert "b.txt: Unexpected error (RuntimeError): parser bug" in captured.err
+
+
+def test_run_batch_caps_workers_and_survives_lost_results(tmp_path: Path, monkeypatch) -> None:
+    from concurrent.futures import Future
+
+    from briefsmith_agent import cli
+
+    started: list[int] = []
+
+    class RecordingPool:
+        def __init__(self, max_workers: int) -> None:
+            started.append(max_workers)
+
+        def submit(self, function, *args) -> Future:
+            future: Future = Future()
+            if args[0].name == "b.txt":
+                future.set_exception(cli.BrokenProcessPool("worker died"))
+            else:
+                future.set_result(function(*args))
+            return future
+
+        def shutdown(self, **kwargs) -> None:
+            pass
+
+        def __enter__(self) -> "RecordingPool":
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            pass
+
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", RecordingPool)
+    inputs = []
+    for name in ("a", "b"):
+        inputs.append(tmp_path / f"{name}.txt")
+        inputs[-1].write_text(f"Risk: {name} slip\n", encoding="utf-8")
+    config = cli.RunConfig(cli.Mode.CLIENT, tmp_path / "out", max_bullets=None, max_ktas=4, email_ready=False)
+
+    assert [outcome.error for outcome in cli.run_batch(inputs[:1], config, jobs=8)] == [None]
+    outcomes = list(cli.run_batch(iter(inputs), config, jobs=8))
+
+    # b.txt is retried alone in a one-worker pool, where it fails again.
+    assert started == [2, 1]
+    assert outcomes[0].error is None
+    assert outcomes[1].error == "Unexpected error (BrokenProcessPool): worker died"
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the monkeypatch")
+def test_run_batch_fails_only_the_file_that_crashes_a_worker(tmp_path: Path, monkeypatch) -> None:
+    from briefsmith_agent import cli
+
+    render_briefs = cli.render_briefs
+
+    def crashing_render(input_path: Path, config):
+        if input_path.name == "crash.txt":
+            os._exit(1)
+        return render_briefs(input_path, config)
+
+    monkeypatch.setattr(cli, "render_briefs", crashing_render)
+    inputs = []
+    for name in ("a", "b", "c", "crash", "d", "e", "f"):
+        inputs.append(tmp_path / f"{name}.txt")
+        inputs[-1].write_text(f"Risk: {name} slip\n", encoding="utf-8")
+    config = cli.RunConfig(cli.Mode.CLIENT, tmp_path / "out", max_bullets=None, max_ktas=4, email_ready=False)
+
+    outcomes = list(cli.run_batch(inputs, config, jobs=2))
+
+    assert [outcome.input_path.name for outcome in outcomes if outcome.error] == ["crash.txt"]
+    assert outcomes[3].error.startswith("Unexpected error (BrokenProcessPool)")
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from briefsmith_agent.discovery import iter_batch_files
+from briefsmith_agent.errors import InputValidationError
+
+
+def _touch(path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("Finding: margin improved", encoding="utf-8")
+
+
+def test_discovery_walks_subfolders_depth_first_in_sorted_order(tmp_path: Path) -> None:
+    _touch(tmp_path / "b.txt")
+    _touch(tmp_path / "a.docx")
+    _touch(tmp_path / "client-a" / "2024-01" / "call.txt")
+    _touch(tmp_path / "client-a" / "notes.TXT")
+    _touch(tmp_path / "client-b" / "skip.md")
+    _touch(tmp_path / ".hidden" / "secret.txt")
+
+    found = [path.relative_to(tmp_path).as_posix() for path in iter_batch_files(tmp_path)]
+
+    assert found == ["a.docx", "b.txt", "client-a/notes.TXT", "client-a/2024-01/call.txt"]
+
+
+def test_discovery_applies_patterns_and_max_depth(tmp_path: Path) -> None:
+    _touch(tmp_path / "top.txt")
+    _touch(tmp_path / "client-a" / "keep.txt")
+    _touch(tmp_path / "client-a" / "draft-keep.txt")
+    _touch(tmp_path / "client-a" / "2024-01" / "deep.txt")
+    _touch(tmp_path / "archive" / "old.txt")
+
+    found = iter_batch_files(tmp_path, include=["client-a/*"], exclude=["draft-*", "archive"], max_depth=1)
+
+    assert [path.name for path in found] == ["keep.txt"]
+
+
+def test_discovery_is_lazy_and_reports_empty_directories(tmp_path: Path) -> None:
+    _touch(tmp_path / "first.txt")
+    files = iter_batch_files(tmp_path)
+
+    assert next(files).name == "first.txt"
+    with pytest.raises(InputValidationError, match="No .txt or .docx files found"):
+        list(iter_batch_files(tmp_path, exclude=["*.txt"]))
@@ -1,7 +1,9 @@
+import json
 from pathlib import Path
 
-from briefsmith_agent.formatter import format_markdown
+from briefsmith_agent.formatter import build_brief_document, format_brief, format_markdown
 from briefsmith_agent.models import Brief, Mode
+from briefsmith_agent.parser import parse_notes
 
 
 def _sample_brief() -> Brief:
@@ -50,3 +52,29 @@ def test_formatter_includes_kta_source_snippets() -> None:
 
     assert "## KTA Source Snippets" in markdown
     assert "KTA 1:" in markdown
+
+
+def test_json_document_cites_input_line_numbers() -> None:
+    raw = "Background: kickoff call\n\n00:01 Alice: Finding: margin improved 4%\nRisk: churn in SMB\n"
+    brief = parse_notes(raw, Mode.INTERNAL)
+    document = json.loads(format_brief(brief, Mode.INTERNAL, Path("notes.txt"), output_format="json"))
+
+    assert document["mode"] == "internal"
+    assert document["source"] == "notes.txt"
+    assert document["sections"]["key_findings"] == brief.key_findings
+    cited = {kta["citation"]["text"]: kta["citation"]["line"] for kta in document["ktas"] if kta["citation"]}
+    assert cited["Finding: margin improved 4%"] == 3
+    assert cited["Risk: churn in SMB"] == 4
+
+
+def test_ndjson_record_is_one_compact_line_matching_json_document() -> None:
+    record = format_brief(_sample_brief(), Mode.CLIENT, Path("a.txt"), output_format="ndjson", email_ready=True)
+    document = build_brief_document(_sample_brief(), Mode.CLIENT, Path("a.txt"), email_ready=True)
+
+    assert record.endswith("\n") and record.count("\n") == 1
+    parsed = json.loads(record)
+    parsed.pop("generated_at")
+    document.pop("generated_at")
+    assert parsed == document
+    assert "email_draft" in parsed
+    assert all(kta["citation"] is None or kta["citation"]["line"] is None for kta in parsed["ktas"])
@@ -0,0 +1,103 @@
+import json
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from briefsmith_agent.errors import InputValidationError
+from briefsmith_agent.keywords import KeywordMatcher, load_keyword_profile, parse_keyword_profile
+from briefsmith_agent.models import Mode
+from briefsmith_agent.parser import _CLASSIFY_PRIORITY, _SECTION_KEYWORDS, _SECTION_LIMITS
+
+
+def _regex_hits(lower: str) -> tuple[int, ...]:
+    return tuple(
+        sum(1 for keyword in keywords if re.search(rf"\b{re.escape(keyword)}\b", lower))
+        for keywords in _SECTION_KEYWORDS.values()
+    )
+
+
+def test_matcher_agrees_with_word_boundary_regex() -> None:
+    matcher = KeywordMatcher(_SECTION_KEYWORDS, _CLASSIFY_PRIORITY)
+    vocabulary = sorted({word for keywords in _SECTION_KEYWORDS.values() for keyword in keywords for word in
+                         re.findall(r"\w+", keyword)})
+    vocabulary += ["margin", "follow", "up", "next", "steps", "12%", "q3"]
+    rng = random.Random(7)
+    for _ in range(2_000):
+        words = rng.choices(vocabulary, k=rng.randint(1, 10))
+        line = "".join(word + rng.choice([" ", " ", "-", ", ", "/"]) for word in words).strip(" ,/-")
+        assert matcher.scan(line) == _regex_hits(line), line
+
+
+def test_matcher_phrase_separators_are_exact_except_whitespace() -> None:
+    matcher = KeywordMatcher({"next_steps": {"follow-up", "working capital"}}, ["next_steps"])
+
+    assert matcher.scan("schedule a follow-up call") == (1,)
+    assert matcher.scan("we will follow up next week") == (0,)
+    assert matcher.scan("working   capital target") == (1,)
+    assert matcher.scan("working-capital target") == (0,)
+
+
+def test_parse_profile_merges_defaults_and_mode_overrides() -> None:
+    profile = parse_keyword_profile(
+        {
+            "name": "pe",
+            "keywords": {"risks": ["Covenant breach", "leverage"]},
+            "limits": {"risks": 7},
+            "modes": {"investment": {"keywords": {"key_findings": ["ebitda bridge"]}, "limits": {"risks": 9}}},
+        }
+    )
+
+    internal = profile.section_keywords(Mode.INTERNAL, _SECTION_KEYWORDS)
+    investment = profile.section_keywords(Mode.INVESTMENT, _SECTION_KEYWORDS)
+    assert {"covenant breach", "leverage"} <= internal["risks"]
+    assert _SECTION_KEYWORDS["risks"] <= internal["risks"]
+    assert "ebitda bridge" not in internal["key_findings"]
+    assert "ebitda bridge" in investment["key_findings"]
+    assert profile.section_limits(Mode.INTERNAL, _SECTION_LIMITS[Mode.INTERNAL])["risks"] == 7
+    assert profile.section_limits(Mode.INVESTMENT, _SECTION_LIMITS[Mode.INVESTMENT])["risks"] == 9
+
+
+def test_profile_digest_ignores_name_and_keyword_order() -> None:
+    first = parse_keyword_profile({"name": "a", "keywords": {"risks": ["leverage", "covenant"]}})
+    second = parse_keyword_profile({"name": "b", "keywords": {"risks": ["Covenant", "leverage"]}})
+    third = parse_keyword_profile({"keywords": {"risks": ["covenant"]}})
+
+    assert first.digest == second.digest
+    assert first.digest != third.digest
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        {"keyword": {}},
+        {"keywords": {"risk": ["leverage"]}},
+        {"keywords": {"risks": "leverage"}},
+        {"keywords": {"risks": ["-leverage"]}},
+        {"limits": {"risks": 0}},
+        {"modes": {"board": {}}},
+        {"extends_defaults": "yes"},
+    ],
+)
+def test_parse_profile_rejects_invalid_documents(raw: dict) -> None:
+    with pytest.raises(InputValidationError):
+        parse_keyword_profile(raw)
+
+
+def test_load_profile_reads_toml_and_json_and_caches(tmp_path: Path) -> None:
+    toml_path = tmp_path / "pe.toml"
+    toml_path.write_text('extends_defaults = false\n[keywords]\nrisks = ["leverage"]\n', encoding="utf-8")
+    json_path = tmp_path / "pe.json"
+    json_path.write_text(json.dumps({"extends_defaults": False, "keywords": {"risks": ["leverage"]}}), encoding="utf-8")
+
+    from_toml = load_keyword_profile(toml_path)
+    assert from_toml.name == "pe"
+    assert from_toml.digest == load_keyword_profile(json_path).digest
+    assert load_keyword_profile(toml_path) is from_toml
+    assert from_toml.section_keywords(Mode.CLIENT, _SECTION_KEYWORDS)["situation"] == frozenset()
+
+    with pytest.raises(InputValidationError):
+        load_keyword_profile(tmp_path / "missing.json")
+    with pytest.raises(InputValidationError):
+        load_keyword_profile(tmp_path / "profile.yaml")
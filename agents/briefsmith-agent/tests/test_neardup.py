@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from briefsmith_agent.neardup import NearDuplicateFilter, jaccard_similarity, word_shingles
+
+
+def test_filter_flags_reworded_lines_above_threshold() -> None:
+    near = NearDuplicateFilter(0.7)
+
+    assert not near.check_and_add(word_shingles("churn is concentrated in the smb segment this quarter"))
+    assert near.check_and_add(word_shingles("churn is concentrated in the smb segment this year"))
+    assert not near.check_and_add(word_shingles("pricing review is scheduled with the board next month"))
+    assert not near.check_and_add(frozenset())
+
+
+def test_shingles_keep_word_order() -> None:
+    assert word_shingles("margin up, churn down") == {"margin up", "up churn", "churn down"}
+    assert word_shingles("risk") == {"risk"}
+    assert jaccard_similarity(word_shingles("margin up, churn down"), word_shingles("churn up, margin down")) == 0.0
+
+    near = NearDuplicateFilter(0.5)
+    assert not near.check_and_add(word_shingles("margin up, churn down"))
+    assert not near.check_and_add(word_shingles("churn up, margin down"))
+
+
+def test_filter_agrees_with_pairwise_jaccard_scan() -> None:
+    rng = random.Random(3)
+    vocabulary = [f"w{idx}" for idx in range(40)]
+    base = [frozenset(rng.sample(vocabulary, 10)) for _ in range(30)]
+    lines = []
+    for _ in range(600):
+        tokens = set(rng.choice(base))
+        tokens.discard(rng.choice(sorted(tokens)))
+        tokens.add(rng.choice(vocabulary))
+        lines.append(frozenset(tokens))
+
+    near = NearDuplicateFilter(0.8)
+    kept: list[frozenset[str]] = []
+    misses = 0
+    for tokens in lines:
+        expected = any(jaccard_similarity(tokens, other) >= 0.8 for other in kept)
+        flagged = near.check_and_add(tokens)
+        if flagged:
+            assert expected
+        elif expected:
+            misses += 1
+        if not flagged:
+            kept.append(tokens)
+
+    assert misses <= len(lines) * 0.05
+
+
+def test_filter_rejects_invalid_threshold() -> None:
+    with pytest.raises(ValueError):
+        NearDuplicateFilter(0.0)
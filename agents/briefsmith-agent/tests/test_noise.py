@@ -0,0 +1,62 @@
+import pickle
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+from briefsmith_agent.errors import InputValidationError
+from briefsmith_agent.noise import NoiseDictionary, load_noise_dictionary
+
+
+def _naive_contains(line: str, phrase: str) -> bool:
+    words = [word.casefold() for word in re.findall(r"\w+", line)]
+    target = phrase.split()
+    return any(words[idx : idx + len(target)] == target for idx in range(len(words)))
+
+
+def test_dictionary_agrees_with_naive_phrase_scan() -> None:
+    rng = random.Random(5)
+    vocabulary = ["prepared", "by", "the", "deal", "team", "draft", "confidential", "page", "of", "notes"]
+    phrases = {" ".join(rng.choices(vocabulary, k=rng.randint(1, 4))) for _ in range(40)}
+    noise = NoiseDictionary(phrases)
+
+    for _ in range(1_000):
+        line = ", ".join(" ".join(rng.choices(vocabulary, k=rng.randint(1, 4))) for _ in range(rng.randint(1, 3)))
+        expected = any(_naive_contains(line, phrase) for phrase in phrases)
+        assert (noise.clean(line) is None) == expected, line
+
+
+def test_dictionary_kinds_and_case_insensitive_matching() -> None:
+    noise = NoiseDictionary(["strictly confidential", "^Prepared by", "~at the end of the day", "~basically"])
+
+    assert noise.clean("STRICTLY Confidential - do not forward") is None
+    assert noise.clean("Prepared by: deal team") is None
+    assert noise.clean("Margin prepared by finance improved") == "Margin prepared by finance improved"
+    assert noise.clean("At the end of the day, margin basically improved") == " , margin   improved"
+    assert noise.clean("Churn held flat") == "Churn held flat"
+
+
+def test_dictionary_digest_and_pickle_round_trip() -> None:
+    noise = NoiseDictionary(["~um okay", "Table of Contents"])
+    same = NoiseDictionary(["table  of contents", "~UM OKAY"])
+    restored = pickle.loads(pickle.dumps(noise))
+
+    assert noise.digest == same.digest != NoiseDictionary(["table of contents"]).digest
+    assert restored.digest == noise.digest
+    assert restored.clean("Table of contents") is None
+
+
+def test_load_noise_dictionary_skips_comments_and_reports_bad_lines(tmp_path: Path) -> None:
+    path = tmp_path / "noise.txt"
+    path.write_text("# template boilerplate\n\n^prepared by\n~kind of like\n", encoding="utf-8")
+
+    noise = load_noise_dictionary(path)
+    assert noise.entries == ("^prepared by", "~kind of like")
+    assert load_noise_dictionary(path) is noise
+
+    path.write_text("ok phrase\n~ --\n", encoding="utf-8")
+    with pytest.raises(InputValidationError, match=":2:"):
+        load_noise_dictionary(path)
+    with pytest.raises(InputValidationError):
+        load_noise_dictionary(tmp_path / "missing.txt")
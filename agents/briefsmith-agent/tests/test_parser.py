@@ -1,5 +1,64 @@
+import random
+import re
+
+from briefsmith_agent.keywords import KeywordMatcher, parse_keyword_profile
 from briefsmith_agent.models import Mode
-from briefsmith_agent.parser import PLACEHOLDER, parse_notes
+from briefsmith_agent.noise import NoiseDictionary
+from briefsmith_agent.parser import (
+    PLACEHOLDER,
+    _FINDINGS_KEYWORDS,
+    _NEXT_STEPS_KEYWORDS,
+    _QUESTION_KEYWORDS,
+    _RISK_KEYWORDS,
+    _SECTION_INDEX,
+    _SECTION_KEYWORDS,
+    _SECTION_LIMITS,
+    _SITUATION_KEYWORDS,
+    _LineFeatures,
+    _classify_features,
+    _classify_line,
+    _clean_transcript_line,
+    _salience_score,
+    _select_top_heap,
+    _select_top_sorted,
+    parse_note_lines,
+    parse_note_lines_modes,
+    parse_notes,
+    parse_notes_modes,
+)
+
+
+def _legacy_contains_any_keyword(line: str, keywords: set[str]) -> bool:
+    lower = line.lower()
+    return any(re.search(rf"\b{re.escape(keyword)}\b", lower) for keyword in keywords)
+
+
+def _legacy_classify_line(line: str) -> str | None:
+    if "?" in line or _legacy_contains_any_keyword(line, _QUESTION_KEYWORDS):
+        return "open_questions"
+    if _legacy_contains_any_keyword(line, _RISK_KEYWORDS):
+        return "risks"
+    if _legacy_contains_any_keyword(line, _NEXT_STEPS_KEYWORDS):
+        return "next_steps"
+    if _legacy_contains_any_keyword(line, _SITUATION_KEYWORDS):
+        return "situation"
+    if _legacy_contains_any_keyword(line, _FINDINGS_KEYWORDS):
+        return "key_findings"
+    return None
+
+
+def _legacy_salience_score(line: str, section: str) -> float:
+    lower = line.lower()
+    score = 1.0
+    if any(char.isdigit() for char in line):
+        score += 1.0
+    if len(line) < 140:
+        score += 0.5
+    if " vs " in lower or "%" in line:
+        score += 0.5
+    keywords = _SECTION_KEYWORDS[section]
+    score += sum(0.4 for kw in keywords if re.search(rf"\b{re.escape(kw)}\b", lower))
+    return score
 
 
 def test_parser_classifies_keywords_into_sections() -> None:
@@ -91,3 +150,288 @@ def test_parser_tracks_source_lines() -> None:
     brief = parse_notes(raw, Mode.INTERNAL)
 
     assert "Background: kickoff" in brief.source_lines
+
+
+def test_parser_tracks_source_line_numbers_through_cleaning() -> None:
+    raw = "Background: kickoff\n\nWEBVTT\n00:01 Bob: Finding: margin improved\n\nRisk: churn\n"
+    expected = {"Background: kickoff": 1, "Finding: margin improved": 4, "Risk: churn": 6}
+
+    for brief in (parse_notes(raw, Mode.INTERNAL), parse_note_lines(raw.splitlines(), Mode.INTERNAL)):
+        assert brief.source_line_numbers is not None
+        numbered = dict(zip(brief.source_lines, brief.source_line_numbers))
+        assert numbered == expected
+
+
+def test_classifier_matches_legacy_keyword_scan() -> None:
+    fragments = [
+        "Risk",
+        "risks",
+        "risky",
+        "risk_factor",
+        "follow-up",
+        "follow-ups",
+        "follow-upper",
+        "followup",
+        "follow up",
+        "next",
+        "next-gen",
+        "Data",
+        "dataset",
+        "current",
+        "concurrent",
+        "unclear",
+        "?",
+        "DUE",
+        "due-diligence",
+        "Über-risk",
+        "analysis",
+        "plan.",
+        "(owner)",
+        "margin",
+        "5%",
+    ]
+    lines = [" ".join(fragments[i : i + width]) for width in (1, 2, 3) for i in range(len(fragments))]
+    lines += [f"{a} {b}" for a in fragments for b in fragments]
+
+    for line in lines:
+        assert _classify_line(line) == _legacy_classify_line(line), line
+
+
+def test_feature_salience_matches_legacy_rescan() -> None:
+    lines = [
+        "Risk: issue and concern on constraint exposure, downside challenge blocker risks issues",
+        "Next step: owner to deliver plan and timeline; action due for follow-up",
+        "Finding: data analysis results vs plan show 12% uplift",
+        "Context: current status and scope overview " + "x" * 140,
+    ]
+    for line in lines:
+        features = _LineFeatures(line)
+        for section, idx in _SECTION_INDEX.items():
+            assert _salience_score(features, idx) == _legacy_salience_score(line, section)
+
+
+def test_streaming_parse_matches_in_memory_parse(tmp_path) -> None:
+    raw = "\n".join(
+        [
+            "[10:02 AM] Alex: Background: diligence kickoff and scope alignment",
+            "Why is EBITDA down?",
+            "Alpha datapoint from interview",
+            "Finding: churn is concentrated in SMB",
+            "Finding: churn is concentrated in SMB!",
+            *[f"Finding: datapoint {idx} improved by {idx % 7}%" for idx in range(40)],
+            *[f"Risk: supplier {idx} issue" for idx in range(12)],
+            "Next step: assign owner for management interview",
+            "Unclassified datapoint 99 vs plan",
+        ]
+    )
+    path = tmp_path / "notes.txt"
+    path.write_text(raw, encoding="utf-8")
+
+    for mode in Mode:
+        expected = parse_notes(raw, mode)
+        with path.open(encoding="utf-8") as handle:
+            streamed = parse_note_lines(handle, mode)
+        assert streamed.situation == expected.situation
+        assert streamed.key_findings == expected.key_findings
+        assert streamed.risks == expected.risks
+        assert streamed.open_questions == expected.open_questions
+        assert streamed.next_steps == expected.next_steps
+        assert len(streamed.source_lines) <= sum(_SECTION_LIMITS[mode].values())
+
+
+def test_streaming_parse_respects_max_bullets() -> None:
+    lines = (f"Finding: datapoint {idx} improved by 5%\n" for idx in range(1000))
+    brief = parse_note_lines(lines, Mode.INTERNAL, max_bullets=2)
+
+    assert len(brief.key_findings) == 2
+    assert brief.risks == [PLACEHOLDER]
+
+
+def test_heap_selection_matches_full_sort_on_ties() -> None:
+    items = [_LineFeatures(f"Finding: datapoint {idx % 3} {'improved 5%' if idx % 4 else ''}") for idx in range(60)]
+    section_idx = _SECTION_INDEX["key_findings"]
+
+    for limit in (1, 3, 5, 59, 60, 80):
+        heap_ranked = _select_top_heap(items, section_idx, limit)
+        sorted_ranked = _select_top_sorted(items, section_idx, limit)
+        assert [id(item) for item in heap_ranked] == [id(item) for item in sorted_ranked]
+
+
+_LEGACY_BULLET_PREFIX_RE = re.compile(r"^\s*(?:[-*]\s+|\d+[.)]\s+)")
+_LEGACY_TIMESTAMP_TOKEN_RE = re.compile(r"^\s*\[?\d{1,2}:\d{2}(?::\d{2})?\s*(?:AM|PM|am|pm)?\]?\s*(?:-\s*)?")
+_LEGACY_METADATA_LINE_RE = re.compile(
+    r"^\s*(?:meeting (?:started|ended)|recording (?:started|stopped)|"
+    r"joined the meeting|left the meeting|transcript(?:ion)?|attendees?:)",
+    re.IGNORECASE,
+)
+_LEGACY_DOCUMENT_NOISE_RE = re.compile(
+    r"^\s*(?:prepared by\b|framing the core question\b|table of contents\b|"
+    r"hoa management\s*&\s*software:\s*\d{4}\s*investment landscape\b)",
+    re.IGNORECASE,
+)
+_LEGACY_FILLER_WORD_RE = re.compile(r"\b(?:um+|uh+|like|you know|sort of|kind of)\b", re.IGNORECASE)
+_LEGACY_SPEAKER_LABEL_RE = re.compile(r"^(?:speaker \d+|host|moderator|me)$", re.IGNORECASE)
+_LEGACY_SPEAKER_NAME_RE = re.compile(r"^[A-Z][a-z]+(?: [A-Z][a-z]+){0,2}$")
+
+
+def _legacy_clean_transcript_line(raw_line: str) -> str:
+    stripped = raw_line.strip()
+    if not stripped or _LEGACY_METADATA_LINE_RE.search(stripped) or _LEGACY_DOCUMENT_NOISE_RE.search(stripped):
+        return ""
+    cleaned = _LEGACY_BULLET_PREFIX_RE.sub("", stripped).strip()
+    while True:
+        updated = _LEGACY_TIMESTAMP_TOKEN_RE.sub("", cleaned).strip()
+        if updated == cleaned:
+            break
+        cleaned = updated
+    if ":" in cleaned:
+        prefix, remainder = cleaned.split(":", 1)
+        normalized = prefix.strip()
+        if normalized and normalized.split()[0].lower() not in {
+            "background", "context", "risk", "finding", "open", "next", "situation"
+        }:
+            if _LEGACY_SPEAKER_LABEL_RE.match(normalized) or _LEGACY_SPEAKER_NAME_RE.match(normalized):
+                cleaned = remainder.strip()
+    cleaned = _LEGACY_FILLER_WORD_RE.sub(" ", cleaned)
+    cleaned = re.sub(r"\s+", " ", cleaned).strip(" -|:")
+    if not cleaned:
+        return ""
+    alpha_words = [w for w in re.split(r"\s+", cleaned) if re.search(r"[A-Za-z]", w)]
+    if 0 < len(alpha_words) <= 5 and all(w[:1].isupper() for w in alpha_words):
+        return ""
+    return cleaned
+
+
+def _synthetic_transcript_lines(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    prefixes = ["", "- ", "* ", "1. ", "12) ", "-", "  \t", "[10:02 AM] ", "10:05 - 10:06 ", "09:15:33 pm ", "[7:00]"]
+    speakers = ["", "Alex: ", "Speaker 2: ", "Moderator: ", "Host:", "Mary Ann Lee: ", "ACME Corp: ", "Risk: "]
+    words = [
+        "margin", "um", "Umm", "uh", "like", "you know", "Sort of", "kind of", "likely", "EBITDA", "12%", "vs",
+        "churn", "SMB", "owner", "next", "liKe", "ıs", "Kelvin\u212a", "ſort of", "café", "  ", "\t", "-", "|",
+        ":", "Risk", "Follow-up", "?", "Q1", "2026",
+    ]
+    specials = [
+        "Meeting started",
+        "recording STOPPED by host",
+        "Transcripts are attached",
+        "Attendees: Alex, Sam",
+        "Prepared by the deal team",
+        "HOA Management & Software: 2025 Investment Landscape overview",
+        "Table of Contents",
+        "   ",
+        "",
+        "Quarterly Update Review",
+        "- - nested bullet",
+        "10. numbered item with 5 points",
+        "[10:02] [10:03] - double stamp",
+    ]
+    lines = []
+    for _ in range(count):
+        if rng.random() < 0.08:
+            lines.append(rng.choice(specials))
+            continue
+        body = " ".join(rng.choices(words, k=rng.randint(1, 14)))
+        lines.append(rng.choice(prefixes) + rng.choice(speakers) + body + rng.choice(["", " ", " -", ":", " |"]))
+    return lines
+
+
+def test_fused_cleaning_matches_legacy_golden_output() -> None:
+    for line in _synthetic_transcript_lines(20_000, seed=42):
+        assert _clean_transcript_line(line) == _legacy_clean_transcript_line(line), repr(line)
+
+
+def test_parser_near_duplicate_threshold_collapses_rewordings() -> None:
+    raw = "\n".join(
+        [
+            "Finding: churn is concentrated in the SMB segment this quarter",
+            "Finding: churn is concentrated in the SMB segment this year",
+            "Finding: pricing uplift held across enterprise renewals",
+        ]
+    )
+
+    exact = parse_notes(raw, Mode.INTERNAL)
+    near = parse_notes(raw, Mode.INTERNAL, dedupe_threshold=0.7)
+    streamed = parse_note_lines(raw.splitlines(), Mode.INTERNAL, dedupe_threshold=0.7)
+
+    assert len(exact.key_findings) == 3
+    assert len(near.key_findings) == 2
+    assert streamed.key_findings == near.key_findings
+
+    reordered = "Finding: margin up 4%, churn down 2%\nFinding: churn up 4%, margin down 2%"
+    assert len(parse_notes(reordered, Mode.INTERNAL, dedupe_threshold=0.5).key_findings) == 2
+    assert len(parse_note_lines(reordered.splitlines(), Mode.INTERNAL, dedupe_threshold=0.5).key_findings) == 2
+
+
+def test_parser_keyword_profile_reclassifies_and_limits() -> None:
+    profile = parse_keyword_profile(
+        {"keywords": {"risks": ["covenant headroom"]}, "modes": {"client": {"limits": {"risks": 1}}}}
+    )
+    raw = "\n".join(
+        [
+            "Covenant headroom narrows to 0.4x in Q3",
+            "Risk: supplier concentration above 30%",
+            "Finding: margin improved 2% vs plan",
+        ]
+    )
+
+    default = parse_notes(raw, Mode.INTERNAL)
+    custom = parse_notes(raw, Mode.INTERNAL, keyword_profile=profile)
+    client = parse_notes(raw, Mode.CLIENT, keyword_profile=profile)
+    streamed = parse_note_lines(raw.splitlines(), Mode.INTERNAL, keyword_profile=profile)
+
+    assert not any("Covenant" in bullet for bullet in default.risks)
+    assert any("Covenant" in bullet for bullet in custom.risks)
+    assert len(client.risks) == 1
+    assert streamed.risks == custom.risks
+
+
+def test_parser_noise_phrases_drop_and_strip_lines() -> None:
+    noise = NoiseDictionary(["^deal team only", "~at the end of the day"])
+    raw = "\n".join(
+        [
+            "- [10:02] Alex Chen: Deal team only - do not forward",
+            "Finding: at the end of the day margin improved 2% vs plan",
+        ]
+    )
+
+    brief = parse_notes(raw, Mode.INTERNAL, noise_phrases=noise)
+    streamed = parse_note_lines(raw.splitlines(), Mode.INTERNAL, noise_phrases=noise)
+
+    assert brief.source_lines == ["Finding: margin improved 2% vs plan"]
+    assert streamed.source_lines == brief.source_lines
+
+
+def test_multi_mode_parse_matches_single_mode_parses() -> None:
+    raw = "\n".join(
+        [f"Finding: margin improved {idx}% vs plan" for idx in range(8)]
+        + [f"Risk: supplier {idx} timeline slip" for idx in range(8)]
+        + ["Covenant headroom narrows", "What is the plan for churn?", "Next step: owner to send model"]
+    )
+    profile = parse_keyword_profile(
+        {"modes": {"investment": {"keywords": {"risks": ["covenant headroom"]}, "limits": {"risks": 12}}}}
+    )
+    modes = tuple(Mode)
+
+    for keyword_profile in (None, profile):
+        combined = parse_notes_modes(raw, modes, keyword_profile=keyword_profile)
+        streamed = parse_note_lines_modes(raw.splitlines(), modes, keyword_profile=keyword_profile)
+        for mode in modes:
+            single = parse_notes(raw, mode, keyword_profile=keyword_profile)
+            single_streamed = parse_note_lines(raw.splitlines(), mode, keyword_profile=keyword_profile)
+            assert combined[mode].risks == single.risks
+            assert combined[mode].key_findings == single.key_findings
+            assert combined[mode].next_steps == single.next_steps
+            assert combined[mode].source_lines == single.source_lines
+            assert streamed[mode].risks == single_streamed.risks
+            assert streamed[mode].source_lines == single_streamed.source_lines
+    investment = parse_notes_modes(raw, modes, keyword_profile=profile)[Mode.INVESTMENT]
+    assert any("Covenant" in bullet for bullet in investment.risks)
+
+
+def test_classify_features_uses_the_matcher_that_produced_the_hits() -> None:
+    matcher = KeywordMatcher({"risks": {"slip"}, "situation": {"kickoff"}}, ("situation", "risks"))
+    features = _LineFeatures("timeline slip", matcher)
+
+    assert features.hits == (1, 0)
+    assert _classify_features(features, matcher) == "risks"
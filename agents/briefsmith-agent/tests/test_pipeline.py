@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+from pathlib import Path
+import tarfile
+import time
+import zipfile
+
+import pytest
+
+from briefsmith_agent import pipeline
+from briefsmith_agent.cli import RunConfig, main, run_batch
+from briefsmith_agent.manifest import BatchManifest
+from briefsmith_agent.models import Mode
+from briefsmith_agent.pipeline import format_stage_report, run_pipeline
+
+
+def _strip_generated(markdown: str) -> str:
+    return "\n".join(line for line in markdown.splitlines() if not line.startswith("- Generated:"))
+
+
+def _write_notes(batch_dir: Path, count: int) -> list[Path]:
+    batch_dir.mkdir()
+    paths = []
+    for idx in range(count):
+        path = batch_dir / f"notes_{idx:02d}.txt"
+        path.write_text(f"Finding: margin improved {idx}%\nRisk: timeline slip {idx}\nWhat is the plan?\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def test_pipeline_matches_run_batch_in_input_order(tmp_path: Path) -> None:
+    files = _write_notes(tmp_path / "notes", 12)
+    files.insert(5, tmp_path / "notes" / "missing.txt")
+    pipeline_config = RunConfig(Mode.CLIENT, tmp_path / "pipeline", None, 4, False)
+    batch_config = RunConfig(Mode.CLIENT, tmp_path / "batch", None, 4, False)
+
+    report = run_pipeline(files, pipeline_config, jobs=2, depth=2, io_workers=2)
+    expected = list(run_batch(files, batch_config))
+
+    assert [outcome.input_path for outcome in report.outcomes] == files
+    assert [outcome.error for outcome in report.outcomes] == [outcome.error for outcome in expected]
+    for outcome, reference in zip(report.outcomes, expected):
+        if reference.output_path is None:
+            continue
+        assert _strip_generated(outcome.output_path.read_text(encoding="utf-8")) == _strip_generated(
+            reference.output_path.read_text(encoding="utf-8")
+        )
+    assert [stage.name for stage in report.stages] == ["read", "render", "write"]
+    assert report.stages[1].items == 12
+    assert format_stage_report(report)[0].startswith("stage")
+
+
+def test_pipeline_skips_unchanged_files_with_manifest(tmp_path: Path) -> None:
+    files = _write_notes(tmp_path / "notes", 3)
+    config = RunConfig(Mode.INTERNAL, tmp_path / "outputs", None, 4, False)
+
+    manifest = BatchManifest.load(config.output_dir)
+    first = run_pipeline(files, config, depth=1, manifest=manifest)
+    manifest.save()
+    manifest = BatchManifest.load(config.output_dir)
+    second = run_pipeline(files, config, depth=1, manifest=manifest)
+
+    assert not any(outcome.skipped for outcome in first.outcomes)
+    assert all(outcome.skipped for outcome in second.outcomes)
+    assert [outcome.output_path for outcome in second.outcomes] == [outcome.output_path for outcome in first.outcomes]
+
+
+def test_pipeline_records_unexpected_errors_per_file(tmp_path: Path, monkeypatch) -> None:
+    files = _write_notes(tmp_path / "notes", 3)
+    read_input_text = pipeline.read_input_text
+    write_briefs = pipeline.write_briefs
+
+    def flaky_read(path: Path, *args) -> str:
+        if path.name == "notes_00.txt":
+            raise RuntimeError("reader bug")
+        return read_input_text(path, *args)
+
+    def flaky_write(rendered, config, input_path, content_hash):
+        if input_path.name == "notes_01.txt":
+            raise KeyError("writer bug")
+        return write_briefs(rendered, config, input_path, content_hash)
+
+    monkeypatch.setattr(pipeline, "read_input_text", flaky_read)
+    monkeypatch.setattr(pipeline, "write_briefs", flaky_write)
+    report = run_pipeline(files, RunConfig(Mode.CLIENT, tmp_path / "out", None, 4, False), depth=1)
+
+    assert [outcome.error for outcome in report.outcomes] == [
+        "Unexpected error (RuntimeError): reader bug",
+        "Unexpected error (KeyError): 'writer bug'",
+        None,
+    ]
+    assert report.outcomes[2].output_path.exists()
+
+
+def test_cli_pipeline_depth_reports_stage_utilization(tmp_path: Path, capsys) -> None:
+    _write_notes(tmp_path / "notes", 3)
+    base_args = ["--batch-dir", str(tmp_path / "notes"), "--mode", "client", "--output-dir", str(tmp_path / "out")]
+
+    assert main([*base_args, "--pipeline-depth", "2", "--jobs", "2"]) == 0
+    captured = capsys.readouterr()
+    assert "Batch complete: 3 briefs generated." in captured.out
+    assert "Pipeline stage utilization:" in captured.out
+
+    assert main([*base_args, "--pipeline-depth", "0"]) == 2
+    assert "--pipeline-depth must be >= 1" in capsys.readouterr().err
+
+    assert main([*base_args, "--pipeline-depth", "2", "--stream"]) == 2
+    assert "--stream cannot be combined with --pipeline-depth" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the monkeypatch")
+def test_pipeline_survives_a_crashed_render_worker(tmp_path: Path, monkeypatch) -> None:
+    files = _write_notes(tmp_path / "notes", 7)
+    render_texts = pipeline.render_texts
+
+    def crashing_render(text: str, source_path: Path, *args):
+        if source_path.name == "notes_03.txt":
+            os._exit(1)
+        return render_texts(text, source_path, *args)
+
+    monkeypatch.setattr(pipeline, "render_texts", crashing_render)
+    config = RunConfig(Mode.CLIENT, tmp_path / "out", None, 4, False, batch_sink="zip")
+    report = run_pipeline(files, config, jobs=2, depth=2, io_workers=2)
+
+    assert [outcome.input_path.name for outcome in report.outcomes if outcome.error] == ["notes_03.txt"]
+    assert report.outcomes[3].error.startswith("Unexpected error (BrokenProcessPool)")
+    with zipfile.ZipFile(report.outcomes[0].output_path) as archive:
+        assert archive.namelist() == [f"brief_client_notes_{idx:02d}.md" for idx in range(7) if idx != 3]
+
+
+def test_pipeline_feeds_the_batch_sink_in_input_order(tmp_path: Path, monkeypatch) -> None:
+    files = _write_notes(tmp_path / "notes", 8)
+    write_item = pipeline._write_item
+
+    def slow_early_writes(item, config, to_sink):
+        # Earlier files finish writing last, which would reverse a completion-ordered sink.
+        time.sleep(0.02 * (8 - item.seq))
+        return write_item(item, config, to_sink)
+
+    monkeypatch.setattr(pipeline, "_write_item", slow_early_writes)
+    config = RunConfig(Mode.CLIENT, tmp_path / "out", None, 4, False, batch_sink="tar")
+    report = run_pipeline(files, config, depth=8, io_workers=4)
+
+    with tarfile.open(report.outcomes[0].output_path) as archive:
+        assert archive.getnames() == [f"brief_client_notes_{idx:02d}.md" for idx in range(8)]
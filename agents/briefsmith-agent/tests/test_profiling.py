@@ -0,0 +1,56 @@
+import json
+from pathlib import Path
+import pickle
+
+from briefsmith_agent.cli import main
+from briefsmith_agent.models import Mode
+from briefsmith_agent.parser import parse_notes
+from briefsmith_agent.profiling import FileProfile, count, format_profile_table, is_profiling, recording, stage
+
+
+def test_stage_is_a_shared_noop_without_an_active_profile() -> None:
+    assert not is_profiling()
+    assert stage("clean") is stage("rank")
+    count(lines=10)
+
+
+def test_recording_tracks_exclusive_stage_time_and_counters() -> None:
+    profile = FileProfile("notes.txt")
+    with recording(profile):
+        assert is_profiling()
+        with stage("format"):
+            with stage("citation"):
+                sum(range(20_000))
+        parse_notes("Risk: timeline slip\nFinding: margin improved\n", Mode.INTERNAL)
+    assert not is_profiling()
+
+    assert profile.lines == 2
+    assert {"format", "citation", "clean", "classify", "rank"} <= set(profile.stages)
+    assert profile.stages["citation"].calls == 2
+    staged = sum(timing.wall_seconds for timing in profile.stages.values())
+    assert 0 < staged <= profile.wall_seconds
+
+    restored = pickle.loads(pickle.dumps(profile))
+    assert restored.to_json() == profile.to_json()
+    assert format_profile_table([profile, restored])[0].startswith("Profile: 2 files, 4 lines")
+
+
+def test_cli_profile_writes_table_jsonl_and_dumps(tmp_path: Path, capsys) -> None:
+    batch_dir = tmp_path / "notes"
+    batch_dir.mkdir()
+    for idx in range(3):
+        (batch_dir / f"n{idx}.txt").write_text(f"Finding: margin improved {idx}%\nRisk: slip\n", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    base_args = ["--batch-dir", str(batch_dir), "--mode", "client", "--output-dir", str(output_dir), "--jobs", "1"]
+
+    assert main([*base_args, "--profile", "--profile-slowest", "1"]) == 0
+    captured = capsys.readouterr()
+    assert "Profile: 3 files, 6 lines" in captured.out
+    records = [json.loads(line) for line in (output_dir / "briefsmith-profile.jsonl").read_text().splitlines()]
+    assert len(records) == 3
+    assert records[0]["bytes_written"] > 0
+    assert "write" in records[0]["stages"]
+    assert len(list((output_dir / "profiles").glob("01_*.prof"))) == 1
+
+    assert main([*base_args, "--profile-slowest", "2"]) == 2
+    assert "requires --profile" in capsys.readouterr().err
@@ -1,10 +1,12 @@
 from pathlib import Path
+import xml.etree.ElementTree as ET
 import zipfile
 
 import pytest
 
+from briefsmith_agent import reader
 from briefsmith_agent.errors import FileReadError, InputValidationError
-from briefsmith_agent.reader import read_input_text
+from briefsmith_agent.reader import _read_docx_text, iter_input_lines, read_input_text
 
 
 def _write_minimal_docx(path: Path, paragraphs: list[str]) -> None:
@@ -58,3 +60,109 @@ def test_reader_rejects_invalid_docx(tmp_path: Path) -> None:
 
     with pytest.raises(FileReadError, match="Failed to parse .docx file"):
         read_input_text(path)
+
+
+def _legacy_read_docx_text(path: Path) -> str:
+    namespace = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    with zipfile.ZipFile(path) as archive:
+        root = ET.fromstring(archive.read("word/document.xml"))
+    lines = []
+    for paragraph in root.findall(".//w:p", namespace):
+        texts = [node.text for node in paragraph.findall(".//w:t", namespace) if node.text]
+        line = "".join(texts).strip()
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def _write_docx_body(path: Path, body: str) -> None:
+    document_xml = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", document_xml)
+
+
+def test_streaming_docx_text_matches_tree_extraction(tmp_path: Path) -> None:
+    bodies = {
+        "runs": "<w:p><w:r><w:t>Risk: </w:t></w:r><w:r><w:t xml:space='preserve'> timeline </w:t></w:r></w:p>"
+        "<w:p><w:r><w:t></w:t></w:r></w:p><w:p/>",
+        "table": "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Cell A</w:t></w:r></w:p></w:tc>"
+        "<w:tc><w:p><w:r><w:t>Cell B</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+        "<w:p><w:r><w:t>After table</w:t></w:r></w:p>",
+        "nested": "<w:p><w:r><w:t>Outer start </w:t></w:r><w:r><w:pict><w:txbxContent>"
+        "<w:p><w:r><w:t>Inner box</w:t></w:r></w:p><w:p><w:r><w:t>Second box</w:t></w:r></w:p>"
+        "</w:txbxContent></w:pict></w:r><w:r><w:t>outer end</w:t></w:r></w:p>"
+        "<w:p><w:r><w:t>Trailing</w:t></w:r></w:p>",
+        "large": "".join(f"<w:p><w:r><w:t>Finding {idx}: margin improved</w:t></w:r></w:p>" for idx in range(2000)),
+    }
+    for name, body in bodies.items():
+        path = tmp_path / f"{name}.docx"
+        _write_docx_body(path, body)
+        assert _read_docx_text(path) == _legacy_read_docx_text(path), name
+
+    path = tmp_path / "fixture.docx"
+    _write_minimal_docx(path, ["Background: kickoff", "Risk: timeline slip", "   ", "Next step: owner"])
+    assert _read_docx_text(path) == _legacy_read_docx_text(path)
+
+
+def test_reader_reports_docx_paragraph_numbers_without_changing_text(tmp_path: Path) -> None:
+    path = tmp_path / "gaps.docx"
+    _write_minimal_docx(path, ["", "Background: kickoff", "", "Risk: timeline slip"])
+    numbers: list[int] = []
+    streamed: list[int] = []
+
+    assert read_input_text(path, numbers) == _legacy_read_docx_text(path) == "Background: kickoff\nRisk: timeline slip"
+    assert list(iter_input_lines(path, streamed)) == ["Background: kickoff", "Risk: timeline slip"]
+    assert numbers == streamed == [2, 4]
+
+
+def test_reader_decodes_windows_1252_and_bom_text(tmp_path: Path) -> None:
+    cp1252_path = tmp_path / "cp1252.txt"
+    cp1252_path.write_bytes("Risk: “café” pricing – 5%\n".encode("cp1252"))
+    bom_path = tmp_path / "bom.txt"
+    bom_path.write_bytes("Background: kickoff\r\n".encode("utf-16"))
+
+    assert read_input_text(cp1252_path) == "Risk: “café” pricing – 5%\n"
+    assert read_input_text(bom_path) == "Background: kickoff\r\n"
+    assert list(iter_input_lines(cp1252_path)) == ["Risk: “café” pricing – 5%"]
+    assert list(iter_input_lines(bom_path)) == ["Background: kickoff"]
+
+
+def test_reader_chunked_lines_match_splitlines(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(reader, "_MMAP_THRESHOLD", 64)
+    monkeypatch.setattr(reader, "_DECODE_CHUNK_SIZE", 7)
+    text = "Finding: café margin\r\nRisk:  slip\r\rNext\n\nQuestion?\x0cLast line without break"
+    path = tmp_path / "large.txt"
+    path.write_bytes(text.encode("utf-8"))
+
+    assert list(iter_input_lines(path)) == text.splitlines()
+
+
+def test_reader_sniffs_a_prefix_and_falls_back_when_a_later_chunk_fails(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(reader, "_MMAP_THRESHOLD", 64)
+    monkeypatch.setattr(reader, "_DECODE_CHUNK_SIZE", 16)
+    monkeypatch.setattr(reader, "_ENCODING_SNIFF_SIZE", 32)
+    # The prefix cuts "é" in half, which must not count against UTF-8.
+    head = "Finding: margin improved in café\n"
+    path = tmp_path / "mixed.txt"
+    path.write_bytes(head.encode("utf-8") + "Risk: “slip” – later\n".encode("cp1252") * 4)
+
+    assert reader._detect_file_encoding(path) == "utf-8"
+    assert list(iter_input_lines(path)) == ["Finding: margin improved in café", *["Risk: “slip” – later"] * 4]
+
+    decoded: list[str] = []
+    monkeypatch.setattr(reader, "_decodes_cleanly", lambda data, *args, **kwargs: decoded.append(len(data)) or True)
+    reader._detect_file_encoding(path)
+    assert decoded == [32]
+
+
+def test_reader_line_iterator_rejects_blank_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(reader, "_MMAP_THRESHOLD", 16)
+    path = tmp_path / "blank.txt"
+    path.write_text(" \n" * 50, encoding="utf-8")
+
+    with pytest.raises(InputValidationError, match="Input file is empty"):
+        iter_input_lines(path)
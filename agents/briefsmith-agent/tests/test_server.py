@@ -0,0 +1,159 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from http.client import HTTPConnection
+import json
+import os
+from pathlib import Path
+import threading
+
+import pytest
+
+from briefsmith_agent.cli import main
+from briefsmith_agent.errors import InputValidationError
+from briefsmith_agent.models import Mode
+from briefsmith_agent.server import BriefServer, parse_brief_request
+
+
+@pytest.fixture
+def server():
+    brief_server = BriefServer(("127.0.0.1", 0), jobs=1, queue_size=1)
+    thread = threading.Thread(target=brief_server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield brief_server
+    finally:
+        brief_server.shutdown()
+        brief_server.server_close()
+        thread.join()
+
+
+def _request(server: BriefServer, method: str, path: str, body: object = None) -> tuple[int, dict, dict]:
+    connection = HTTPConnection(*server.server_address[:2], timeout=30)
+    try:
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        connection.request(method, path, body=data, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_server_renders_text_and_writes_path_requests(server: BriefServer, tmp_path: Path) -> None:
+    status, _, body = _request(server, "GET", "/health")
+    assert status == 200
+    assert body["status"] == "ok"
+
+    status, _, body = _request(
+        server, "POST", "/brief", {"mode": "internal", "text": "Risk: timeline slip\n", "source_name": "call.txt"}
+    )
+    assert status == 200
+    assert "- Source: `call.txt`" in body["markdown"]
+    assert "Timeline slip." in body["markdown"]
+    assert "output_path" not in body
+
+    input_path = tmp_path / "notes.txt"
+    input_path.write_text("Finding: margin improved\n", encoding="utf-8")
+    output_dir = tmp_path / "outputs"
+    status, _, body = _request(
+        server,
+        "POST",
+        "/brief",
+        {"mode": "client", "path": str(input_path), "output_dir": str(output_dir), "write": True},
+    )
+    assert status == 200
+    assert Path(body["output_path"]).read_text(encoding="utf-8") == body["markdown"]
+
+
+def test_server_returns_json_brief_documents(server: BriefServer, tmp_path: Path) -> None:
+    payload = {"mode": "internal", "text": "\nRisk: timeline slip\n", "format": "json"}
+    status, _, body = _request(server, "POST", "/brief", payload)
+    assert status == 200
+    assert "markdown" not in body
+    assert body["brief"]["sections"]["risks"] == ["Timeline slip."]
+    assert body["brief"]["ktas"][0]["citation"] == {"text": "Risk: timeline slip", "line": 2}
+
+    output_dir = tmp_path / "outputs"
+    status, _, body = _request(server, "POST", "/brief", {**payload, "output_dir": str(output_dir), "write": True})
+    assert status == 200
+    assert body["output_path"].endswith(".json")
+    assert json.loads(Path(body["output_path"]).read_text(encoding="utf-8"))["mode"] == "internal"
+
+
+def test_server_reports_errors_and_backpressure(server: BriefServer, tmp_path: Path) -> None:
+    status, _, body = _request(server, "POST", "/brief", {"mode": "internal", "path": str(tmp_path / "missing.txt")})
+    assert status == 400
+    assert "Input file not found" in body["error"]
+
+    status, _, _ = _request(server, "POST", "/brief", {"mode": "nope", "text": "x"})
+    assert status == 400
+    assert _request(server, "GET", "/missing")[0] == 404
+
+    for _ in range(server.jobs + server.queue_size):
+        server._slots.acquire()
+    try:
+        status, headers, body = _request(server, "POST", "/brief", {"mode": "internal", "text": "Risk: slip"})
+    finally:
+        for _ in range(server.jobs + server.queue_size):
+            server._slots.release()
+    assert status == 503
+    assert headers["Retry-After"] == "1"
+
+
+def test_server_rejects_negative_content_length(server: BriefServer) -> None:
+    for path in ("/brief", "/missing"):
+        connection = HTTPConnection(*server.server_address[:2], timeout=30)
+        try:
+            connection.putrequest("POST", path)
+            connection.putheader("Content-Length", "-1")
+            connection.endheaders()
+            response = connection.getresponse()
+            assert response.status == (400 if path == "/brief" else 404)
+            response.read()
+        finally:
+            connection.close()
+
+
+def test_server_maps_unexpected_worker_errors_to_500(server: BriefServer, monkeypatch) -> None:
+    def failing_submit(request):
+        future = Future()
+        future.set_exception(RuntimeError("renderer bug"))
+        return future
+
+    monkeypatch.setattr(server, "submit", failing_submit)
+    status, _, body = _request(server, "POST", "/brief", {"mode": "internal", "text": "Risk: slip"})
+    assert status == 500
+    assert body == {"error": "Unexpected error (RuntimeError): renderer bug"}
+
+
+def test_server_replaces_a_broken_worker_pool(server: BriefServer) -> None:
+    with pytest.raises(BrokenProcessPool):
+        server._executor.submit(os._exit, 1).result()
+
+    status, _, body = _request(server, "POST", "/brief", {"mode": "internal", "text": "Risk: timeline slip"})
+    assert status == 200
+    assert "timeline slip" in body["markdown"]
+
+
+def test_parse_brief_request_validates_fields() -> None:
+    request = parse_brief_request({"mode": "investment", "text": "Risk: slip", "max_ktas": 2, "dedupe_threshold": 1})
+    assert request.config.mode is Mode.INVESTMENT
+    assert request.config.max_ktas == 2
+    assert request.path is None
+
+    for payload in (
+        [],
+        {"mode": "client"},
+        {"mode": "client", "text": "a", "path": "b.txt"},
+        {"mode": "client", "text": "a", "max_ktas": 0},
+        {"mode": "client", "text": "a", "max_bullets": True},
+        {"mode": "client", "text": "a", "citation_engine": "tfidf"},
+        {"mode": "client", "text": "a", "format": "ndjson"},
+        {"mode": "client", "text": "a", "keyword_profile": "missing-profile.json"},
+    ):
+        with pytest.raises(InputValidationError):
+            parse_brief_request(payload)
+
+
+def test_cli_serve_rejects_invalid_arguments(capsys) -> None:
+    assert main(["serve", "--jobs", "0"]) == 2
+    assert "--jobs must be >= 1" in capsys.readouterr().err
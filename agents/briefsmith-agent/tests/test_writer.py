@@ -1,7 +1,13 @@
+from concurrent.futures import ThreadPoolExecutor
+import json
 from pathlib import Path
+import tarfile
+import zipfile
+
+import pytest
 
 from briefsmith_agent.models import Mode
-from briefsmith_agent.writer import save_markdown
+from briefsmith_agent.writer import BatchSink, ConcatSink, naming_template, open_batch_sink, save_markdown, save_output
 
 
 def test_writer_creates_directory_and_writes_file(tmp_path: Path) -> None:
@@ -13,3 +19,96 @@ def test_writer_creates_directory_and_writes_file(tmp_path: Path) -> None:
     assert output_path.name.startswith("brief_internal_")
     assert output_path.suffix == ".md"
     assert output_path.read_text(encoding="utf-8") == "# Test\n"
+
+
+def test_writer_never_overwrites_on_name_collisions(tmp_path: Path) -> None:
+    def write(index: int) -> Path:
+        return save_output(f"# {index}\n", Mode.CLIENT, tmp_path, ".md", "stem", Path("in/notes.txt"))
+
+    with ThreadPoolExecutor(8) as pool:
+        paths = list(pool.map(write, range(24)))
+
+    # Any thread may win the bare name; the rest take every numbered variant without gaps.
+    names = sorted(path.name for path in paths)
+    assert names == sorted(["brief_client_notes.md", *(f"brief_client_notes_{copy}.md" for copy in range(2, 25))])
+    assert sorted(path.read_text(encoding="utf-8") for path in paths) == sorted(f"# {index}\n" for index in range(24))
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(path.name for path in paths)
+
+
+def test_writer_content_naming_is_reproducible_and_reuses_existing(tmp_path: Path) -> None:
+    first = save_output("# A\n", Mode.CLIENT, tmp_path, ".md", "content", Path("a.txt"), "hash-a")
+    again = save_output("# A again\n", Mode.CLIENT, tmp_path, ".md", "content", Path("a.txt"), "hash-a")
+    other_mode = save_output("# A\n", Mode.INTERNAL, tmp_path, ".md", "content", Path("a.txt"), "hash-a")
+    templated = save_output("# B\n", Mode.CLIENT, tmp_path, ".json", "{stem}-{mode}", Path("b.txt"))
+
+    copy = save_output("# A\n", Mode.CLIENT, tmp_path, ".md", "content", Path("copy/a.txt"), "hash-a")
+
+    assert again == first
+    assert first.read_text(encoding="utf-8") == "# A\n"
+    assert other_mode != first
+    # Identical content from another input gets its own brief instead of the first file's.
+    assert copy != first
+    assert templated.name == "b-client.json"
+
+
+def test_naming_template_validation() -> None:
+    assert naming_template("timestamp") == "brief_{mode}_{timestamp}"
+    assert naming_template("{stem}_{digest}") == "{stem}_{digest}"
+    for naming in ("fixed-name", "{owner}", "{stem", "{stem}/{mode}", "{0}"):
+        with pytest.raises(ValueError):
+            naming_template(naming)
+
+
+def test_concat_sink_publishes_on_close_with_offset_index(tmp_path: Path) -> None:
+    output_dir = tmp_path / "outputs"
+    sink = open_batch_sink("concat", output_dir, ".md")
+    assert isinstance(sink, ConcatSink)
+
+    assert sink.write(Path("a/notes.txt"), {Mode.CLIENT: "# A – client\n", Mode.INTERNAL: "# A internal\n"}) == sink.path
+    sink.write(Path("b/notes.txt"), {Mode.CLIENT: "# B client\n"})
+    assert not sink.path.exists()
+    sink.close()
+
+    data = sink.path.read_bytes()
+    index = json.loads(sink.index_path.read_text(encoding="utf-8"))
+    assert index["path"] == sink.path.name
+    assert [entry["name"] for entry in index["entries"]] == [
+        "brief_client_notes.md",
+        "brief_internal_notes.md",
+        "brief_client_notes_2.md",
+    ]
+    first = index["entries"][0]
+    assert data[first["offset"] : first["offset"] + first["length"]].decode("utf-8") == "# A – client\n"
+    assert sorted(path.name for path in output_dir.iterdir()) == sorted([sink.path.name, sink.index_path.name])
+
+
+@pytest.mark.parametrize("kind", ["zip", "tar"])
+def test_archive_sinks_store_one_entry_per_brief(tmp_path: Path, kind: str) -> None:
+    sink = open_batch_sink(kind, tmp_path, ".json")
+    sink.write(Path("a.txt"), {Mode.CLIENT: '{"a": 1}\n'})
+    sink.write(Path("b.txt"), {Mode.CLIENT: '{"b": 2}\n'})
+    sink.close()
+
+    assert sink.path.suffix == f".{kind}"
+    if kind == "zip":
+        with zipfile.ZipFile(sink.path) as archive:
+            contents = {name: archive.read(name) for name in archive.namelist()}
+    else:
+        with tarfile.open(sink.path) as archive:
+            contents = {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+    assert contents == {"brief_client_a.json": b'{"a": 1}\n', "brief_client_b.json": b'{"b": 2}\n'}
+
+
+def test_sink_abort_and_empty_close_leave_nothing(tmp_path: Path) -> None:
+    sink = open_batch_sink("zip", tmp_path, ".md")
+    sink.write(Path("a.txt"), {Mode.CLIENT: "# A\n"})
+    sink.abort()
+    open_batch_sink("concat", tmp_path, ".md").close()
+
+    assert list(tmp_path.iterdir()) == []
+    assert open_batch_sink("files", tmp_path, ".md") is None
+
+
+def test_batch_sink_requires_an_entry_writer(tmp_path: Path) -> None:
+    with pytest.raises(TypeError):
+        BatchSink(tmp_path, ".md")
@@ -0,0 +1,23 @@
+"""agent-runtime package."""
+
+from .app import (
+    EXIT_FAILURE,
+    EXIT_INTERRUPTED,
+    EXIT_OK,
+    EXIT_USAGE,
+    AgentApp,
+    Command,
+    exit_code_for,
+)
+
+__all__ = [
+    "EXIT_FAILURE",
+    "EXIT_INTERRUPTED",
+    "EXIT_OK",
+    "EXIT_USAGE",
+    "AgentApp",
+    "Command",
+    "__version__",
+    "exit_code_for",
+]
+__version__ = "0.1.0"
@@ -0,0 +1,205 @@
+"""Fast CLI bootstrap: lazily imported subcommands, timing hooks and exit-code mapping."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib
+import sys
+import time
+from typing import Callable, Mapping, NoReturn, Sequence
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+_TIMINGS_FLAG = "--timings"
+_CPROFILE_FLAG = "--cprofile"
+
+
+@dataclass(slots=True, frozen=True)
+class Command:
+    """A subcommand whose module is imported only when the command runs.
+
+    ``target`` is ``"package.module:function"``; the function takes the remaining
+    arguments and returns an exit code (None counts as success).
+    """
+
+    name: str
+    target: str
+    help: str = ""
+
+    def load(self) -> Callable[[list[str]], int | None]:
+        """Import the command's module and return its entry function."""
+        module_name, _, attribute = self.target.partition(":")
+        return getattr(importlib.import_module(module_name), attribute or "main")
+
+
+@dataclass(slots=True)
+class _RuntimeOptions:
+    """Instrumentation flags shared by every agent."""
+
+    timings: bool = False
+    cprofile: str | None = None
+
+
+class AgentApp:
+    """Dispatches ``prog [--timings] [--cprofile FILE] [COMMAND] ARGS...`` to lazily loaded commands.
+
+    Only the selected command's module is imported, so a light command or ``--help``
+    never pays for another command's dependencies. Arguments that do not start with a
+    command name go to the ``default`` command. ``--timings`` prints import and run
+    wall/CPU time to stderr and ``--cprofile FILE`` saves cProfile stats for the run;
+    both are accepted anywhere before ``--``. Exceptions whose type (or a base class)
+    appears in ``error_codes`` print their message to stderr and return the mapped code.
+    """
+
+    def __init__(
+        self,
+        prog: str,
+        commands: Sequence[Command],
+        default: str | None = None,
+        error_codes: Mapping[type[BaseException], int] | None = None,
+    ) -> None:
+        self.prog = prog
+        self.commands = {command.name: command for command in commands}
+        if default is not None and default not in self.commands:
+            raise ValueError(f"Unknown default command: {default}")
+        self.default = default
+        self.error_codes = dict(error_codes or {})
+
+    def main(self, argv: Sequence[str] | None = None) -> int:
+        """Run the selected command and return its exit code."""
+        startup_cpu = time.process_time()
+        arguments = list(sys.argv[1:] if argv is None else argv)
+        try:
+            options, arguments = _split_runtime_options(arguments)
+        except ValueError as exc:
+            print(f"{self.prog}: error: {exc}", file=sys.stderr)
+            return EXIT_USAGE
+
+        if arguments[:1] and arguments[0] in self.commands:
+            command, arguments = self.commands[arguments[0]], arguments[1:]
+        elif self.default is not None:
+            command = self.commands[self.default]
+        elif arguments[:1] in (["-h"], ["--help"]):
+            print(self.format_help())
+            return EXIT_OK
+        else:
+            if arguments:
+                print(f"{self.prog}: error: unknown command {arguments[0]!r}", file=sys.stderr)
+            print(self.format_help(), file=sys.stderr)
+            return EXIT_USAGE
+
+        timings: dict[str, tuple[float, float]] = {}
+        profiler = None
+        if options.cprofile is not None:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+        try:
+            return self._invoke(command, arguments, timings)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                profiler.dump_stats(options.cprofile)
+            if options.timings:
+                print(_format_timings(command.name, startup_cpu, timings), file=sys.stderr)
+
+    def run(self, argv: Sequence[str] | None = None) -> NoReturn:
+        """Console script entrypoint."""
+        raise SystemExit(self.main(argv))
+
+    def format_help(self) -> str:
+        """Return the usage line and the command list."""
+        lines = [f"usage: {self.prog} [{_TIMINGS_FLAG}] [{_CPROFILE_FLAG} FILE] COMMAND [ARGS...]", "", "commands:"]
+        width = max((len(name) for name in self.commands), default=0)
+        for name, command in self.commands.items():
+            suffix = " (default)" if name == self.default else ""
+            lines.append(f"  {name.ljust(width)}  {command.help}{suffix}".rstrip())
+        return "\n".join(lines)
+
+    def _invoke(self, command: Command, arguments: list[str], timings: dict[str, tuple[float, float]]) -> int:
+        """Import and call a command, translating exits and mapped errors into exit codes."""
+        phase = "import"
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            handler = command.load()
+            timings["import"] = (time.perf_counter() - wall, time.process_time() - cpu)
+            phase = "run"
+            wall, cpu = time.perf_counter(), time.process_time()
+            code = handler(arguments)
+        except SystemExit as exc:
+            return _system_exit_code(exc)
+        except KeyboardInterrupt:
+            print("Interrupted.", file=sys.stderr)
+            return EXIT_INTERRUPTED
+        except Exception as exc:
+            code = exit_code_for(exc, self.error_codes)
+            if code is None:
+                raise
+            print(str(exc), file=sys.stderr)
+            return code
+        finally:
+            timings.setdefault(phase, (time.perf_counter() - wall, time.process_time() - cpu))
+        return EXIT_OK if code is None else int(code)
+
+
+def exit_code_for(exc: BaseException, error_codes: Mapping[type[BaseException], int]) -> int | None:
+    """Return the code mapped to the exception's most specific registered type, or None."""
+    for exc_type in type(exc).__mro__:
+        code = error_codes.get(exc_type)
+        if code is not None:
+            return code
+    return None
+
+
+def _split_runtime_options(arguments: list[str]) -> tuple[_RuntimeOptions, list[str]]:
+    """Remove the shared instrumentation flags from the arguments, stopping at ``--``."""
+    options = _RuntimeOptions()
+    remaining: list[str] = []
+    index = 0
+    while index < len(arguments):
+        argument = arguments[index]
+        index += 1
+        if argument == "--":
+            remaining.extend(arguments[index - 1 :])
+            break
+        if argument == _TIMINGS_FLAG:
+            options.timings = True
+        elif argument == _CPROFILE_FLAG:
+            if index >= len(arguments):
+                raise ValueError(f"{_CPROFILE_FLAG} needs a file path")
+            options.cprofile = arguments[index]
+            index += 1
+        elif argument.startswith(f"{_CPROFILE_FLAG}="):
+            options.cprofile = argument.partition("=")[2]
+            if not options.cprofile:
+                raise ValueError(f"{_CPROFILE_FLAG} needs a file path")
+        else:
+            remaining.append(argument)
+    return options, remaining
+
+
+def _system_exit_code(exc: SystemExit) -> int:
+    """Translate a SystemExit (for example from argparse) into an exit code."""
+    if exc.code is None:
+        return EXIT_OK
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return EXIT_FAILURE
+
+
+def _format_timings(name: str, startup_cpu: float, timings: dict[str, tuple[float, float]]) -> str:
+    """Format the per-phase timings line printed by ``--timings``."""
+    parts = [f"startup cpu {startup_cpu * 1000:.1f} ms"]
+    total = 0.0
+    for phase in ("import", "run"):
+        if phase in timings:
+            wall, cpu = timings[phase]
+            total += wall
+            parts.append(f"{phase} {wall * 1000:.1f} ms (cpu {cpu * 1000:.1f} ms)")
+    parts.append(f"total {total * 1000:.1f} ms")
+    return f"timings [{name}]: " + ", ".join(parts)
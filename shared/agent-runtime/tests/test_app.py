@@ -0,0 +1,95 @@
+from pathlib import Path
+import pstats
+import sys
+
+import pytest
+
+from agent_runtime import EXIT_INTERRUPTED, EXIT_USAGE, AgentApp, Command, exit_code_for
+
+
+class AgentError(Exception):
+    pass
+
+
+class InputError(AgentError):
+    pass
+
+
+def fail_input(argv: list[str]) -> int:
+    raise InputError("bad input")
+
+
+def interrupt(argv: list[str]) -> int:
+    raise KeyboardInterrupt
+
+
+@pytest.fixture()
+def commands(tmp_path: Path, monkeypatch) -> list[Command]:
+    (tmp_path / "rt_light.py").write_text(
+        "def main(argv):\n    print('light', *argv)\n    return 0\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "rt_heavy.py").write_text(
+        "import argparse\n"
+        "def main(argv):\n"
+        "    args = argparse.ArgumentParser(prog='heavy').parse_args(argv)\n"
+        "    return 0\n"
+        "def fail(argv):\n"
+        "    raise ValueError('boom')\n",
+        encoding="utf-8",
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    for name in ("rt_light", "rt_heavy"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    return [Command("light", "rt_light:main", "Light command"), Command("heavy", "rt_heavy", "Heavy command")]
+
+
+def test_app_imports_only_the_selected_command(commands: list[Command], capsys) -> None:
+    app = AgentApp("demo", commands, default="light")
+
+    assert app.main(["--timings", "a", "b"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out == "light a b\n"
+    assert "timings [light]: startup cpu" in captured.err
+    assert "import " in captured.err and "run " in captured.err
+    assert "rt_light" in sys.modules
+    assert "rt_heavy" not in sys.modules
+
+    assert app.main(["heavy", "--", "--timings"]) == EXIT_USAGE
+    assert "timings [" not in capsys.readouterr().err
+
+
+def test_app_without_default_lists_commands(commands: list[Command], capsys) -> None:
+    app = AgentApp("demo", commands)
+
+    assert app.main(["--help"]) == 0
+    assert "light  Light command" in capsys.readouterr().out
+    assert app.main(["nope"]) == EXIT_USAGE
+    assert "unknown command 'nope'" in capsys.readouterr().err
+    assert app.main(["--cprofile"]) == EXIT_USAGE
+
+
+def test_app_maps_errors_to_exit_codes(commands: list[Command], capsys) -> None:
+    extra = [
+        Command("input", f"{__name__}:fail_input"),
+        Command("interrupt", f"{__name__}:interrupt"),
+        Command("fail", "rt_heavy:fail"),
+    ]
+    app = AgentApp("demo", [*commands, *extra], error_codes={AgentError: 1, InputError: 3})
+
+    assert app.main(["input"]) == 3
+    assert capsys.readouterr().err.strip() == "bad input"
+    assert app.main(["interrupt"]) == EXIT_INTERRUPTED
+    with pytest.raises(ValueError, match="boom"):
+        app.main(["fail"])
+    assert exit_code_for(InputError(), {AgentError: 1}) == 1
+    assert exit_code_for(ValueError(), {AgentError: 1}) is None
+
+
+def test_app_cprofile_writes_stats(commands: list[Command], tmp_path: Path, capsys) -> None:
+    stats_path = tmp_path / "run.prof"
+    app = AgentApp("demo", commands, default="light")
+
+    assert app.main([f"--cprofile={stats_path}", "x"]) == 0
+    assert capsys.readouterr().out == "light x\n"
+    assert pstats.Stats(str(stats_path)).total_calls > 0
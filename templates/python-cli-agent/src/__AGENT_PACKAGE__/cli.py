@@ -1,34 +1,33 @@
-"""CLI for __AGENT_NAME__."""
+"""CLI for __AGENT_NAME__.
+
+Only the shared runtime and the error types load at startup; each command's module is
+imported when that command runs. Add commands to ``APP`` as ``module:function`` targets.
+"""
 
 from __future__ import annotations
 
-import argparse
 from typing import Sequence
 
+from agent_runtime import EXIT_FAILURE, AgentApp, Command
+
+from .errors import AgentError
 
-def build_parser() -> argparse.ArgumentParser:
-    """Build command-line parser."""
-    parser = argparse.ArgumentParser(prog="__AGENT_NAME__", description="Starter Python CLI agent")
-    parser.add_argument("--version", action="store_true", help="Show version")
-    return parser
+APP = AgentApp(
+    prog="__AGENT_NAME__",
+    commands=[Command("run", "__AGENT_PACKAGE__.commands:main", "Run the agent")],
+    default="run",
+    error_codes={AgentError: EXIT_FAILURE},
+)
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     """Run CLI and return exit code."""
-    args = build_parser().parse_args(argv)
-    if args.version:
-        from . import __version__
-
-        print(__version__)
-        return 0
-
-    print("__AGENT_NAME__ scaffold is ready.")
-    return 0
+    return APP.main(argv)
 
 
 def run() -> None:
     """Console script entrypoint."""
-    raise SystemExit(main())
+    APP.run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,5 @@
+"""Custom exceptions for user-facing CLI failures."""
+
+
+class AgentError(Exception):
+    """Base error type for the application; the CLI prints its message and exits with 1."""
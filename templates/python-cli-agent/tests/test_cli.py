@@ -15,3 +15,18 @@ def test_cli_version(capsys) -> None:
 
     assert exit_code == 0
     assert captured.out.strip() == "0.1.0"
+
+
+def test_cli_timings_and_error_exit_code(capsys, monkeypatch) -> None:
+    from __AGENT_PACKAGE__ import commands
+    from __AGENT_PACKAGE__.errors import AgentError
+
+    assert main(["--timings"]) == 0
+    assert "timings [run]:" in capsys.readouterr().err
+
+    def fail(argv) -> int:
+        raise AgentError("Something went wrong")
+
+    monkeypatch.setattr(commands, "main", fail)
+    assert main([]) == 1
+    assert "Something went wrong" in capsys.readouterr().err
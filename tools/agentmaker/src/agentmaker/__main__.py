@@ -0,0 +1,5 @@
+"""Allow ``python -m agentmaker``."""
+
+from .cli import run
+
+run()
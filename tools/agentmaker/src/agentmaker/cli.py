@@ -0,0 +1,70 @@
+"""CLI for agentmaker."""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+from typing import Sequence
+
+from .errors import AgentMakerError
+from .scaffold import DEFAULT_TEMPLATE, find_repo_root, load_template, scaffold_agents
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build command-line parser."""
+    parser = argparse.ArgumentParser(prog="agentmaker", description="Scaffold and manage AgentMaker agents")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    new = subcommands.add_parser("new", help="Create one or more agents from a template")
+    new.add_argument("names", nargs="+", metavar="NAME", help="Agent names (lowercase letters, digits, dashes)")
+    new.add_argument("--template", default=DEFAULT_TEMPLATE, help=f"Template folder name (default: {DEFAULT_TEMPLATE})")
+    new.add_argument(
+        "--repo-root",
+        type=Path,
+        default=None,
+        help="AgentMaker checkout holding templates/ (default: nearest parent of the current folder)",
+    )
+    new.add_argument(
+        "--agents-root",
+        type=Path,
+        default=Path("agents"),
+        help="Folder for new agents, relative to the repo root unless absolute (default: agents)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run CLI and return exit code."""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as exc:
+        return int(exc.code)
+
+    repo_root: Path | None = args.repo_root or find_repo_root(Path.cwd())
+    if repo_root is None:
+        print("No templates/ folder found above the current folder; pass --repo-root.", file=sys.stderr)
+        return 2
+
+    try:
+        template = load_template(repo_root / "templates" / args.template)
+        created = scaffold_agents(template, args.names, repo_root / args.agents_root)
+    except AgentMakerError as exc:
+        print(str(exc), file=sys.stderr)
+        return 1
+
+    for target in created:
+        print(f"Created agent scaffold at: {target}")
+    if len(created) == 1:
+        print(f"Next: cd {created[0]}")
+    return 0
+
+
+def run() -> None:
+    """Console script entrypoint."""
+    raise SystemExit(main())
+
+
+if __name__ == "__main__":
+    run()
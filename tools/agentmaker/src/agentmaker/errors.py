@@ -0,0 +1,9 @@
+"""Custom exceptions for user-facing CLI failures."""
+
+
+class AgentMakerError(Exception):
+    """Base error type for the application."""
+
+
+class ScaffoldError(AgentMakerError):
+    """Raised when a template cannot be found or an agent cannot be created."""
@@ -0,0 +1,159 @@
+"""Template loading and agent scaffolding."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import re
+import shutil
+import tempfile
+from typing import Sequence
+
+from .errors import ScaffoldError
+
+AGENT_NAME_TOKEN = "__AGENT_NAME__"
+AGENT_PACKAGE_TOKEN = "__AGENT_PACKAGE__"
+DEFAULT_TEMPLATE = "python-cli-agent"
+
+_AGENT_NAME_RE = re.compile(r"^[a-z0-9-]+$")
+_TOKEN_PREFIX = b"__AGENT_"
+_BINARY_SNIFF_SIZE = 8192
+_SKIPPED_DIRS = frozenset({"__pycache__", ".pytest_cache"})
+_SKIPPED_SUFFIXES = (".pyc", ".pyo")
+
+
+@dataclass(slots=True)
+class TemplateFile:
+    """One template file kept in memory so every agent renders from a single walk."""
+
+    parts: tuple[str, ...]
+    data: bytes
+    # Decoded content of text files with placeholders; None means ``data`` is copied as-is.
+    text: str | None
+    mode: int
+
+
+@dataclass(slots=True)
+class Template:
+    """A template tree loaded once: its files and its directories, including empty ones."""
+
+    root: Path
+    files: list[TemplateFile]
+    directories: list[tuple[str, ...]]
+
+
+def package_name(agent_name: str) -> str:
+    """Return the Python package name for an agent name."""
+    return agent_name.replace("-", "_")
+
+
+def validate_agent_name(agent_name: str) -> None:
+    """Reject names that are not lowercase letters, digits and dashes."""
+    if not _AGENT_NAME_RE.match(agent_name):
+        raise ScaffoldError(f"Invalid agent name {agent_name!r}: use lowercase letters, digits and dashes.")
+
+
+def find_repo_root(start: Path) -> Path | None:
+    """Return the nearest folder at or above ``start`` that holds a ``templates`` folder."""
+    for folder in (start, *start.parents):
+        if (folder / "templates").is_dir():
+            return folder
+    return None
+
+
+def load_template(root: Path) -> Template:
+    """Walk a template tree once, reading each file and sniffing whether it is text.
+
+    Files with NUL bytes near the start or that are not valid UTF-8 are treated as
+    binary and copied byte for byte. Text files are only decoded when they contain a
+    placeholder. Python caches are skipped.
+    """
+    if not root.is_dir():
+        raise ScaffoldError(f"Template not found: {root}")
+    files: list[TemplateFile] = []
+    directories: list[tuple[str, ...]] = []
+    try:
+        for folder, dir_names, file_names in os.walk(root):
+            dir_names[:] = sorted(name for name in dir_names if name not in _SKIPPED_DIRS)
+            relative = Path(folder).relative_to(root).parts
+            if relative:
+                directories.append(relative)
+            for file_name in sorted(file_names):
+                if file_name.endswith(_SKIPPED_SUFFIXES):
+                    continue
+                path = Path(folder, file_name)
+                data = path.read_bytes()
+                files.append(TemplateFile((*relative, file_name), data, _placeholder_text(data), path.stat().st_mode))
+    except OSError as exc:
+        raise ScaffoldError(f"Failed to read template: {root}") from exc
+    return Template(root, files, directories)
+
+
+def scaffold_agents(template: Template, agent_names: Sequence[str], agents_root: Path) -> list[Path]:
+    """Create one agent per name from an already loaded template and return their folders.
+
+    Every name is validated before anything is written, so a bad name or an existing
+    agent aborts the whole run instead of leaving it half done.
+    """
+    for agent_name in agent_names:
+        validate_agent_name(agent_name)
+        if (agents_root / agent_name).exists():
+            raise ScaffoldError(f"Agent already exists: {agents_root / agent_name}")
+    duplicates = sorted({name for name in agent_names if agent_names.count(name) > 1})
+    if duplicates:
+        raise ScaffoldError(f"Agent names repeat: {', '.join(duplicates)}")
+    return [scaffold_agent(template, agent_name, agents_root) for agent_name in agent_names]
+
+
+def scaffold_agent(template: Template, agent_name: str, agents_root: Path) -> Path:
+    """Render the template into ``agents_root / agent_name`` in one pass and return the folder.
+
+    Contents and path names are substituted as each file is written. The agent is built
+    in a hidden sibling folder and renamed into place, so a failure never leaves a
+    partial agent behind.
+    """
+    validate_agent_name(agent_name)
+    target = agents_root / agent_name
+    if target.exists():
+        raise ScaffoldError(f"Agent already exists: {target}")
+    replacements = ((AGENT_NAME_TOKEN, agent_name), (AGENT_PACKAGE_TOKEN, package_name(agent_name)))
+    try:
+        agents_root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{agent_name}-", dir=agents_root))
+    except OSError as exc:
+        raise ScaffoldError(f"Failed to create agent folder in: {agents_root}") from exc
+    try:
+        # mkdtemp creates an owner-only folder; the agent gets the template's permissions.
+        os.chmod(staging, template.root.stat().st_mode)
+        for parts in template.directories:
+            staging.joinpath(*(_substitute(part, replacements) for part in parts)).mkdir(exist_ok=True)
+        for template_file in template.files:
+            path = staging.joinpath(*(_substitute(part, replacements) for part in template_file.parts))
+            if template_file.text is None:
+                path.write_bytes(template_file.data)
+            else:
+                path.write_bytes(_substitute(template_file.text, replacements).encode("utf-8"))
+            os.chmod(path, template_file.mode)
+        os.rename(staging, target)
+    except OSError as exc:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise ScaffoldError(f"Failed to create agent: {target}") from exc
+    return target
+
+
+def _placeholder_text(data: bytes) -> str | None:
+    """Return decoded text for files that contain a placeholder, else None to copy bytes as-is."""
+    if _TOKEN_PREFIX not in data or b"\0" in data[:_BINARY_SNIFF_SIZE]:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _substitute(text: str, replacements: tuple[tuple[str, str], ...]) -> str:
+    """Replace every placeholder token in text."""
+    for token, value in replacements:
+        text = text.replace(token, value)
+    return text
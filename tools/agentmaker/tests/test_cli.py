@@ -0,0 +1,60 @@
+import os
+from pathlib import Path
+import shutil
+import subprocess
+
+import pytest
+
+from agentmaker.cli import main
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+def test_cli_new_creates_agents_under_repo_root(tmp_path: Path, capsys) -> None:
+    agents_root = tmp_path / "agents"
+
+    exit_code = main(["new", "one", "two", "--repo-root", str(REPO_ROOT), "--agents-root", str(agents_root)])
+    captured = capsys.readouterr()
+
+    assert exit_code == 0
+    assert f"Created agent scaffold at: {agents_root / 'one'}" in captured.out
+    assert (agents_root / "two" / "src" / "two" / "cli.py").is_file()
+
+    assert main(["new", "one", "--repo-root", str(REPO_ROOT), "--agents-root", str(agents_root)]) == 1
+    assert "Agent already exists" in capsys.readouterr().err
+    assert main(["new", "x", "--template", "nope", "--repo-root", str(REPO_ROOT)]) == 1
+    assert main(["new"]) == 2
+
+
+@pytest.mark.skipif(shutil.which("pwsh") is None, reason="PowerShell 7 (pwsh) is not installed")
+def test_cli_new_matches_powershell_script_output(tmp_path: Path) -> None:
+    ps_root = tmp_path / "ps"
+    py_root = tmp_path / "py"
+    ps_root.mkdir()
+    # new-agent.ps1 joins -AgentsRoot onto the repo root, so pass it as a relative path.
+    subprocess.run(
+        [
+            "pwsh",
+            "-NoProfile",
+            "-File",
+            str(REPO_ROOT / "scripts" / "new-agent.ps1"),
+            "-Name",
+            "demo-agent",
+            "-AgentsRoot",
+            os.path.relpath(ps_root, REPO_ROOT),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    assert main(["new", "demo-agent", "--repo-root", str(REPO_ROOT), "--agents-root", str(py_root)]) == 0
+
+    ps_tree = _tree(ps_root / "demo-agent")
+    py_tree = _tree(py_root / "demo-agent")
+    assert ps_tree.keys() == py_tree.keys()
+    for relative, data in py_tree.items():
+        # Set-Content rewrites substituted files with platform newlines plus one extra trailing newline.
+        assert ps_tree[relative].replace(b"\r\n", b"\n").rstrip(b"\n") == data.replace(b"\r\n", b"\n").rstrip(b"\n")
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+
+from agentmaker.errors import ScaffoldError
+from agentmaker.scaffold import find_repo_root, load_template, package_name, scaffold_agents
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+PYTHON_TEMPLATE = REPO_ROOT / "templates" / "python-cli-agent"
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {path.relative_to(root).as_posix(): path.read_bytes() for path in root.rglob("*") if path.is_file()}
+
+
+def _write_template(root: Path) -> Path:
+    (root / "src" / "__AGENT_PACKAGE__").mkdir(parents=True)
+    (root / "src" / "__AGENT_PACKAGE__" / "__init__.py").write_text('"""__AGENT_NAME__."""\n', encoding="utf-8")
+    (root / "src" / "__AGENT_PACKAGE__" / "__pycache__").mkdir()
+    (root / "src" / "__AGENT_PACKAGE__" / "__pycache__" / "cli.cpython-311.pyc").write_bytes(b"\0cache")
+    (root / "assets").mkdir()
+    (root / "assets" / "logo-__AGENT_NAME__.png").write_bytes(b"\x89PNG\0__AGENT_NAME__\xff")
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("# __AGENT_NAME__ – café\n", encoding="utf-8")
+    return root
+
+
+def test_scaffold_substitutes_contents_and_paths_for_many_agents(tmp_path: Path) -> None:
+    template = load_template(_write_template(tmp_path / "template"))
+    agents_root = tmp_path / "agents"
+
+    created = scaffold_agents(template, ["alpha-bot", "beta"], agents_root)
+
+    assert created == [agents_root / "alpha-bot", agents_root / "beta"]
+    assert _tree(agents_root / "alpha-bot") == {
+        "README.md": "# alpha-bot – café\n".encode("utf-8"),
+        "assets/logo-alpha-bot.png": b"\x89PNG\0__AGENT_NAME__\xff",
+        "src/alpha_bot/__init__.py": b'"""alpha-bot."""\n',
+    }
+    assert (agents_root / "beta" / "docs").is_dir()
+    assert (agents_root / "beta" / "src" / "beta" / "__init__.py").is_file()
+    assert sorted(path.name for path in agents_root.iterdir()) == ["alpha-bot", "beta"]
+
+
+def test_scaffold_validates_every_name_before_writing(tmp_path: Path) -> None:
+    template = load_template(_write_template(tmp_path / "template"))
+    agents_root = tmp_path / "agents"
+    (agents_root / "taken").mkdir(parents=True)
+
+    for names in (["good", "Bad_Name"], ["good", "taken"], ["good", "good"]):
+        with pytest.raises(ScaffoldError):
+            scaffold_agents(template, names, agents_root)
+    assert sorted(path.name for path in agents_root.iterdir()) == ["taken"]
+
+    with pytest.raises(ScaffoldError, match="Template not found"):
+        load_template(tmp_path / "missing")
+
+
+def test_python_cli_template_renders_like_the_powershell_script(tmp_path: Path) -> None:
+    # Mirrors new-agent.ps1: copy the tree, then replace both tokens in contents and names.
+    expected = {}
+    for relative, data in _tree(PYTHON_TEMPLATE).items():
+        if "__pycache__" in relative or relative.endswith(".pyc"):
+            continue
+        key = relative.replace("__AGENT_NAME__", "demo-agent").replace("__AGENT_PACKAGE__", "demo_agent")
+        expected[key] = data.replace(b"__AGENT_NAME__", b"demo-agent").replace(b"__AGENT_PACKAGE__", b"demo_agent")
+
+    (target,) = scaffold_agents(load_template(PYTHON_TEMPLATE), ["demo-agent"], tmp_path)
+
+    assert _tree(target) == expected
+    assert b"__AGENT_" not in b"".join(expected.values())
+    assert package_name("demo-agent") == "demo_agent"
+    assert find_repo_root(PYTHON_TEMPLATE) == REPO_ROOT